@@ -0,0 +1,28 @@
+#!/bin/python
+
+#
+#       ███╗   ██╗██╗██╗  ██╗ █████╗ ██████╗ ███████╗
+#       ████╗  ██║██║██║  ██║██╔══██╗██╔══██╗██╔════╝
+#       ██╔██╗ ██║██║███████║███████║██████╔╝███████╗
+#       ██║╚██╗██║██║██╔══██║██╔══██║██╔══██╗╚════██║
+#       ██║ ╚████║██║██║  ██║██║  ██║██║  ██║███████║
+#       ╚═╝  ╚═══╝╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
+#       DRAFTED BY [https://nih.ar] ON 18-10-2026
+#       SOURCE [__init__.py] LAST MODIFIED ON 18-10-2026.
+#
+
+"""
+Benchmark suite for the rynz static site generator.
+
+- corpus: generates synthetic projects of any size.
+- build: measures a single build of a project in a fresh process.
+- run: builds every corpus, records the results and compares them with
+  a stored baseline.
+- startup: checks the import time of quick commands such as
+  `rynz --version` against a budget.
+- backends: compares the output and speed of the Markdown backends.
+- search: measures indexing and query times of the `rynz serve` search
+  index.
+
+Run from the repository root with `python -m benchmarks.run`.
+"""
@@ -0,0 +1,268 @@
+#!/bin/python
+
+#
+#       ███╗   ██╗██╗██╗  ██╗ █████╗ ██████╗ ███████╗
+#       ████╗  ██║██║██║  ██║██╔══██╗██╔══██╗██╔════╝
+#       ██╔██╗ ██║██║███████║███████║██████╔╝███████╗
+#       ██║╚██╗██║██║██╔══██║██╔══██║██╔══██╗╚════██║
+#       ██║ ╚████║██║██║  ██║██║  ██║██║  ██║███████║
+#       ╚═╝  ╚═══╝╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
+#       DRAFTED BY [https://nih.ar] ON 18-10-2026
+#       SOURCE [backends.py] LAST MODIFIED ON 18-10-2026.
+#
+
+"""
+Conformance and speed harness for the Markdown backends.
+
+Every backend renders the same note bodies: a set of feature samples plus
+the notes of a project, or notes generated with benchmarks.corpus. The
+render cache is bypassed. Throughput is reported per backend, and each
+output is compared with the reference backend (markdown2 by default)
+after whitespace between tags is normalised.
+"""
+
+from os import path
+from difflib import unified_diff
+from time import perf_counter
+from argparse import ArgumentParser
+import random
+import re
+import sys
+from yaml import safe_load
+from rich.console import Console
+from rich.table import Table
+from rynz import builder, renderers
+from rynz.frontmatter import split_frontmatter
+from .corpus import corpus_settings, pick_tags, note_text
+
+# Initialize console for colorful output
+console = Console()
+
+# Markdown features every backend should agree on
+SAMPLES = [
+    "# Heading 1\n\n## Heading 2\n\nSetext heading\n--------------\n",
+    "Some *emphasis*, **strong**, ***both*** and `code`.\n",
+    "A [link](https://example.com \"title\") and an ![image](/img.png).\n",
+    "- one\n- two\n  - nested\n- three\n\n1. first\n2. second\n",
+    "> A quote\n> over two lines\n\n> > nested\n",
+    "    indented code\n    block\n\nParagraph after.\n",
+    "```\nfenced code\n```\n",
+    "Line one  \nline two with a hard break.\n",
+    "Escapes: \\*not emphasis\\*, 2 < 3 & 4 > 1.\n",
+    "<div class=\"raw\">Raw <b>HTML</b> block</div>\n\nInline <span>html</span>.\n",
+    "| a | b |\n|---|---|\n| 1 | 2 |\n",
+    "~~strike~~ and an autolink <https://example.com>.\n",
+    "***\n\nText between rules\n\n---\n",
+]
+
+
+def print_message(message, style="info"):
+    """
+    Prints a styled message using the Rich console.
+
+    Args:
+        message (str): The message to display.
+        style (str): Message style ("success", "error", or "info").
+    """
+    styles = {
+        "success": "bold green",
+        "error": "bold red",
+        "info": "yellow"
+    }
+    console.print(message, style=styles.get(style, "yellow"))
+
+
+def project_bodies(project):
+    """
+    Reads the note bodies of a rynz project.
+
+    Args:
+        project (str): Project directory.
+
+    Returns:
+        list: Markdown bodies without frontmatter.
+    """
+    with open(path.join(project, 'config.yml'), encoding='utf-8') as config_file:
+        config = safe_load(config_file)
+    config['content_path'] = path.join(project, config['content_path'])
+    return [
+        split_frontmatter(builder.readmd(note_path))[1]
+        for note_path in builder.discover_notes(config)
+    ]
+
+
+def generated_bodies(count, seed=1):
+    """
+    Generates note bodies like benchmarks.corpus does.
+
+    Args:
+        count (int): Number of notes.
+        seed (int): Random seed.
+
+    Returns:
+        list: Markdown bodies without frontmatter.
+    """
+    settings = corpus_settings(count, seed=seed)
+    rng = random.Random(seed)
+    vocabulary = [f"tag{index}" for index in range(settings['tags'])]
+    weights = [1.0] * settings['tags']
+    return [
+        split_frontmatter(note_text(
+            rng, number, settings,
+            pick_tags(rng, vocabulary, weights, settings['tags_per_note'])
+        ))[1]
+        for number in range(count)
+    ]
+
+
+def normalise(html):
+    """
+    Removes formatting differences that browsers ignore.
+
+    Args:
+        html (str): Rendered HTML.
+
+    Returns:
+        str: HTML with whitespace between tags dropped and runs of
+        whitespace collapsed.
+    """
+    return re.sub(r"\s+", " ", re.sub(r">\s+<", "><", html)).strip()
+
+
+def run_backend(backend, bodies, extras, repeat=3):
+    """
+    Renders every body with one backend.
+
+    Args:
+        backend (str): Backend name, see renderers.get_renderer().
+        bodies (list): Markdown bodies.
+        extras (list): markdown2 extras to enable.
+        repeat (int): Passes over the bodies; the fastest one is kept.
+
+    Returns:
+        dict: 'version', 'seconds' of the fastest pass and the 'outputs',
+        or 'error' when the backend is unavailable.
+    """
+    try:
+        render, version = renderers.get_renderer(backend, tuple(sorted(extras)))
+    except ValueError as e:
+        return {'error': str(e)}
+    best = None
+    for _ in range(repeat):
+        start = perf_counter()
+        outputs = [render(body) for body in bodies]
+        seconds = perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return {'version': version, 'seconds': best, 'outputs': outputs}
+
+
+def print_diff(backend, reference, body, expected, actual):
+    """
+    Prints how a backend's output differs from the reference for one body.
+
+    Args:
+        backend (str): Backend name.
+        reference (str): Reference backend name.
+        body (str): Markdown source.
+        expected (str): Reference output.
+        actual (str): Backend output.
+    """
+    console.rule(f"[bold]{backend} vs {reference}")
+    console.print(body.strip(), markup=False, highlight=False)
+    diff = unified_diff(
+        normalise(expected).replace("><", ">\n<").splitlines(),
+        normalise(actual).replace("><", ">\n<").splitlines(),
+        reference, backend, lineterm=""
+    )
+    console.print("\n".join(diff), markup=False, highlight=False)
+
+
+def main():
+    """
+    Parses the command line and compares the backends.
+    """
+    parser = ArgumentParser(
+        prog="python -m benchmarks.backends",
+        description="Compare the output and speed of the Markdown backends."
+    )
+    parser.add_argument(
+        "backends", nargs="*", default=list(renderers.BACKENDS),
+        help="Backends to compare, built-in names or module:function (default: all built-in)"
+    )
+    parser.add_argument(
+        "-p", "--project", help="Render the notes of this rynz project"
+    )
+    parser.add_argument(
+        "-n", "--notes", type=int, default=500,
+        help="Generated notes when no project is given (default: 500)"
+    )
+    parser.add_argument(
+        "-e", "--extras", nargs="*", default=[],
+        help="markdown2 extras to enable, e.g. fenced-code-blocks tables"
+    )
+    parser.add_argument(
+        "--reference", default=renderers.DEFAULT_BACKEND,
+        help="Backend whose output the others are compared with"
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=3,
+        help="Passes per backend, keeping the fastest (default: 3)"
+    )
+    parser.add_argument(
+        "-d", "--diff", type=int, default=0,
+        help="Show this many differing bodies per backend"
+    )
+    args = parser.parse_args()
+
+    bodies = SAMPLES + (
+        project_bodies(args.project) if args.project else generated_bodies(args.notes)
+    )
+    size_mb = sum(len(body.encode('utf-8')) for body in bodies) / 1024 / 1024
+    backends = [args.reference] + [name for name in args.backends if name != args.reference]
+    results = {name: run_backend(name, bodies, args.extras, args.repeat) for name in backends}
+    reference = results[args.reference]
+    if 'error' in reference:
+        print_message(f"❌ {reference['error']}", "error")
+        sys.exit(1)
+
+    table = Table(
+        title=f"Markdown backends ({len(bodies)} bodies, {size_mb:.2f} MB)",
+        header_style="bold magenta"
+    )
+    table.add_column("Backend")
+    table.add_column("Version")
+    table.add_column("Notes/s", justify="right")
+    table.add_column("MB/s", justify="right")
+    table.add_column(f"vs {args.reference}", justify="right")
+    table.add_column("Same output", justify="right")
+    differing = {}
+    for name, result in results.items():
+        if 'error' in result:
+            table.add_row(name, "-", "-", "-", "-", "-", style="dim")
+            continue
+        seconds = result['seconds'] or 1e-9
+        same = [
+            normalise(expected) == normalise(actual)
+            for expected, actual in zip(reference['outputs'], result['outputs'])
+        ]
+        differing[name] = [index for index, equal in enumerate(same) if not equal]
+        table.add_row(
+            name, result['version'], f"{len(bodies) / seconds:.0f}", f"{size_mb / seconds:.2f}",
+            f"{reference['seconds'] / seconds:.2f}x",
+            f"{sum(same)}/{len(same)} ({sum(same) / len(same):.0%})"
+        )
+    console.print(table)
+
+    for name, result in results.items():
+        if 'error' in result:
+            print_message(f"⚠️ {result['error']}", "info")
+    for name, indexes in differing.items():
+        for index in indexes[:args.diff]:
+            print_diff(
+                name, args.reference, bodies[index],
+                reference['outputs'][index], results[name]['outputs'][index]
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/bin/python
+
+#
+#       ███╗   ██╗██╗██╗  ██╗ █████╗ ██████╗ ███████╗
+#       ████╗  ██║██║██║  ██║██╔══██╗██╔══██╗██╔════╝
+#       ██╔██╗ ██║██║███████║███████║██████╔╝███████╗
+#       ██║╚██╗██║██║██╔══██║██╔══██║██╔══██╗╚════██║
+#       ██║ ╚████║██║██║  ██║██║  ██║██║  ██║███████║
+#       ╚═╝  ╚═══╝╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
+#       DRAFTED BY [https://nih.ar] ON 18-10-2026
+#       SOURCE [build.py] LAST MODIFIED ON 18-10-2026.
+#
+
+"""
+Measures one build of a benchmark corpus.
+
+Each measurement runs in its own process (see measure()), so peak RSS
+covers that build alone. The child prints its result as one JSON line.
+"""
+
+from os import chdir, path, remove, utime
+from shutil import rmtree
+from json import dumps, loads, load
+from time import perf_counter
+from argparse import ArgumentParser
+import subprocess
+import sys
+from yaml import safe_load
+from rynz import builder, profiler
+
+# Build scenarios, in the order they are run
+SCENARIOS = {
+    'cold': "Full build with empty output and caches",
+    'warm': "Full build (--force) with warm Markdown and template caches",
+    'noop': "Incremental build with nothing changed",
+    'edit': "Incremental build after editing one note",
+}
+
+
+def peak_rss_mb():
+    """
+    Returns the peak resident set size of this process and its finished
+    children (the note workers) in MB.
+
+    Returns:
+        float: Peak RSS, or None where the resource module is unavailable.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    ) / scale
+
+
+def prepare(scenario, config):
+    """
+    Puts the project in the state a scenario starts from.
+
+    Args:
+        scenario (str): Key of SCENARIOS.
+        config (dict): Loaded site configuration.
+
+    Returns:
+        bool: Whether the build must ignore the manifest.
+    """
+    if scenario == 'cold':
+        rmtree(config['home_path'], ignore_errors=True)
+        rmtree(builder.CACHE_DIR, ignore_errors=True)
+        if path.exists(builder.MANIFEST_FILE):
+            remove(builder.MANIFEST_FILE)
+        return True
+    if scenario == 'edit':
+        note = path.join(config['content_path'], "note", "note0.md")
+        with open(note, 'a', encoding='utf-8') as note_file:
+            note_file.write("\nEdited for the benchmark.\n")
+        utime(note)
+    return scenario == 'warm'
+
+
+def run_build(project, scenario, jobs=None):
+    """
+    Builds a project once and measures it. Runs inside the child process.
+
+    Args:
+        project (str): Project directory.
+        scenario (str): Key of SCENARIOS.
+        jobs (int): Build processes.
+
+    Returns:
+        dict: 'wall' seconds, 'peak_rss_mb', build 'phases' and summed
+        'note_phases' from the build profile.
+    """
+    chdir(project)
+    with open('config.yml', encoding='utf-8') as config_file:
+        config = safe_load(config_file)
+    force = prepare(scenario, config)
+
+    builder.console.quiet = True
+    profiler.console.quiet = True
+    start = perf_counter()
+    state = builder.buildRynz(force=force, jobs=jobs, profile=True)
+    wall = perf_counter() - start
+    if state is None:
+        raise RuntimeError(f"Build of {project} failed")
+
+    with open(profiler.PROFILE_FILE, encoding='utf-8') as report_file:
+        report = load(report_file)
+    return {
+        'wall': wall,
+        'peak_rss_mb': peak_rss_mb(),
+        'phases': report['phases'],
+        'note_phases': report['note_phases'],
+    }
+
+
+def measure(project, scenario, jobs=None):
+    """
+    Runs run_build() in a fresh Python process.
+
+    Args:
+        project (str): Project directory.
+        scenario (str): Key of SCENARIOS.
+        jobs (int): Build processes.
+
+    Returns:
+        dict: Result of run_build().
+    """
+    command = [sys.executable, "-m", "benchmarks.build", project, scenario]
+    if jobs:
+        command += ["--jobs", str(jobs)]
+    root = path.dirname(path.dirname(path.abspath(__file__)))
+    output = subprocess.run(
+        command, cwd=root, check=True, capture_output=True, text=True
+    ).stdout
+    return loads(output.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Measure one build of a rynz project.")
+    parser.add_argument("project", help="Project directory")
+    parser.add_argument("scenario", choices=SCENARIOS, help="Build scenario")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Build processes")
+    args = parser.parse_args()
+    print(dumps(run_build(path.abspath(args.project), args.scenario, args.jobs)))
@@ -0,0 +1,196 @@
+#!/bin/python
+
+#
+#       ███╗   ██╗██╗██╗  ██╗ █████╗ ██████╗ ███████╗
+#       ████╗  ██║██║██║  ██║██╔══██╗██╔══██╗██╔════╝
+#       ██╔██╗ ██║██║███████║███████║██████╔╝███████╗
+#       ██║╚██╗██║██║██╔══██║██╔══██║██╔══██╗╚════██║
+#       ██║ ╚████║██║██║  ██║██║  ██║██║  ██║███████║
+#       ╚═╝  ╚═══╝╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
+#       DRAFTED BY [https://nih.ar] ON 18-10-2026
+#       SOURCE [corpus.py] LAST MODIFIED ON 18-10-2026.
+#
+
+"""
+Synthetic corpus generator for the rynz benchmarks.
+
+A corpus is a regular rynz project created with creator.createRynz() and
+filled with generated notes. Body size, number of code blocks and the tag
+distribution are configurable, and the same seed always gives the same
+corpus.
+"""
+
+from os import path, makedirs
+from datetime import date, timedelta
+from shutil import rmtree
+from json import dump, load
+from argparse import ArgumentParser
+import random
+from rynz import creator
+
+# Corpus sizes run by default
+SIZES = (100, 10_000, 100_000)
+
+# Words for generated paragraphs
+WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua enim ad minim veniam "
+    "quis nostrud exercitation ullamco laboris nisi aliquip ex ea commodo "
+    "consequat duis aute irure in reprehenderit voluptate velit esse cillum"
+).split()
+
+# Marker describing the corpus, so unchanged corpora are reused
+CORPUS_FILE = ".rynz-corpus.json"
+
+
+def corpus_settings(notes, paragraphs=4, words=60, code_blocks=1, tags=50,
+                    tags_per_note=3, tag_skew=1.0, seed=1):
+    """
+    Collects the parameters of a corpus.
+
+    Args:
+        notes (int): Number of notes.
+        paragraphs (int): Paragraphs per note body.
+        words (int): Words per paragraph.
+        code_blocks (int): Fenced code blocks per note.
+        tags (int): Size of the tag vocabulary.
+        tags_per_note (int): Tags on every note.
+        tag_skew (float): Zipf exponent of tag popularity, 0 for uniform.
+        seed (int): Random seed.
+
+    Returns:
+        dict: Corpus settings.
+    """
+    return {
+        'notes': notes, 'paragraphs': paragraphs, 'words': words,
+        'code_blocks': code_blocks, 'tags': tags,
+        'tags_per_note': min(tags_per_note, tags), 'tag_skew': tag_skew, 'seed': seed,
+    }
+
+
+def pick_tags(rng, vocabulary, weights, count):
+    """
+    Draws distinct tags following the tag popularity weights.
+
+    Args:
+        rng (Random): Random generator.
+        vocabulary (list): Tag names.
+        weights (list): Weight of each tag.
+        count (int): Number of tags to draw.
+
+    Returns:
+        list: Distinct tags.
+    """
+    chosen = []
+    while len(chosen) < count:
+        tag = rng.choices(vocabulary, weights)[0]
+        if tag not in chosen:
+            chosen.append(tag)
+    return chosen
+
+
+def note_text(rng, number, settings, tags):
+    """
+    Generates the source of one note.
+
+    Args:
+        rng (Random): Random generator.
+        number (int): Note number.
+        settings (dict): Corpus settings.
+        tags (list): Tags of the note.
+
+    Returns:
+        str: Markdown note with frontmatter.
+    """
+    day = date(2015, 1, 1) + timedelta(days=rng.randrange(4000))
+    parts = [
+        "---",
+        f'title: "Benchmark note {number}"',
+        f'subtitle: "Synthetic note {number} for rynz benchmarks"',
+        f"date: {day.isoformat()}",
+        f"tags: [{', '.join(tags)}]",
+        "---",
+        "",
+        f"# Benchmark note {number}",
+        "",
+    ]
+    for index in range(settings['paragraphs']):
+        words = rng.choices(WORDS, k=settings['words'])
+        words[rng.randrange(len(words))] = f"*{rng.choice(WORDS)}*"
+        parts.append(" ".join(words).capitalize() + ".")
+        parts.append("")
+        if index < settings['code_blocks']:
+            parts.extend([
+                "```",
+                f"def note_{number}_{index}(value):",
+                f"    return value * {rng.randrange(1000)}",
+                "```",
+                "",
+            ])
+    parts.append(f"[Next note](/note{number + 1}.html)")
+    return "\n".join(parts) + "\n"
+
+
+def generate_corpus(dest, settings, rebuild=False):
+    """
+    Creates a rynz project filled with synthetic notes. A corpus already
+    generated at dest with the same settings is reused.
+
+    Args:
+        dest (str): Project directory.
+        settings (dict): Result of corpus_settings().
+        rebuild (bool): Regenerate even if an identical corpus exists.
+
+    Returns:
+        str: Project directory.
+    """
+    marker = path.join(dest, CORPUS_FILE)
+    if not rebuild and path.exists(marker):
+        with open(marker, encoding='utf-8') as marker_file:
+            if load(marker_file) == settings:
+                return dest
+
+    rmtree(dest, ignore_errors=True)
+    makedirs(path.dirname(path.abspath(dest)), exist_ok=True)
+    creator.console.quiet = True
+    try:
+        creator.createRynz(dest)
+        # The sample note from createNote() is part of every corpus
+        creator.createNote("sample", dest)
+    finally:
+        creator.console.quiet = False
+
+    rng = random.Random(settings['seed'])
+    vocabulary = [f"tag{index}" for index in range(settings['tags'])]
+    weights = [1 / (rank + 1) ** settings['tag_skew'] for rank in range(settings['tags'])]
+    note_dir = path.join(dest, 'content', 'note')
+    for number in range(settings['notes'] - 1):
+        tags = pick_tags(rng, vocabulary, weights, settings['tags_per_note'])
+        with open(path.join(note_dir, f"note{number}.md"), 'w', encoding='utf-8') as note_file:
+            note_file.write(note_text(rng, number, settings, tags))
+
+    with open(marker, 'w', encoding='utf-8') as marker_file:
+        dump(settings, marker_file)
+    return dest
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Generate a synthetic rynz project.")
+    parser.add_argument("dest", help="Project directory to create")
+    parser.add_argument("-n", "--notes", type=int, default=100, help="Number of notes")
+    parser.add_argument("--paragraphs", type=int, default=4, help="Paragraphs per note")
+    parser.add_argument("--words", type=int, default=60, help="Words per paragraph")
+    parser.add_argument("--code-blocks", type=int, default=1, help="Code blocks per note")
+    parser.add_argument("--tags", type=int, default=50, help="Size of the tag vocabulary")
+    parser.add_argument("--tags-per-note", type=int, default=3, help="Tags on every note")
+    parser.add_argument(
+        "--tag-skew", type=float, default=1.0,
+        help="Zipf exponent of tag popularity, 0 for uniform"
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    args = parser.parse_args()
+
+    generate_corpus(args.dest, corpus_settings(
+        args.notes, args.paragraphs, args.words, args.code_blocks, args.tags,
+        args.tags_per_note, args.tag_skew, args.seed
+    ), rebuild=True)
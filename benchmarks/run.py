@@ -0,0 +1,259 @@
+#!/bin/python
+
+#
+#       ███╗   ██╗██╗██╗  ██╗ █████╗ ██████╗ ███████╗
+#       ████╗  ██║██║██║  ██║██╔══██╗██╔══██╗██╔════╝
+#       ██╔██╗ ██║██║███████║███████║██████╔╝███████╗
+#       ██║╚██╗██║██║██╔══██║██╔══██║██╔══██╗╚════██║
+#       ██║ ╚████║██║██║  ██║██║  ██║██║  ██║███████║
+#       ╚═╝  ╚═══╝╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
+#       DRAFTED BY [https://nih.ar] ON 18-10-2026
+#       SOURCE [run.py] LAST MODIFIED ON 18-10-2026.
+#
+
+"""
+Runs the rynz benchmark suite.
+
+Every corpus size is generated once (and reused while its settings do not
+change), then built in each scenario of benchmarks.build. Wall time, peak
+RSS and per-phase timings are written to a results file. Against a stored
+baseline, any wall time or peak RSS above the allowed slowdown is a
+regression and the run exits with status 1.
+"""
+
+from os import path, makedirs
+from json import dump, load
+from datetime import datetime
+from tempfile import gettempdir
+from argparse import ArgumentParser
+import platform
+import sys
+from rich.console import Console
+from rich.table import Table
+from rynz import __version__
+from .corpus import SIZES, corpus_settings, generate_corpus
+from .build import SCENARIOS, measure
+
+# Initialize console for colorful output
+console = Console()
+
+BENCH_DIR = path.dirname(path.abspath(__file__))
+RESULTS_FILE = path.join(BENCH_DIR, "results.json")
+BASELINE_FILE = path.join(BENCH_DIR, "baseline.json")
+
+# Measurements compared against the baseline, with the smallest absolute
+# increase (seconds, MB) that can count as a regression rather than noise
+METRICS = {'wall': 0.05, 'peak_rss_mb': 5.0}
+
+
+def print_message(message, style="info"):
+    """
+    Prints a styled message using the Rich console.
+
+    Args:
+        message (str): The message to display.
+        style (str): Message style ("success", "error", or "info").
+    """
+    styles = {
+        "success": "bold green",
+        "error": "bold red",
+        "info": "yellow"
+    }
+    console.print(message, style=styles.get(style, "yellow"))
+
+
+def run_suite(sizes, scenarios, workdir, settings, jobs=None, repeat=1):
+    """
+    Builds every corpus in every scenario.
+
+    Args:
+        sizes (list): Number of notes of each corpus.
+        scenarios (list): Keys of build.SCENARIOS.
+        workdir (str): Directory holding the generated corpora.
+        settings (dict): Corpus settings other than the note count.
+        jobs (int): Build processes.
+        repeat (int): Runs per scenario; the fastest one is kept.
+
+    Returns:
+        dict: Results with the environment and one entry per
+        "<size>/<scenario>".
+    """
+    results = {
+        'rynz': __version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'jobs': jobs,
+        'corpus': settings,
+        'runs': {},
+    }
+    for size in sizes:
+        project = path.join(workdir, f"corpus-{size}")
+        print_message(f"📁 Preparing corpus of {size} notes in {project}", "info")
+        generate_corpus(project, corpus_settings(size, **settings))
+        for scenario in scenarios:
+            best = None
+            for _ in range(repeat):
+                run = measure(project, scenario, jobs)
+                if best is None or run['wall'] < best['wall']:
+                    best = run
+            results['runs'][f"{size}/{scenario}"] = best
+            print_message(
+                f"✔ {size} notes, {scenario}: {best['wall']:.2f}s, "
+                f"{best['peak_rss_mb'] or 0:.0f} MB", "success"
+            )
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Compares results with a baseline.
+
+    Args:
+        results (dict): Result of run_suite().
+        baseline (dict): Earlier result of run_suite().
+        threshold (float): Allowed slowdown, e.g. 0.1 for 10 %. Increases
+            below the METRICS noise floor never count.
+
+    Returns:
+        list: (run, metric, baseline value, new value, change, regressed)
+        for every measurement present in both.
+    """
+    rows = []
+    for run, values in results['runs'].items():
+        before = baseline.get('runs', {}).get(run)
+        if before is None:
+            continue
+        for metric in METRICS:
+            old, new = before.get(metric), values.get(metric)
+            if not old or new is None:
+                continue
+            change = new / old - 1
+            regressed = change > threshold and new - old > METRICS[metric]
+            rows.append((run, metric, old, new, change, regressed))
+    return rows
+
+
+def print_comparison(rows, threshold):
+    """
+    Prints the baseline comparison as a rich table.
+
+    Args:
+        rows (list): Result of compare().
+        threshold (float): Allowed slowdown.
+    """
+    table = Table(
+        title=f"Against baseline (regression above +{threshold:.0%})",
+        header_style="bold magenta"
+    )
+    table.add_column("Run")
+    table.add_column("Metric")
+    table.add_column("Baseline", justify="right")
+    table.add_column("Now", justify="right")
+    table.add_column("Change", justify="right")
+    for run, metric, old, new, change, regressed in rows:
+        table.add_row(
+            run, metric, f"{old:.3f}", f"{new:.3f}", f"{change:+.1%}",
+            style="bold red" if regressed else None
+        )
+    console.print(table)
+
+
+def save_json(data, filepath):
+    """
+    Writes benchmark data as JSON.
+
+    Args:
+        data (dict): Data to write.
+        filepath (str): Destination file.
+    """
+    makedirs(path.dirname(path.abspath(filepath)), exist_ok=True)
+    with open(filepath, 'w', encoding='utf-8') as json_file:
+        dump(data, json_file, indent=2)
+
+
+def main():
+    """
+    Parses the command line, runs the suite and checks for regressions.
+    """
+    parser = ArgumentParser(
+        prog="python -m benchmarks.run", description="Benchmark rynz builds."
+    )
+    parser.add_argument(
+        "-s", "--sizes", type=int, nargs="+", default=list(SIZES),
+        help=f"Corpus sizes in notes (default: {' '.join(map(str, SIZES))})"
+    )
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS),
+        help="Build scenarios to run (default: all)"
+    )
+    parser.add_argument(
+        "--workdir", default=path.join(gettempdir(), "rynz-bench"),
+        help="Directory for generated corpora"
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Build processes")
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=1,
+        help="Runs per scenario, keeping the fastest (default: 1)"
+    )
+    parser.add_argument("--paragraphs", type=int, default=4, help="Paragraphs per note")
+    parser.add_argument("--words", type=int, default=60, help="Words per paragraph")
+    parser.add_argument("--code-blocks", type=int, default=1, help="Code blocks per note")
+    parser.add_argument("--tags", type=int, default=50, help="Size of the tag vocabulary")
+    parser.add_argument("--tags-per-note", type=int, default=3, help="Tags on every note")
+    parser.add_argument(
+        "--tag-skew", type=float, default=1.0,
+        help="Zipf exponent of tag popularity, 0 for uniform"
+    )
+    parser.add_argument(
+        "-o", "--results", default=RESULTS_FILE,
+        help="Results file (default: benchmarks/results.json)"
+    )
+    parser.add_argument(
+        "-b", "--baseline", default=BASELINE_FILE,
+        help="Baseline to compare with (default: benchmarks/baseline.json)"
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true",
+        help="Store these results as the new baseline"
+    )
+    parser.add_argument(
+        "-t", "--threshold", type=float, default=0.10,
+        help="Allowed slowdown before a run counts as a regression (default: 0.10)"
+    )
+    args = parser.parse_args()
+
+    settings = {
+        'paragraphs': args.paragraphs, 'words': args.words,
+        'code_blocks': args.code_blocks, 'tags': args.tags,
+        'tags_per_note': args.tags_per_note, 'tag_skew': args.tag_skew,
+    }
+    results = run_suite(
+        args.sizes, args.scenarios, args.workdir, settings, args.jobs, args.repeat
+    )
+    save_json(results, args.results)
+    print_message(f"✔ Results saved to {args.results}", "success")
+
+    if args.save_baseline:
+        save_json(results, args.baseline)
+        print_message(f"✔ Baseline saved to {args.baseline}", "success")
+        return
+
+    if not path.exists(args.baseline):
+        print_message("⚠️ No baseline to compare with. Use --save-baseline.", "info")
+        return
+    with open(args.baseline, encoding='utf-8') as baseline_file:
+        baseline = load(baseline_file)
+    if baseline.get('corpus') != results['corpus']:
+        print_message("⚠️ Baseline was recorded with other corpus settings.", "info")
+    rows = compare(results, baseline, args.threshold)
+    print_comparison(rows, args.threshold)
+    regressions = [row for row in rows if row[5]]
+    if regressions:
+        print_message(f"❌ {len(regressions)} regressions found.", "error")
+        sys.exit(1)
+    print_message("✅ No regressions.", "success")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/bin/python
+
+#
+#       ███╗   ██╗██╗██╗  ██╗ █████╗ ██████╗ ███████╗
+#       ████╗  ██║██║██║  ██║██╔══██╗██╔══██╗██╔════╝
+#       ██╔██╗ ██║██║███████║███████║██████╔╝███████╗
+#       ██║╚██╗██║██║██╔══██║██╔══██║██╔══██╗╚════██║
+#       ██║ ╚████║██║██║  ██║██║  ██║██║  ██║███████║
+#       ╚═╝  ╚═══╝╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
+#       DRAFTED BY [https://nih.ar] ON 18-10-2026
+#       SOURCE [search.py] LAST MODIFIED ON 18-10-2026.
+#
+
+"""
+Benchmark of the search index behind `rynz serve`.
+
+Loads a generated corpus as a live site with and without its search
+index, then reports the indexing time, the size of the postings, the
+latency of typical queries and the time to reindex one edited note.
+"""
+
+from os import chdir, path, utime
+from tempfile import gettempdir
+from time import perf_counter
+from argparse import ArgumentParser
+from rich.console import Console
+from rich.table import Table
+from rynz import builder, live
+from .corpus import corpus_settings, generate_corpus
+
+# Initialize console for colorful output
+console = Console()
+
+
+def print_message(message, style="info"):
+    """
+    Prints a styled message using the Rich console.
+
+    Args:
+        message (str): The message to display.
+        style (str): Message style ("success", "error", or "info").
+    """
+    styles = {
+        "success": "bold green",
+        "error": "bold red",
+        "info": "yellow"
+    }
+    console.print(message, style=styles.get(style, "yellow"))
+
+
+def sample_queries(notes):
+    """
+    Lists queries from very common to unique terms of a generated corpus.
+
+    Args:
+        notes (int): Number of notes in the corpus.
+
+    Returns:
+        list: Query strings.
+    """
+    number = notes // 2
+    return [
+        "lorem",
+        "lorem ipsum",
+        '"dolor sit"',
+        "benchmark note",
+        f'"benchmark note {number}"',
+        f"note_{number}_0",
+        "missingterm",
+    ]
+
+
+def postings_mb(index):
+    """
+    Adds up the memory held by the posting arrays of an index.
+
+    Args:
+        index (SearchIndex): Populated index.
+
+    Returns:
+        float: Size in MB, without the term strings and note table.
+    """
+    return sum(
+        postings.buffer_info()[1] * postings.itemsize
+        for entry in index.terms.values() for postings in entry
+    ) / 1024 / 1024
+
+
+def time_query(index, query, repeat=5):
+    """
+    Runs a query several times.
+
+    Args:
+        index (SearchIndex): Populated index.
+        query (str): Query string.
+        repeat (int): Runs; the fastest one is kept.
+
+    Returns:
+        tuple: (fastest run in ms, number of matching notes).
+    """
+    best = None
+    for _ in range(repeat):
+        start = perf_counter()
+        total, _names = index.search(query, live.SEARCH_RESULTS)
+        elapsed = (perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best, total
+
+
+def main():
+    """
+    Parses the command line and runs the search benchmark.
+    """
+    parser = ArgumentParser(
+        prog="python -m benchmarks.search",
+        description="Measure indexing and query times of the rynz search index."
+    )
+    parser.add_argument(
+        "-n", "--notes", type=int, default=50000,
+        help="Notes in the generated corpus (default: 50000)"
+    )
+    parser.add_argument(
+        "--workdir", default=path.join(gettempdir(), "rynz-bench"),
+        help="Directory holding the generated corpora"
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5,
+        help="Runs per query, keeping the fastest (default: 5)"
+    )
+    parser.add_argument(
+        "queries", nargs="*", help="Queries to time instead of the built-in ones"
+    )
+    args = parser.parse_args()
+
+    project = path.abspath(path.join(args.workdir, f"corpus-{args.notes}"))
+    print_message(f"📁 Preparing corpus of {args.notes} notes in {project}", "info")
+    generate_corpus(project, corpus_settings(args.notes))
+    chdir(project)
+
+    start = perf_counter()
+    live.load_site(searchable=False)
+    plain = perf_counter() - start
+    start = perf_counter()
+    site = live.load_site()
+    indexed = perf_counter() - start
+    index = site['search']
+
+    table = Table(title=f"Search over {len(index)} notes", header_style="bold magenta")
+    table.add_column("Measurement")
+    table.add_column("Value", justify="right")
+    table.add_row("Load notes (s)", f"{plain:.2f}")
+    table.add_row("Load and index notes (s)", f"{indexed:.2f}")
+    table.add_row("Terms", f"{len(index.terms)}")
+    table.add_row("Postings (MB)", f"{postings_mb(index):.1f}")
+    for query in args.queries or sample_queries(args.notes):
+        ms, total = time_query(index, query, args.repeat)
+        table.add_row(f"Query {query} ({total} notes, ms)", f"{ms:.2f}")
+
+    # The note watcher of `rynz serve` reindexes an edited note on its own
+    note_path = path.join(builder.note_dir(site['config']), "note0.md")
+    with open(note_path, 'a', encoding='utf-8') as note_file:
+        note_file.write("\nEdited for the benchmark.\n")
+    utime(note_path)
+    start = perf_counter()
+    live.update_notes(site, {note_path})
+    table.add_row("Reindex one edited note (ms)", f"{(perf_counter() - start) * 1000:.1f}")
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/bin/python
+
+#
+#       ███╗   ██╗██╗██╗  ██╗ █████╗ ██████╗ ███████╗
+#       ████╗  ██║██║██║  ██║██╔══██╗██╔══██╗██╔════╝
+#       ██╔██╗ ██║██║███████║███████║██████╔╝███████╗
+#       ██║╚██╗██║██║██╔══██║██╔══██║██╔══██╗╚════██║
+#       ██║ ╚████║██║██║  ██║██║  ██║██║  ██║███████║
+#       ╚═╝  ╚═══╝╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
+#       DRAFTED BY [https://nih.ar] ON 18-10-2026
+#       SOURCE [startup.py] LAST MODIFIED ON 18-10-2026.
+#
+
+"""
+Start-up budget check for the rynz command line.
+
+Quick commands run in fresh interpreters with `-X importtime`. The import
+time of every module a bare interpreter does not load is added up, and a
+command fails the check when it goes over its budget or imports a module
+it never needs.
+"""
+
+from os import environ, path, pathsep
+from tempfile import TemporaryDirectory
+from argparse import ArgumentParser
+import subprocess
+import sys
+from rich.console import Console
+from rich.table import Table
+
+# Initialize console for colorful output
+console = Console()
+
+ROOT = path.dirname(path.dirname(path.abspath(__file__)))
+
+# Modules only the build, serve, list and save commands need
+HEAVY_MODULES = (
+    "jinja2", "markdown2", "yaml", "http.server", "subprocess", "sqlite3",
+    "concurrent.futures",
+)
+
+# Command line, import budget in ms and modules it must not import
+COMMANDS = {
+    'version': (["--version"], 40, HEAVY_MODULES + ("rich",)),
+    'add': (["add", "startup-note"], 150, HEAVY_MODULES),
+}
+
+
+def print_message(message, style="info"):
+    """
+    Prints a styled message using the Rich console.
+
+    Args:
+        message (str): The message to display.
+        style (str): Message style ("success", "error", or "info").
+    """
+    styles = {
+        "success": "bold green",
+        "error": "bold red",
+        "info": "yellow"
+    }
+    console.print(message, style=styles.get(style, "yellow"))
+
+
+def import_times(code, args=(), cwd=None):
+    """
+    Runs Python code in a fresh interpreter and reads its import times.
+
+    Args:
+        code (str): Code passed to `python -c`.
+        args (list): Command line arguments for the code.
+        cwd (str): Working directory.
+
+    Returns:
+        dict: Module name -> own import time in microseconds.
+    """
+    pythonpath = pathsep.join(filter(None, [ROOT, environ.get('PYTHONPATH')]))
+    env = dict(environ, PYTHONPATH=pythonpath)
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code, *args],
+        cwd=cwd, env=env, check=True, capture_output=True, text=True
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        own, _cumulative, name = line[len("import time:"):].split("|")
+        if own.strip().isdigit():
+            times[name.strip()] = int(own)
+    return times
+
+
+def measure_command(name, repeat=3):
+    """
+    Measures the imports of one rynz command.
+
+    Args:
+        name (str): Key of COMMANDS.
+        repeat (int): Runs of the command; the fastest one is kept.
+
+    Returns:
+        dict: 'ms' of imports beyond a bare interpreter and the sorted
+        'modules' imported.
+    """
+    args = COMMANDS[name][0]
+    baseline = import_times("pass").keys()
+    best = None
+    for _ in range(repeat):
+        with TemporaryDirectory() as project:
+            times = import_times("from rynz.rynz import main; main()", args, project)
+        own = {module: us for module, us in times.items() if module not in baseline}
+        total = sum(own.values()) / 1000
+        if best is None or total < best['ms']:
+            best = {'ms': total, 'modules': sorted(own)}
+    return best
+
+
+def check_budgets(scale=1.0, repeat=3):
+    """
+    Measures every command in COMMANDS against its budget.
+
+    Args:
+        scale (float): Multiplier for the budgets on slower machines.
+        repeat (int): Runs per command.
+
+    Returns:
+        list: (command, ms, budget ms, forbidden modules imported) rows.
+    """
+    rows = []
+    for name, (_args, budget, forbidden) in COMMANDS.items():
+        result = measure_command(name, repeat)
+        heavy = [
+            prefix for prefix in forbidden
+            if any(module == prefix or module.startswith(prefix + ".")
+                   for module in result['modules'])
+        ]
+        rows.append((name, result['ms'], budget * scale, heavy))
+    return rows
+
+
+def main():
+    """
+    Parses the command line and checks the start-up budgets.
+    """
+    parser = ArgumentParser(
+        prog="python -m benchmarks.startup",
+        description="Check the import time of quick rynz commands."
+    )
+    parser.add_argument(
+        "-s", "--scale", type=float, default=1.0,
+        help="Multiply every budget, for slower machines (default: 1.0)"
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=3,
+        help="Runs per command, keeping the fastest (default: 3)"
+    )
+    args = parser.parse_args()
+
+    rows = check_budgets(args.scale, args.repeat)
+    table = Table(title="Start-up imports", header_style="bold magenta")
+    table.add_column("Command")
+    table.add_column("Imports (ms)", justify="right")
+    table.add_column("Budget (ms)", justify="right")
+    table.add_column("Unexpected modules")
+    failed = 0
+    for name, ms, budget, heavy in rows:
+        over = ms > budget or bool(heavy)
+        failed += over
+        table.add_row(
+            f"rynz {' '.join(COMMANDS[name][0])}", f"{ms:.1f}", f"{budget:.0f}",
+            ", ".join(heavy), style="bold red" if over else None
+        )
+    console.print(table)
+    if failed:
+        print_message(f"❌ {failed} commands over their start-up budget.", "error")
+        sys.exit(1)
+    print_message("✅ All commands within their start-up budget.", "success")
+
+
+if __name__ == "__main__":
+    main()
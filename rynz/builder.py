@@ -8,230 +8,2075 @@
 #       ██║ ╚████║██║██║  ██║██║  ██║██║  ██║███████║
 #       ╚═╝  ╚═══╝╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
 #       DRAFTED BY [https://nih.ar] ON 28-04-2025
-#       SOURCE [builder.py] LAST MODIFIED ON 29-04-2025.
+#       SOURCE [builder.py] LAST MODIFIED ON 18-10-2026.
 #
 
-from shutil import copytree, rmtree
-from os import path, makedirs, sep
-from glob import glob
+from shutil import copy2, copystat, rmtree
+from os import (
+    path, makedirs, remove, removedirs, replace, rename, getpid, cpu_count, sep, scandir,
+    stat, link, fsencode
+)
+from gzip import GzipFile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from traceback import format_exc
+from fnmatch import fnmatchcase
+from hashlib import sha256
+from json import dump, dumps, load
 from yaml import safe_load
-from jinja2 import Environment, FileSystemLoader
-from markdown2 import markdown
-from time import time
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+from markupsafe import escape
+from .frontmatter import split_frontmatter, parse_frontmatter, meta_tags
+from . import notedb, profiler, renderers
+from .profiler import lap
+from sqlite3 import Error as SQLiteError
+from time import time, perf_counter
+from datetime import date, datetime
+import re
+import sys
+from urllib.parse import quote
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
+from rich.progress import (
+    Progress, ProgressColumn, TextColumn, BarColumn, MofNCompleteColumn, TimeRemainingColumn
+)
 
 # Initialize console for colorful output
 console = Console()
 
+# Console verbosity: QUIET shows only warnings and errors, NORMAL adds a
+# progress bar and build summaries, VERBOSE prints every note
+QUIET, NORMAL, VERBOSE = 0, 1, 2
 
-def print_message(message, style="info"):
+# Build manifest stored next to config.yml
+MANIFEST_FILE = ".rynz-manifest.json"
+MANIFEST_VERSION = 1
+
+# Build caches stored next to config.yml
+CACHE_DIR = ".rynz-cache"
+TEMPLATE_CACHE_DIR = path.join(CACHE_DIR, "templates")
+MARKDOWN_CACHE_DIR = path.join(CACHE_DIR, "markdown")
+# Every message of the last deploy, including per-note ones
+LOG_FILE = path.join(CACHE_DIR, "build.log")
+
+# Text outputs that get a precompressed .gz sibling when precompress is on
+COMPRESSIBLE_EXTENSIONS = (
+    '.html', '.xml', '.css', '.js', '.json', '.svg', '.txt', '.md', '.csv', '.map'
+)
+
+# Ways to place static resources into home_path (config key asset_links)
+ASSET_LINK_MODES = ('copy', 'hardlink', 'reflink')
+# Linux ioctl cloning a file's extents (copy-on-write filesystems only)
+FICLONE = 0x40049409
+# Hex digits of the content hash in fingerprinted asset names
+FINGERPRINT_LENGTH = 10
+
+# Sibling directories of home_path used by atomic deploys
+STAGING_SUFFIX = ".rynz-staging"
+RETIRED_SUFFIX = ".rynz-old"
+# renameat2() arguments swapping two paths in one step (Linux)
+AT_FDCWD = -100
+RENAME_EXCHANGE = 2
+
+# Notes published by default, relative to the note folder
+NOTE_INCLUDE = ["*.md"]
+
+# Optional listing pages: template config key and output folder
+GROUP_PAGES = {'tag_template': "tags", 'archive_template': "archive"}
+ARCHIVE_DATE = re.compile(r"([0-9]{4})-([0-9]{2})")
+
+# Template of the /search page of `rynz serve`, falling back to these
+SEARCH_TEMPLATES = ('search_template', *GROUP_PAGES)
+# Every template a page can be rendered with
+TEMPLATE_KEYS = ('note_template', 'home_template', 'feed_template', *SEARCH_TEMPLATES)
+
+# Sitemap written when `sitemap` is on; past SITEMAP_LIMIT URLs (the
+# protocol limit) it becomes an index of sitemap-<n>.xml shards
+SITEMAP_FILE = "sitemap.xml"
+SITEMAP_LIMIT = 50000
+SITEMAP_DATE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+SITEMAP_XMLNS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+# URL paths that need no percent-encoding
+SITEMAP_SAFE = re.compile(r"[\w./~-]*", re.ASCII)
+
+# Mandatory configuration keys
+REQUIRED_KEYS = [
+    'home_path', 'resource_path', 'content_path', 'note_template',
+    'home_template', 'feed_template', 'home_md', 'header_md',
+    'footer_md', 'title', 'url'
+]
+
+
+# Console verbosity and the open build log, see set_verbosity()
+_output = {'verbosity': NORMAL, 'log': None}
+
+
+def set_verbosity(verbosity):
+    """
+    Sets how much the builder prints.
+
+    Args:
+        verbosity (int): QUIET, NORMAL or VERBOSE.
+    """
+    _output['verbosity'] = verbosity
+
+
+def print_message(message, style="info", level=NORMAL, detail=None):
+    """
+    Prints a styled message using the Rich console. Warnings and errors are
+    always printed; other messages only at or above their level. During a
+    deploy every message is also written to LOG_FILE.
+
+    Args:
+        message (str): The message to display.
+        style (str): Message style ("success", "error", "warning" or "info").
+        level (int): Lowest verbosity that prints the message.
+        detail (str): Plain text shown below the message, e.g. a traceback.
+    """
+    styles = {
+        "success": "bold green",
+        "error": "bold red",
+        "warning": "yellow",
+        "info": "yellow"
+    }
+    log = _output['log']
+    if log is not None:
+        log.write(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] {message}\n")
+        if detail:
+            log.write(detail.rstrip() + "\n")
+    if style in ("error", "warning") or _output['verbosity'] >= level:
+        console.print(message, style=styles.get(style, "yellow"))
+        if detail:
+            console.print(detail, style="red", markup=False, highlight=False)
+
+
+def open_log():
+    """
+    Starts writing messages to LOG_FILE. A log that cannot be opened is
+    skipped.
+    """
+    try:
+        makedirs(CACHE_DIR, exist_ok=True)
+        _output['log'] = open(LOG_FILE, 'w', encoding='utf-8')
+    except OSError:
+        _output['log'] = None
+
+
+def close_log():
+    """
+    Closes the log opened by open_log().
+    """
+    log, _output['log'] = _output['log'], None
+    if log is not None:
+        log.close()
+
+
+class RateColumn(ProgressColumn):
+    """
+    Progress column showing notes per second.
+    """
+
+    def render(self, task):
+        return Text(f"{task.speed or 0:.0f} notes/s", style="cyan")
+
+
+def note_progress():
+    """
+    Creates the live progress bar of the note phase. It is only shown at
+    NORMAL verbosity, where it replaces the per-note messages.
+
+    Returns:
+        Progress: rich progress display, to be used as a context manager.
+    """
+    return Progress(
+        TextColumn("[bold green]{task.description}"), BarColumn(), MofNCompleteColumn(),
+        RateColumn(), TextColumn("ETA"), TimeRemainingColumn(),
+        console=console, disable=_output['verbosity'] != NORMAL
+    )
+
+
+def readmd(filepath):
+    """
+    Reads and returns the raw content of a markdown file.
+
+    Args:
+        filepath (str): Path to the markdown file.
+
+    Returns:
+        str: File content as a string.
+    """
+    try:
+        with open(filepath, 'r', encoding='utf8', errors='ignore') as data:
+            return data.read()
+    except Exception as e:
+        print_message(f"❌ Error reading {filepath}: {e}", "error")
+        return ""
+
+
+def hash_text(*parts):
+    """
+    Returns a stable SHA-256 hex digest of the given text parts.
+
+    Args:
+        *parts (str): Strings to hash, in order.
+
+    Returns:
+        str: Hex digest.
+    """
+    digest = sha256()
+    for part in parts:
+        digest.update(part.encode('utf8', errors='ignore'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def load_manifest():
+    """
+    Loads the build manifest written by the previous deploy.
+
+    Returns:
+        dict: The manifest, or an empty one if missing, unreadable or
+        written by an incompatible version.
+    """
+    empty = {'version': MANIFEST_VERSION, 'site': '', 'index': '', 'notes': {}}
+    if not path.exists(MANIFEST_FILE):
+        return empty
+    try:
+        with open(MANIFEST_FILE, encoding='utf8') as manifest_file:
+            manifest = load(manifest_file)
+    except Exception as e:
+        print_message(f"⚠️ Ignoring unreadable {MANIFEST_FILE}: {e}", "warning")
+        return empty
+    if not isinstance(manifest, dict) or manifest.get('version') != MANIFEST_VERSION:
+        return empty
+    return manifest
+
+
+def save_manifest(manifest):
+    """
+    Atomically writes the build manifest next to config.yml.
+
+    Args:
+        manifest (dict): Manifest to persist.
+    """
+    tmp_file = MANIFEST_FILE + ".tmp"
+    with open(tmp_file, 'w', encoding='utf8') as manifest_file:
+        dump(manifest, manifest_file, indent=1, sort_keys=True)
+    replace(tmp_file, MANIFEST_FILE)
+
+
+def template_files(config):
+    """
+    Lists the template files pages can load. Templates pulled in through
+    extends, include or import are found by taking every file in the folders
+    of the configured templates; a template at the project root only counts
+    itself.
+
+    Args:
+        config (dict): Loaded site configuration.
+
+    Returns:
+        list: Sorted normalised paths.
+    """
+    files = set()
+    pending = []
+    for key in TEMPLATE_KEYS:
+        if not config.get(key):
+            continue
+        template_dir = path.dirname(path.normpath(config[key]))
+        if template_dir:
+            pending.append(template_dir)
+        else:
+            files.add(path.normpath(config[key]))
+    seen = set()
+    while pending:
+        directory = pending.pop()
+        if directory in seen:
+            continue
+        seen.add(directory)
+        try:
+            entries = list(scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir():
+                pending.append(path.normpath(entry.path))
+            elif entry.is_file():
+                files.add(path.normpath(entry.path))
+    return sorted(files)
+
+
+def site_fingerprint(config, config_text, assets=None):
+    """
+    Hashes every input shared by all pages: config, every file of the
+    template folders, header, footer and the version of the Markdown
+    backend. A change here invalidates every rendered note.
+
+    Args:
+        config (dict): Loaded site configuration.
+        config_text (str): Raw content of config.yml.
+        assets (dict): Fingerprinted asset names from asset_names(), which
+            templates can embed through asset().
+
+    Returns:
+        str: Hex digest.
+    """
+    parts = [config_text]
+    for filepath in template_files(config):
+        parts.append(f"{filepath}\0{file_hash(filepath)}")
+    parts += [
+        readmd(config['header_md']),
+        readmd(config['footer_md']),
+        markdown_version(config),
+    ]
+    if assets:
+        parts.append(dumps(assets, sort_keys=True))
+    return hash_text(*parts)
+
+
+def markdown_version(config):
+    """
+    Returns the version of the configured Markdown backend.
+
+    Args:
+        config (dict): Loaded site configuration.
+
+    Returns:
+        str: Backend version, see renderers.get_renderer().
+
+    Raises:
+        ValueError: If the backend is unknown or not installed.
+    """
+    extras = tuple(sorted(config.get('markdown_extras') or []))
+    return renderers.get_renderer(config.get('markdown_backend'), extras)[1]
+
+
+def render_markdown(md_content, extras=None, backend=None):
+    """
+    Converts Markdown to HTML through the on-disk render cache.
+
+    Rendered fragments are stored under .rynz-cache/markdown, keyed by a hash
+    of the source, the backend version and the extras in use, so unchanged
+    bodies are never converted twice across deploys.
+
+    Args:
+        md_content (str): Markdown source.
+        extras (list): markdown2 extras to enable.
+        backend (str): Markdown backend, see renderers.get_renderer().
+
+    Returns:
+        str: Rendered HTML.
+    """
+    extras = sorted(extras or [])
+    render, version = renderers.get_renderer(backend, tuple(extras))
+    key = hash_text(version, ",".join(extras), md_content)
+    cache_file = path.join(MARKDOWN_CACHE_DIR, key[:2], key + ".html")
+    try:
+        with open(cache_file, encoding='utf8') as cached:
+            return cached.read()
+    except OSError:
+        pass
+
+    html = render(md_content)
+    try:
+        makedirs(path.dirname(cache_file), exist_ok=True)
+        tmp_file = f"{cache_file}.{getpid()}.tmp"
+        with open(tmp_file, 'w', encoding='utf8') as cached:
+            cached.write(html)
+        replace(tmp_file, cache_file)
+    except OSError as e:
+        print_message(f"⚠️ Could not cache rendered Markdown: {e}", "warning")
+    return html
+
+
+def make_environment(assets=None):
+    """
+    Creates the Jinja2 environment shared by every page of a build.
+
+    Compiled templates are kept in a bytecode cache under .rynz-cache, so
+    repeated deploys skip parsing and compiling templates that did not change.
+
+    Args:
+        assets (dict): Fingerprinted asset names from asset_names(), used by
+            the asset() template function.
+
+    Returns:
+        Environment: Configured Jinja2 environment.
+    """
+    makedirs(TEMPLATE_CACHE_DIR, exist_ok=True)
+    env = Environment(
+        loader=FileSystemLoader(searchpath='./'),
+        bytecode_cache=FileSystemBytecodeCache(TEMPLATE_CACHE_DIR),
+    )
+    env.filters['slug'] = tag_slug
+    env.globals['asset'] = lambda name: asset_url(assets or {}, name)
+    return env
+
+
+def precompile_templates(env, config):
+    """
+    Compiles every template next to the configured templates into the
+    bytecode cache ahead of time, so later builds start warm.
+
+    Args:
+        env (Environment): Jinja2 environment from make_environment().
+        config (dict): Loaded site configuration.
+
+    Returns:
+        int: Number of templates compiled.
+    """
+    template_dirs = {
+        path.dirname(config[key])
+        for key in ('note_template', 'home_template', 'feed_template')
+    }
+    compiled = 0
+    for name in env.list_templates(
+        filter_func=lambda name: path.dirname(name) in template_dirs
+    ):
+        try:
+            env.get_template(name)
+            compiled += 1
+        except Exception as e:
+            print_message(f"⚠️ Could not precompile {name}: {e}", "warning")
+    return compiled
+
+
+def load_note(note_path, fast=False, timings=None, mtime=None):
+    """
+    Reads a note once and returns the note object used for the whole build.
+
+    Args:
+        note_path (str): Path to the source Markdown note.
+        fast (bool): Try the flat frontmatter parser before YAML.
+        timings (dict): Receives 'read' and 'frontmatter' seconds when
+            profiling.
+        mtime (float): Modification time already known from discovery.
+
+    Returns:
+        dict: Note with its source path, content hash, raw and parsed
+        frontmatter ('frontmatter', 'meta', None when missing), Markdown body
+        and rendered HTML ('html', filled on first use by note_html()) and
+        its 'mtime'.
+    """
+    start = perf_counter()
+    raw = readmd(note_path)
+    note = {
+        'path': note_path,
+        'mtime': stat(note_path).st_mtime if mtime is None else mtime,
+        'hash': hash_text(raw),
+        'meta': None,
+        'body': '',
+        'html': None,
+    }
+    start = lap(timings, 'read', start)
+    note['frontmatter'], note['body'] = split_frontmatter(raw)
+    note['meta'] = parse_frontmatter(note['frontmatter'], fast)
+    lap(timings, 'frontmatter', start)
+    return note
+
+
+def note_html(note, extras=None, timings=None, backend=None):
+    """
+    Returns the rendered HTML of a loaded note, converting its Markdown at
+    most once.
+
+    Args:
+        note (dict): Note object from load_note().
+        extras (list): markdown2 extras to enable.
+        timings (dict): Receives 'markdown' seconds when profiling.
+        backend (str): Markdown backend, see renderers.get_renderer().
+
+    Returns:
+        str: Rendered HTML.
+    """
+    if note['html'] is None:
+        start = perf_counter()
+        note['html'] = render_markdown(note['body'], extras, backend)
+        lap(timings, 'markdown', start)
+    return note['html']
+
+
+class LazyPost(dict):
+    """
+    Frontmatter of a note as listed by the home, feed, tag and archive
+    templates. `post.note` renders the note body from disk, through the
+    Markdown render cache, each time it is used, so listing pages never hold
+    the HTML of the whole archive in memory.
+    """
+
+    __slots__ = ('_note_path', '_extras', '_backend')
+
+    def __init__(self, meta, note_path, extras=None, backend=None):
+        super().__init__(meta)
+        self._note_path = note_path
+        self._extras = extras
+        self._backend = backend
+
+    def __missing__(self, key):
+        if key != 'note':
+            raise KeyError(key)
+        body = split_frontmatter(readmd(self._note_path))[1]
+        return render_markdown(body, self._extras, self._backend)
+
+    def get(self, key, default=None):
+        if key == 'note' and key not in self:
+            return self[key]
+        return super().get(key, default)
+
+
+def listing_posts(notes, extras=None, backend=None):
+    """
+    Wraps sorted notes for listing templates.
+
+    Args:
+        notes (list): Sorted note objects.
+        extras (list): markdown2 extras to enable.
+        backend (str): Markdown backend, see renderers.get_renderer().
+
+    Returns:
+        list: LazyPost for every note.
+    """
+    return [LazyPost(note['meta'], note['path'], extras, backend) for note in notes]
+
+
+def load_fragments(config):
+    """
+    Renders the header and footer shared by every page, once per build.
+
+    Args:
+        config (dict): Loaded site configuration.
+
+    Returns:
+        dict: Rendered 'header' and 'footer' HTML.
+    """
+    extras = config.get('markdown_extras')
+    backend = config.get('markdown_backend')
+    return {
+        'header': render_markdown(readmd(config['header_md']), extras, backend),
+        'footer': render_markdown(readmd(config['footer_md']), extras, backend),
+    }
+
+
+def note_dir(config):
+    """
+    Returns the folder holding the notes of a site.
+
+    Args:
+        config (dict): Loaded site configuration.
+
+    Returns:
+        str: Normalised note folder.
+    """
+    return path.normpath(path.join(config['content_path'], "note"))
+
+
+def is_note(config, note_path):
+    """
+    Checks whether a path inside the note folder is published as a note,
+    following the note_include and note_exclude patterns. Patterns match
+    the path relative to the note folder, with "/" separators; "*" also
+    matches across folders. Hidden files and folders are never notes.
+
+    Args:
+        config (dict): Loaded site configuration.
+        note_path (str): Path of a file.
+
+    Returns:
+        bool: True if the file is a note.
+    """
+    name = path.relpath(note_path, note_dir(config)).replace(sep, "/")
+    if name.startswith("../") or any(part.startswith(".") for part in name.split("/")):
+        return False
+    return any(
+        fnmatchcase(name, pattern) for pattern in config.get('note_include') or NOTE_INCLUDE
+    ) and not any(
+        fnmatchcase(name, pattern) for pattern in config.get('note_exclude') or []
+    )
+
+
+def discover_notes(config):
+    """
+    Walks the note folder and its subfolders with scandir.
+
+    Args:
+        config (dict): Loaded site configuration.
+
+    Returns:
+        dict: Normalised path -> stat result of every note, in directory
+        order. The stat results serve change detection, so notes are not
+        stat-ed again.
+    """
+    root = note_dir(config)
+    excludes = config.get('note_exclude') or []
+    notes = {}
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            entries = list(scandir(directory))
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir():
+                # Skip excluded folders without walking them
+                name = path.relpath(entry.path, root).replace(sep, "/") + "/"
+                if not any(fnmatchcase(name, pattern) for pattern in excludes):
+                    subdirs.append(entry.path)
+            elif is_note(config, entry.path):
+                try:
+                    notes[path.normpath(entry.path)] = entry.stat()
+                except OSError:
+                    continue
+        pending.extend(reversed(subdirs))
+    return notes
+
+
+def note_output(config, note_path):
+    """
+    Returns the output filename of a note, relative to home_path. Notes in
+    subfolders keep their folders, so content/note/guides/setup.md becomes
+    guides/setup.html.
+
+    Args:
+        config (dict): Loaded site configuration.
+        note_path (str): Path to the source Markdown note.
+
+    Returns:
+        str: Output HTML filename, with "/" separators.
+    """
+    name = path.relpath(note_path, note_dir(config))
+    if name.startswith(".."):
+        name = path.basename(note_path)
+    return path.splitext(name)[0].replace(sep, "/") + ".html"
+
+
+def remove_output(home_path, name):
+    """
+    Removes an output file and its .gz sibling, then any folders left
+    empty by it.
+
+    Args:
+        home_path (str): Output directory.
+        name (str): Output filename relative to home_path.
+    """
+    output_filepath = path.join(home_path, name)
+    for target in (output_filepath, output_filepath + '.gz'):
+        if path.isfile(target):
+            remove(target)
+    try:
+        removedirs(path.dirname(output_filepath))
+    except OSError:
+        pass
+
+
+def page_context(config, fragments, post_detail, article, filename, posts=None,
+                 nextpage="", prevpage=""):
+    """
+    Collects the template variables of a page.
+    Handles both single notes and special pages like index.html and RSS feeds.
+
+    Args:
+        config (dict): Loaded site configuration.
+        fragments (dict): Rendered header and footer from load_fragments().
+        post_detail (dict): Frontmatter details for the post.
+        article (str): Rendered HTML of the page body.
+        filename (str): Source or output filename.
+        posts (list): Sorted posts for index and feed pages.
+        nextpage (str): URL of the next (older) home page, if any.
+        prevpage (str): URL of the previous (newer) home page, if any.
+
+    Returns:
+        tuple: (output file name, template variables).
+    """
+    # Initialize variables
+    post_title = ""
+    post_subtitle = ""
+    post_date = ""
+    post_meta = ""
+    posts_list = ""
+    last_date = ""
+
+    # Determine post details based on the filename
+    if path.basename(filename) == "index.html":
+        post_file = filename
+        posts_list = posts
+        if post_detail is not None:
+            # Tag and archive listings are titled after their group
+            post_title = post_detail.get("title", "")
+    elif filename.endswith(".xml"):
+        post_file = filename
+        posts_list = posts
+        last_date = posts_list[0].get('date')
+    elif post_detail is None:
+        post_file = filename.replace('.md', '.html')
+    else:
+        post_title = post_detail.get("title", "")
+        post_subtitle = post_detail.get("subtitle", "")
+        post_date = post_detail.get("date", "")
+        post_meta = post_detail.get("meta", "")
+        post_file = note_output(config, filename)
+
+    return post_file, dict(
+        title=config['title'],
+        post_title=post_title,
+        post_subtitle=post_subtitle,
+        date=post_date,
+        metad=post_meta,
+        url=path.join(config['url'], post_file),
+        article=article,
+        posts=posts_list,
+        home=config['home_md'],
+        header=fragments['header'],
+        footer=fragments['footer'],
+        last_date=last_date,
+        nextpage=nextpage,
+        prevpage=prevpage,
+        config=config
+    )
+
+
+def render_page(config, fragments, template_obj, post_detail, article, filename, posts=None,
+                nextpage="", prevpage=""):
+    """
+    Renders a page from a Jinja2 template and given content.
+
+    Args:
+        config (dict): Loaded site configuration.
+        fragments (dict): Rendered header and footer from load_fragments().
+        template_obj (Template): Compiled Jinja2 template.
+        post_detail (dict): Frontmatter details for the post.
+        article (str): Rendered HTML of the page body.
+        filename (str): Source or output filename.
+        posts (list): Sorted posts for index and feed pages.
+        nextpage (str): URL of the next (older) home page, if any.
+        prevpage (str): URL of the previous (newer) home page, if any.
+
+    Returns:
+        tuple: (output file name, rendered page).
+    """
+    post_file, context = page_context(
+        config, fragments, post_detail, article, filename, posts, nextpage, prevpage
+    )
+    return post_file, template_obj.render(**context)
+
+
+def stream_page(config, fragments, template_obj, post_detail, article, filename, posts=None,
+                nextpage="", prevpage=""):
+    """
+    Renders a listing page with Jinja2's streaming generation, writing each
+    chunk to disk as it is produced instead of building the page in memory.
+    The page replaces its previous version only once it is complete.
+
+    Args:
+        config (dict): Loaded site configuration.
+        fragments (dict): Rendered header and footer from load_fragments().
+        template_obj (Template): Compiled Jinja2 template.
+        post_detail (dict): Title of a tag or archive page, or None.
+        article (str): Rendered HTML of the page body.
+        filename (str): Output filename.
+        posts (list): Sorted posts.
+        nextpage (str): URL of the next (older) home page, if any.
+        prevpage (str): URL of the previous (newer) home page, if any.
+
+    Returns:
+        str: Rendered file name or an empty string in case of error.
+    """
+    tmp_file = ""
+    try:
+        post_file, context = page_context(
+            config, fragments, post_detail, article, filename, posts, nextpage, prevpage
+        )
+        output_filepath = path.join(config['home_path'], post_file)
+        makedirs(path.dirname(output_filepath), exist_ok=True)
+        tmp_file = f"{output_filepath}.{getpid()}.tmp"
+        with open(tmp_file, 'w', encoding='utf8', errors='ignore') as output_file:
+            output_file.writelines(template_obj.generate(**context))
+        replace(tmp_file, output_filepath)
+        return post_file
+    except Exception as e:
+        if tmp_file and path.exists(tmp_file):
+            remove(tmp_file)
+        print_message(f"❌ Error creating page {filename}: {e}", "error")
+        return ""
+
+
+def create_page(config, fragments, template_obj, post_detail, article, filename, posts=None,
+                nextpage="", prevpage="", timings=None):
+    """
+    Renders a page with render_page() and writes it into home_path.
+
+    Args:
+        config (dict): Loaded site configuration.
+        fragments (dict): Rendered header and footer from load_fragments().
+        template_obj (Template): Compiled Jinja2 template.
+        post_detail (dict): Frontmatter details for the post.
+        article (str): Rendered HTML of the page body.
+        filename (str): Source or output filename.
+        posts (list): Sorted posts for index and feed pages.
+        nextpage (str): URL of the next (older) home page, if any.
+        prevpage (str): URL of the previous (newer) home page, if any.
+        timings (dict): Receives 'render' and 'write' seconds when profiling.
+
+    Returns:
+        str: Rendered file name or an empty string in case of error.
+    """
+    try:
+        start = perf_counter()
+        post_file, page = render_page(
+            config, fragments, template_obj, post_detail, article, filename, posts,
+            nextpage, prevpage
+        )
+        start = lap(timings, 'render', start)
+        output_filepath = path.join(config['home_path'], post_file)
+        makedirs(path.dirname(output_filepath), exist_ok=True)
+        # Replace rather than overwrite, so a hardlinked resource of the same
+        # name is never written through
+        tmp_file = f"{output_filepath}.{getpid()}.tmp"
+        with open(tmp_file, 'w', encoding='utf8', errors='ignore') as output_file:
+            output_file.write(page)
+        replace(tmp_file, output_filepath)
+        lap(timings, 'write', start)
+        return post_file
+    except Exception as e:
+        print_message(f"❌ Error creating page {filename}: {e}", "error")
+        return ""
+
+
+def sort_notes(notes):
+    """
+    Sorts notes by latest date, as listed on the home page and feed.
+
+    Args:
+        notes (iterable): Note objects with frontmatter.
+
+    Returns:
+        list: Sorted notes.
+    """
+    return sorted(notes, key=lambda note: note['meta'].get('date', ''), reverse=True)
+
+
+def index_fingerprint(home_content, notes):
+    """
+    Hashes everything index.html and rss.xml are rendered from.
+
+    Args:
+        home_content (str): Raw content of home_md.
+        notes (list): Sorted note objects.
+
+    Returns:
+        str: Hex digest.
+    """
+    return hash_text(home_content, *(
+        note['hash'] + dumps(
+            {key: val for key, val in note['meta'].items() if key != 'note'},
+            default=str, sort_keys=True
+        )
+        for note in notes
+    ))
+
+
+def page_url(number):
+    """
+    Returns the URL of a home page by its 1-based number.
+
+    Args:
+        number (int): Page number.
+
+    Returns:
+        str: "/" for the first page, "/page/<number>/" otherwise.
+    """
+    return "/" if number == 1 else f"/page/{number}/"
+
+
+def home_page_count(config, total):
+    """
+    Returns how many home pages home_pages() splits the posts into.
+
+    Args:
+        config (dict): Loaded site configuration.
+        total (int): Number of posts.
+
+    Returns:
+        int: Number of home pages, at least 1.
+    """
+    per_page = int(config.get('posts_per_page') or 0)
+    if per_page <= 0 or total <= per_page:
+        return 1
+    return (total + per_page - 1) // per_page
+
+
+def home_pages(config, posts):
+    """
+    Splits the sorted posts into home pages of posts_per_page each.
+
+    Args:
+        config (dict): Loaded site configuration.
+        posts (list): Sorted posts.
+
+    Returns:
+        list: (filename, posts, nextpage, prevpage) for every home page.
+            Everything lands on index.html when posts_per_page is unset.
+    """
+    count = home_page_count(config, len(posts))
+    if count == 1:
+        return [("index.html", posts, "", "")]
+
+    per_page = int(config['posts_per_page'])
+    pages = []
+    for number in range(1, count + 1):
+        filename = "index.html" if number == 1 else f"page/{number}/index.html"
+        pages.append((
+            filename,
+            posts[(number - 1) * per_page:number * per_page],
+            page_url(number + 1) if number < count else "",
+            page_url(number - 1) if number > 1 else "",
+        ))
+    return pages
+
+
+def summarize(html):
+    """
+    Returns the first paragraph of rendered HTML as a feed summary.
+
+    Args:
+        html (str): Rendered note HTML.
+
+    Returns:
+        str: First <p> element, or the whole HTML if it has none.
+    """
+    start = html.find("<p>")
+    end = html.find("</p>", start)
+    if start == -1 or end == -1:
+        return html
+    return html[start:end + 4]
+
+
+def feed_posts(config, posts):
+    """
+    Limits the feed to the feed_limit most recent posts, replacing each
+    body by its summary when feed_content is "summary".
+
+    Args:
+        config (dict): Loaded site configuration.
+        posts (list): Sorted posts with rendered 'note' HTML.
+
+    Returns:
+        list: Posts for the feed template.
+    """
+    limit = int(config.get('feed_limit') or 0)
+    if limit > 0:
+        posts = posts[:limit]
+    if config.get('feed_content') == "summary":
+        posts = [
+            dict(post, note=post.get('summary') or summarize(post['note']))
+            for post in posts
+        ]
+    return posts
+
+
+def write_index(config, fragments, home_template, feed_template, notes, home_content):
+    """
+    Renders the home pages and rss.xml from the sorted notes, and removes
+    home pages left over from a longer post list.
+
+    Args:
+        config (dict): Loaded site configuration.
+        fragments (dict): Rendered header and footer from load_fragments().
+        home_template (Template): Compiled home page template.
+        feed_template (Template): Compiled feed template.
+        notes (list): Sorted note objects.
+        home_content (str): Raw content of home_md.
+    """
+    extras = config.get('markdown_extras')
+    backend = config.get('markdown_backend')
+    posts = listing_posts(notes, extras, backend)
+    home_html = render_markdown(home_content, extras, backend)
+
+    pages = home_pages(config, posts)
+    for filename, page_posts, nextpage, prevpage in pages:
+        stream_page(
+            config, fragments, home_template, None, home_html, filename, page_posts,
+            nextpage, prevpage
+        )
+    stream_page(
+        config, fragments, feed_template, None, home_html, "rss.xml",
+        feed_posts(config, posts)
+    )
+
+    # Drop pages beyond the current last one
+    page_dir = path.join(config['home_path'], "page")
+    if path.isdir(page_dir):
+        for entry in scandir(page_dir):
+            if entry.is_dir() and entry.name.isdigit() and int(entry.name) > len(pages):
+                rmtree(entry.path)
+
+
+def tag_slug(tag):
+    """
+    Turns a tag into its URL path segment. Also available to templates as
+    the `slug` filter.
+
+    Args:
+        tag (str): Tag as written in the frontmatter.
+
+    Returns:
+        str: Lower-case slug, e.g. "Machine Learning" -> "machine-learning".
+    """
+    return re.sub(r"[^\w]+", "-", str(tag).strip().lower()).strip("-") or "tag"
+
+
+def archive_month(value):
+    """
+    Extracts the year and month a note is archived under.
+
+    Args:
+        value: Frontmatter date (date, datetime or "YYYY-MM-DD..." string).
+
+    Returns:
+        tuple: (year, month), or None when the date is missing or invalid.
+    """
+    if hasattr(value, 'year') and hasattr(value, 'month'):
+        return value.year, value.month
+    match = ARCHIVE_DATE.match(str(value or ''))
+    if match and 1 <= int(match.group(2)) <= 12:
+        return int(match.group(1)), int(match.group(2))
+    return None
+
+
+def group_notes(config, notes):
+    """
+    Builds the tag and month inverted indexes in one pass over the notes.
+
+    Args:
+        config (dict): Loaded site configuration; a group kind is only
+            indexed when its template is configured.
+        notes (list): Sorted note objects.
+
+    Returns:
+        dict: Output file name -> (template key, title, notes), with the
+        notes of every group still sorted.
+    """
+    by_tag = config.get('tag_template')
+    by_month = config.get('archive_template')
+    groups = {}
+    for note in notes:
+        meta = note['meta']
+        if by_tag:
+            for tag in meta_tags(meta):
+                filename = f"tags/{tag_slug(tag)}/index.html"
+                groups.setdefault(filename, ('tag_template', tag, []))[2].append(note)
+        if by_month:
+            month = archive_month(meta.get('date'))
+            if month:
+                filename = f"archive/{month[0]:04d}/{month[1]:02d}/index.html"
+                title = date(month[0], month[1], 1).strftime("%B %Y")
+                groups.setdefault(filename, ('archive_template', title, []))[2].append(note)
+    return groups
+
+
+def load_group_templates(env, config):
+    """
+    Compiles the configured tag and archive templates.
+
+    Args:
+        env (Environment): Jinja2 environment.
+        config (dict): Loaded site configuration.
+
+    Returns:
+        dict: Template key -> (compiled template, template source).
+    """
+    return {
+        key: (env.get_template(config[key]), readmd(config[key]))
+        for key in GROUP_PAGES if config.get(key)
+    }
+
+
+def write_groups(config, fragments, templates, groups, previous, force=False):
     """
-    Prints a styled message using the Rich console.
+    Renders tag and archive pages whose membership changed, and removes
+    pages of groups that no longer have any note.
 
     Args:
-        message (str): The message to display.
-        style (str): Message style ("success", "error", or "info").
+        config (dict): Loaded site configuration.
+        fragments (dict): Rendered header and footer from load_fragments().
+        templates (dict): Result of load_group_templates().
+        groups (dict): Result of group_notes().
+        previous (dict): Group page hashes recorded by the previous build.
+        force (bool): Render every group page.
+
+    Returns:
+        tuple: (group page hashes for the manifest, pages written).
     """
-    styles = {
-        "success": "bold green",
-        "error": "bold red",
-        "info": "yellow"
+    home_path = config['home_path']
+    extras = config.get('markdown_extras')
+    hashes = {}
+    written = 0
+    for filename, (key, title, members) in groups.items():
+        template, source = templates[key]
+        hashes[filename] = hash_text(source, title, index_fingerprint('', members))
+        if (
+            not force
+            and previous.get(filename) == hashes[filename]
+            and path.exists(path.join(home_path, filename))
+        ):
+            continue
+        posts = listing_posts(members, extras, config.get('markdown_backend'))
+        if stream_page(config, fragments, template, {'title': title}, "", filename, posts):
+            written += 1
+
+    # Also drops the now empty tags/<tag> or archive/<yyyy>/<mm> folders
+    for filename in sorted(previous.keys() - hashes.keys()):
+        remove_output(home_path, filename)
+    return hashes, written
+
+
+def site_base(config):
+    """
+    Returns the absolute site URL the sitemap links are built on.
+
+    Args:
+        config (dict): Loaded site configuration.
+
+    Returns:
+        str: The url setting without a trailing slash, https:// added when
+        it has no scheme.
+    """
+    url = str(config.get('url') or '').strip().rstrip("/")
+    return url if "://" in url else f"https://{url}"
+
+
+def note_lastmod(note):
+    """
+    Returns the last modification date of a note for the sitemap.
+
+    Args:
+        note (dict): Note object with frontmatter and mtime.
+
+    Returns:
+        str: "YYYY-MM-DD" from the `updated` or `date` frontmatter, or from
+        the file mtime when neither holds a valid date.
+    """
+    for key in ('updated', 'date'):
+        value = note['meta'].get(key)
+        if not value:
+            continue
+        if isinstance(value, datetime):
+            value = value.date()
+        if isinstance(value, date):
+            return value.isoformat()
+        match = SITEMAP_DATE.match(str(value))
+        if match:
+            try:
+                return date(*map(int, match.groups())).isoformat()
+            except ValueError:
+                pass
+    return datetime.fromtimestamp(note['mtime']).date().isoformat()
+
+
+def sitemap_entries(config, notes, groups):
+    """
+    Lists the sitemap URLs in a stable order: notes oldest first, then the
+    home, tag and archive pages. New notes therefore only change the last
+    shard, and an edited note only the shard it sits in.
+
+    Args:
+        config (dict): Loaded site configuration.
+        notes (list): Sorted note objects, newest first.
+        groups (dict): Result of group_notes().
+
+    Yields:
+        tuple: (URL path, "YYYY-MM-DD" last modification date, None for
+        the home page of a site without notes).
+    """
+    lastmods = [note_lastmod(note) for note in notes]
+    for note, lastmod in zip(reversed(notes), reversed(lastmods)):
+        yield note['meta']['url'], lastmod
+    by_note = dict(zip(map(id, notes), lastmods))
+
+    # A listing page changes with its newest note
+    home = home_pages(config, lastmods)
+    for number, (_filename, page_lastmods, _nextpage, _prevpage) in enumerate(home, 1):
+        yield page_url(number), max(page_lastmods, default=None)
+    for filename in sorted(groups):
+        members = groups[filename][2]
+        yield "/" + filename[:-len("index.html")], max(by_note[id(note)] for note in members)
+
+
+def sitemap_path(url):
+    """
+    Percent-encodes a URL path for the sitemap, skipping paths that are
+    already plain ASCII.
+
+    Args:
+        url (str): URL path of a page.
+
+    Returns:
+        str: Encoded path, safe to use in XML.
+    """
+    return url if SITEMAP_SAFE.fullmatch(url) else quote(url)
+
+
+def sitemap_line(tag, loc, lastmod):
+    """
+    Formats one sitemap entry.
+
+    Args:
+        tag (str): "url" in a sitemap, "sitemap" in a sitemap index.
+        loc (str): Absolute URL, escaped for XML.
+        lastmod (str): "YYYY-MM-DD" date, or None to leave it out.
+
+    Returns:
+        str: The element on its own line.
+    """
+    lastmod = f"<lastmod>{lastmod}</lastmod>" if lastmod else ""
+    return f"<{tag}><loc>{loc}</loc>{lastmod}</{tag}>\n"
+
+
+def write_xml(home_path, filename, head, lines, tail):
+    """
+    Streams an XML file line by line and replaces its previous version
+    once complete.
+
+    Args:
+        home_path (str): Output directory.
+        filename (str): Output filename.
+        head (str): Opening of the document.
+        lines (iterable): Element lines.
+        tail (str): Closing of the document.
+    """
+    output_filepath = path.join(home_path, filename)
+    tmp_file = f"{output_filepath}.{getpid()}.tmp"
+    try:
+        with open(tmp_file, 'w', encoding='utf8') as output_file:
+            output_file.write(head)
+            output_file.writelines(lines)
+            output_file.write(tail)
+        replace(tmp_file, output_filepath)
+    finally:
+        if path.exists(tmp_file):
+            remove(tmp_file)
+
+
+def write_sitemap(config, notes, groups, previous, force=False):
+    """
+    Writes sitemap.xml, split into shards of SITEMAP_LIMIT URLs listed by a
+    sitemap index when the site is larger. Shards whose entries did not
+    change are left as they are, and shards no longer needed are removed.
+
+    Args:
+        config (dict): Loaded site configuration.
+        notes (list): Sorted note objects.
+        groups (dict): Result of group_notes().
+        previous (dict): Sitemap file hashes recorded by the previous build.
+        force (bool): Write every file.
+
+    Returns:
+        tuple: (sitemap file hashes for the manifest, files written).
+    """
+    home_path = config['home_path']
+    # Paths from sitemap_path() never need escaping
+    base = str(escape(site_base(config)))
+    head = f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="{SITEMAP_XMLNS}">\n'
+    entries = sitemap_entries(config, notes, groups)
+    hashes = {}
+    shards = []
+    written = 0
+    chunk = list(islice(entries, SITEMAP_LIMIT))
+    while chunk:
+        following = list(islice(entries, SITEMAP_LIMIT))
+        if shards or following:
+            filename = f"sitemap-{len(shards) + 1}.xml"
+        else:
+            filename = SITEMAP_FILE
+        lines = [
+            sitemap_line("url", base + sitemap_path(url), lastmod) for url, lastmod in chunk
+        ]
+        hashes[filename] = hash_text(head, *lines)
+        lastmods = filter(None, (lastmod for _url, lastmod in chunk))
+        shards.append((filename, max(lastmods, default=None)))
+        if (
+            force
+            or previous.get(filename) != hashes[filename]
+            or not path.exists(path.join(home_path, filename))
+        ):
+            write_xml(home_path, filename, head, lines, "</urlset>\n")
+            written += 1
+        chunk = following
+
+    if len(shards) > 1:
+        head = (
+            f'<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<sitemapindex xmlns="{SITEMAP_XMLNS}">\n'
+        )
+        lines = [
+            sitemap_line("sitemap", f"{base}/{filename}", lastmod) for filename, lastmod in shards
+        ]
+        hashes[SITEMAP_FILE] = hash_text(head, *lines)
+        if (
+            force
+            or previous.get(SITEMAP_FILE) != hashes[SITEMAP_FILE]
+            or not path.exists(path.join(home_path, SITEMAP_FILE))
+        ):
+            write_xml(home_path, SITEMAP_FILE, head, lines, "</sitemapindex>\n")
+            written += 1
+
+    for filename in sorted(previous.keys() - hashes.keys()):
+        remove_output(home_path, filename)
+    return hashes, written
+
+
+def precompress_output(home_path):
+    """
+    Writes a maximally compressed .gz sibling for every text file in the
+    output. Files whose existing .gz is newer than the file are skipped, and
+    .gz files whose source is gone are removed. Resources keep their source
+    mtime, so sync_assets() removes the .gz of every resource it replaces.
+
+    Args:
+        home_path (str): Output directory.
+
+    Returns:
+        int: Number of files compressed.
+    """
+    compressed = 0
+    pending = [home_path]
+    while pending:
+        directory = pending.pop()
+        entries = {entry.name: entry for entry in scandir(directory)}
+        for name, entry in entries.items():
+            if entry.is_dir(follow_symlinks=False):
+                pending.append(entry.path)
+                continue
+            if name.endswith('.gz'):
+                if name[:-3].endswith(COMPRESSIBLE_EXTENSIONS) and name[:-3] not in entries:
+                    remove(entry.path)
+                continue
+            if not name.endswith(COMPRESSIBLE_EXTENSIONS):
+                continue
+            gz_entry = entries.get(name + '.gz')
+            if gz_entry is not None and (
+                gz_entry.stat().st_mtime_ns >= entry.stat().st_mtime_ns
+            ):
+                continue
+            with open(entry.path, 'rb') as source:
+                data = source.read()
+            tmp_file = f"{entry.path}.gz.{getpid()}.tmp"
+            with open(tmp_file, 'wb') as target:
+                # mtime=0 keeps the archive byte-identical across builds
+                with GzipFile(name, 'wb', 9, target, mtime=0) as gz_file:
+                    gz_file.write(data)
+            replace(tmp_file, entry.path + '.gz')
+            compressed += 1
+    return compressed
+
+
+def file_hash(filepath):
+    """
+    Hashes a file's content in chunks.
+
+    Args:
+        filepath (str): File to hash.
+
+    Returns:
+        str: Hex digest.
+    """
+    digest = sha256()
+    with open(filepath, 'rb') as source:
+        for chunk in iter(lambda: source.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fingerprint_name(name, digest):
+    """
+    Inserts a content hash before a file name's extension.
+
+    Args:
+        name (str): Relative asset path, e.g. "css/site.css".
+        digest (str): Hex digest of the content.
+
+    Returns:
+        str: Fingerprinted path, e.g. "css/site.0123456789.css".
+    """
+    stem, extension = path.splitext(name)
+    return f"{stem}.{digest[:FINGERPRINT_LENGTH]}{extension}"
+
+
+def asset_url(assets, name):
+    """
+    Resolves an asset to its published name. Available to templates as
+    asset(), e.g. `href="/{{ asset(config.get('css')) }}"`.
+
+    Args:
+        assets (dict): Fingerprinted asset names from asset_names().
+        name (str): Asset path relative to resource_path, optionally with a
+            leading "/". Optional config keys such as css may be None.
+
+    Returns:
+        str: Fingerprinted path when the asset has one, otherwise name;
+        empty when name is empty or None.
+    """
+    if not name:
+        return ""
+    prefix = "/" if name.startswith("/") else ""
+    return prefix + assets.get(name.lstrip("/"), name.lstrip("/"))
+
+
+def asset_names(entries):
+    """
+    Lists the assets published under a fingerprinted name.
+
+    Args:
+        entries (dict): Asset entries from sync_assets().
+
+    Returns:
+        dict: Relative source path -> published path, for renamed assets only.
+    """
+    return {
+        name: entry['output'] for name, entry in entries.items() if entry['output'] != name
     }
-    console.print(message, style=styles.get(style, "yellow"))
 
-def buildRynz():
+
+def place_file(source, target, mode="copy"):
     """
-    Builds the static site by converting Markdown notes into HTML pages,
-    using Jinja2 templates and configuration from config.yml.
+    Publishes a file into the output, replacing any previous version
+    atomically. Hardlinks and reflinks fall back to a copy wherever the
+    filesystem refuses them.
+
+    Args:
+        source (str): Source file.
+        target (str): Destination path.
+        mode (str): One of ASSET_LINK_MODES.
     """
-    start_time = time()
-    total_notes = 0
-    failed_notes = 0
-    skipped_notes = []
+    makedirs(path.dirname(target) or ".", exist_ok=True)
+    tmp_file = f"{target}.{getpid()}.tmp"
+    if path.lexists(tmp_file):
+        remove(tmp_file)
+    try:
+        if mode == 'hardlink':
+            link(source, tmp_file)
+        elif mode == 'reflink':
+            import fcntl
+            with open(source, 'rb') as src, open(tmp_file, 'wb') as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            copystat(source, tmp_file)
+        else:
+            copy2(source, tmp_file)
+    except (OSError, ImportError):
+        if path.lexists(tmp_file):
+            remove(tmp_file)
+        copy2(source, tmp_file)
+    replace(tmp_file, target)
 
-    console.rule("[bold green]🔨 Starting Build Process")
-    
-    def readmd(filepath):
-        """
-        Reads and returns the raw content of a markdown file.
 
-        Args:
-            filepath (str): Path to the markdown file.
+def sync_assets(config, previous):
+    """
+    Brings the static resources in home_path up to date. Files whose size
+    and mtime match the previous deploy are not even hashed; changed files
+    are copied (or linked) only if their content changed, together with
+    dropping their precompressed .gz, and outputs of resources that
+    disappeared are removed.
 
-        Returns:
-            str: File content as a string.
-        """
-        try:
-            with open(filepath, 'r', encoding='utf8', errors='ignore') as data:
-                return data.read()
-        except Exception as e:
-            print_message(f"❌ Error reading {filepath}: {e}", "error")
-            return ""
+    Args:
+        config (dict): Loaded site configuration. asset_links picks the
+            placement mode, fingerprint_assets lists extensions published
+            under content-hashed names.
+        previous (dict): Asset entries recorded by the previous deploy.
 
+    Returns:
+        tuple: (asset entries for the manifest, files placed, files removed).
+    """
+    resource_path = config['resource_path']
+    home_path = config['home_path']
+    mode = config.get('asset_links') or 'copy'
+    if mode not in ASSET_LINK_MODES:
+        raise ValueError(f"asset_links must be one of {', '.join(ASSET_LINK_MODES)}")
+    fingerprinted = tuple(
+        "." + str(extension).lstrip(".").lower()
+        for extension in config.get('fingerprint_assets') or []
+    )
 
-    def create_page(template, post_detail, md_content, filename):
-        """
-        Renders and writes a page from a Jinja2 template and given content.
-        Handles both single notes and special pages like index.html and RSS feeds.
+    entries = {}
+    placed = 0
+    pending = [resource_path] if path.isdir(resource_path) else []
+    while pending:
+        directory = pending.pop()
+        for entry in scandir(directory):
+            if entry.is_dir():
+                pending.append(entry.path)
+                continue
+            name = path.relpath(entry.path, resource_path).replace(sep, "/")
+            info = entry.stat()
+            old = previous.get(name)
+            if old and old['size'] == info.st_size and old['mtime'] == info.st_mtime_ns:
+                digest = old['hash']
+            else:
+                digest = file_hash(entry.path)
+            output = name
+            if fingerprinted and name.lower().endswith(fingerprinted):
+                output = fingerprint_name(name, digest)
 
-        Args:
-            template (str): Template filename.
-            post_detail (dict): Frontmatter details for the post.
-            md_content (str): Markdown content to render.
-            filename (str): Output filename.
+            target = path.join(home_path, output)
+            try:
+                current = old and old['hash'] == digest and old['output'] == output \
+                    and old.get('link') == mode and stat(target).st_size == info.st_size
+            except OSError:
+                current = False
+            if not current:
+                # copy2 and links keep the source mtime, which may be older
+                # than the previous version's .gz, so drop it rather than
+                # letting an mtime comparison treat it as fresh
+                if path.isfile(target + '.gz'):
+                    remove(target + '.gz')
+                place_file(entry.path, target, mode)
+                placed += 1
+            entries[name] = {
+                'size': info.st_size, 'mtime': info.st_mtime_ns, 'hash': digest,
+                'output': output, 'link': mode,
+            }
 
-        Returns:
-            str: Rendered file name or an empty string in case of error.
-        """
-        
+    removed = 0
+    outputs = {entry['output'] for entry in entries.values()}
+    for old in previous.values():
+        if old['output'] in outputs:
+            continue
+        target = path.join(home_path, old['output'])
+        for stale in (target, target + '.gz'):
+            if path.isfile(stale):
+                remove(stale)
+        removed += 1
         try:
-            env = Environment(loader=FileSystemLoader(searchpath='./'))
-            template_obj = env.get_template(template)
-
-            # Initialize variables
-            post_title = ""
-            post_subtitle = ""
-            post_date = ""
-            post_meta = ""
-            posts_list = ""
-            last_date = ""
-            post_data = filename.split(sep)
-            post_path = home_path
-			
-            # Determine post details based on the filename
-            if filename == "index.html":
-                post_file = filename
-                posts_list = posts
-            elif filename.endswith(".xml"):
-                post_file = filename
-                posts_list = posts
-                last_date = posts_list[0].get('date')
-            elif post_detail is None:
-                post_file = filename.replace('.md', '.html')
-            else:
-                post_title = post_detail.get("title", "")
-                post_subtitle = post_detail.get("subtitle", "")
-                post_date = post_detail.get("date", "")
-                post_meta = post_detail.get("meta", "")
-                post_data = filename.split(sep)
-                post_path = path.join(home_path)
-                post_file = post_data[2].replace('.md', '.html')
-                post_data = post_data[1]
-                makedirs(post_path, exist_ok=True)
-
-            output_filepath = path.join(post_path, post_file)
-            with open(output_filepath, 'w', encoding='utf8', errors='ignore') as output_file:
-                output_file.write(
-                    template_obj.render(
-                        title=title,
-                        post_title=post_title,
-                        post_subtitle=post_subtitle,
-                        date=post_date,
-                        metad=post_meta,
-                        url=path.join(url, post_file),
-                        article=markdown(md_content),
-                        posts=posts_list,
-                        home=home_md,
-                        header=markdown(readmd(header_md)),
-                        footer=markdown(readmd(footer_md)),
-                        last_date=last_date,
-                        config=config
-                    )
-                )
-            return post_file
-        except Exception as e:
-            print_message(f"❌ Error creating page {filename}: {e}", "error")
-            return ""
-    
+            removedirs(path.dirname(target))
+        except OSError:
+            pass
+    return entries, placed, removed
+
+
+# Per-process build state, prepared by init_worker()
+_worker = {}
+
+# Below this many notes a process pool costs more than it saves
+PARALLEL_MIN_NOTES = 64
+
+
+def stage_output(home_path):
+    """
+    Prepares the staging directory an atomic deploy builds into. The
+    current output is mirrored with hardlinks, so the build stays
+    incremental without copying anything. Every output is written to a
+    temporary file and renamed into place, which breaks the link, so the
+    live files are never modified.
+
+    Args:
+        home_path (str): Output directory.
+
+    Returns:
+        str: Staging directory, next to home_path.
+    """
+    live = path.realpath(home_path)
+    staging = live + STAGING_SUFFIX
+    # Leftovers of an interrupted deploy
+    for leftover in (staging, live + RETIRED_SUFFIX):
+        if path.lexists(leftover):
+            rmtree(leftover)
+
+    makedirs(staging)
+    if not path.isdir(live):
+        return staging
+    pending = [(live, staging)]
+    while pending:
+        source_dir, target_dir = pending.pop()
+        with scandir(source_dir) as entries:
+            for entry in entries:
+                target = path.join(target_dir, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    makedirs(target)
+                    copystat(entry.path, target)
+                    pending.append((entry.path, target))
+                    continue
+                try:
+                    link(entry.path, target, follow_symlinks=False)
+                except OSError:
+                    copy2(entry.path, target, follow_symlinks=False)
+    return staging
+
+
+def exchange_paths(first, second):
+    """
+    Swaps two directories in one atomic step with renameat2().
+
+    Args:
+        first (str): Existing path.
+        second (str): Existing path.
+
+    Returns:
+        bool: Whether the paths were swapped. False where the platform or
+        filesystem does not support it.
+    """
+    if not sys.platform.startswith("linux"):
+        return False
     try:
-        # Load configuration
-        with open('config.yml', encoding='utf8', errors='ignore') as conf_file:
-            config = safe_load(conf_file.read())
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        renameat2 = libc.renameat2
+    except (OSError, AttributeError):
+        return False
+    renameat2.argtypes = [
+        ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint
+    ]
+    return renameat2(
+        AT_FDCWD, fsencode(first), AT_FDCWD, fsencode(second), RENAME_EXCHANGE
+    ) == 0
+
+
+def swap_output(staging, home_path):
+    """
+    Puts a finished staging directory in place of home_path and removes
+    the previous output. Where renameat2() is available the swap is
+    atomic; elsewhere home_path is missing only between two renames.
+
+    Args:
+        staging (str): Directory from stage_output().
+        home_path (str): Output directory.
+    """
+    live = path.realpath(home_path)
+    if not path.isdir(live):
+        rename(staging, live)
+        return
+    if exchange_paths(staging, live):
+        rmtree(staging)
+        return
+    retired = live + RETIRED_SUFFIX
+    rename(live, retired)
+    rename(staging, live)
+    rmtree(retired)
+
+
+def init_worker(config, profile=False, assets=None):
+    """
+    Prepares the note template and shared fragments once per build process.
+
+    Args:
+        config (dict): Loaded site configuration.
+        profile (bool): Time the phases of every note.
+        assets (dict): Fingerprinted asset names for asset().
+    """
+    env = make_environment(assets)
+    _worker['config'] = config
+    _worker['profile'] = profile
+    _worker['template'] = env.get_template(config['note_template'])
+    _worker['fragments'] = load_fragments(config)
+
+
+def build_note(note_path, previous_hash, site_changed, mtime=None):
+    """
+    Loads a note and renders its page unless its output is already current.
+    Runs inside a build process set up by init_worker().
+
+    Args:
+        note_path (str): Path to the source Markdown note.
+        previous_hash (str): Note hash recorded by the previous deploy.
+        site_changed (bool): Whether shared inputs changed since then.
+        mtime (float): Modification time from discover_notes(), if known.
+
+    Returns:
+        dict: The note object from load_note() plus 'status' ("built",
+        "unchanged", "skipped" or "failed"), 'output', 'error' and
+        'timings' (phase seconds when profiling, else None). 'body' and
+        'html' are dropped once the page is written, so a build only keeps
+        lightweight metadata of every note.
+    """
+    config = _worker['config']
+    timings = {} if _worker.get('profile') else None
+    result = {
+        'path': note_path, 'hash': '', 'meta': None, 'body': '', 'html': None,
+        'timings': timings,
+    }
+    try:
+        result.update(load_note(note_path, config.get('fast_frontmatter'), timings, mtime))
+        if result['meta'] is None:
+            result.update(status='skipped', output='', error='', body=None)
+            return result
+
+        post_url = note_output(config, note_path)
+        if (
+            not site_changed
+            and previous_hash == result['hash']
+            and path.exists(path.join(config['home_path'], post_url))
+        ):
+            status = 'unchanged'
+        else:
+            # Build the note page
+            post_url = create_page(
+                config, _worker['fragments'], _worker['template'], result['meta'],
+                note_html(
+                    result, config.get('markdown_extras'), timings,
+                    config.get('markdown_backend')
+                ), note_path,
+                timings=timings
+            )
+            if not post_url:
+                raise RuntimeError(f"Could not render {note_path}")
+            status = 'built'
+
+        result['meta'].update({'url': '/' + post_url})
+        result.update(status=status, output=post_url, error='')
+    except Exception:
+        result.update(status='failed', output='', error=format_exc())
+    result.update(body=None, html=None)
+    return result
+
+
+def run_notes(config, note_paths, previous_hashes, site_changed, jobs=None, profile=False,
+              assets=None, mtimes=None):
+    """
+    Builds every note and yields the results in the order of note_paths,
+    so parallel builds produce exactly the same site as serial ones.
+
+    Args:
+        config (dict): Loaded site configuration.
+        note_paths (list): Source Markdown notes.
+        previous_hashes (list): Hash of each note from the previous deploy.
+        site_changed (bool): Whether shared inputs changed since then.
+        jobs (int): Number of build processes, defaults to the CPU count.
+        profile (bool): Time the phases of every note.
+        assets (dict): Fingerprinted asset names for asset().
+        mtimes (list): Modification time of each note, if known.
+
+    Yields:
+        dict: Result of build_note() for each note.
+    """
+    jobs = jobs or cpu_count() or 1
+    flags = repeat(site_changed)
+    mtimes = repeat(None) if mtimes is None else mtimes
+    if jobs > 1 and len(note_paths) >= PARALLEL_MIN_NOTES:
+        chunksize = max(1, len(note_paths) // (jobs * 8))
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=init_worker, initargs=(config, profile, assets)
+        ) as pool:
+            yield from pool.map(
+                build_note, note_paths, previous_hashes, flags, mtimes, chunksize=chunksize
+            )
+    else:
+        init_worker(config, profile, assets)
+        yield from map(build_note, note_paths, previous_hashes, flags, mtimes)
+
+
+def note_entry(result, info):
+    """
+    Returns the manifest entry of a built note.
+
+    Args:
+        result (dict): Result of build_note().
+        info (os.stat_result): Stat of the source taken before it was read.
+
+    Returns:
+        dict: 'hash', 'output', the (mtime_ns, size) signature of the
+        source and its raw frontmatter.
+    """
+    return {
+        'hash': result['hash'], 'output': result['output'],
+        'mtime': info.st_mtime_ns, 'size': info.st_size,
+        'frontmatter': result['frontmatter'],
+    }
+
+
+def unchanged_note(config, note_path, entry, info):
+    """
+    Rebuilds the note object of a note whose source and page are unchanged
+    since the previous deploy from its manifest entry, without reading the
+    note.
+
+    Args:
+        config (dict): Loaded site configuration.
+        note_path (str): Source path.
+        entry (dict): Manifest entry of the note, or None.
+        info (os.stat_result): Current stat of the source.
+
+    Returns:
+        dict: Result as returned by build_note() with status "unchanged",
+        or None when the note has to be built.
+    """
+    if (
+        not entry or not entry.get('hash') or 'frontmatter' not in entry
+        or entry.get('mtime') != info.st_mtime_ns or entry.get('size') != info.st_size
+        or not path.exists(path.join(config['home_path'], entry['output']))
+    ):
+        return None
+    meta = parse_frontmatter(entry['frontmatter'], config.get('fast_frontmatter'))
+    meta.update({'url': '/' + entry['output']})
+    return {
+        'path': note_path, 'mtime': info.st_mtime, 'hash': entry['hash'],
+        'frontmatter': entry['frontmatter'], 'meta': meta, 'body': None, 'html': None,
+        'timings': None, 'status': 'unchanged', 'output': entry['output'], 'error': '',
+    }
+
+
+def update_note_index(notes, keep=()):
+    """
+    Records note metadata in the SQLite note index. A broken index only
+    produces a warning, since the site itself was built.
+
+    Args:
+        notes (iterable): Every built note of the site.
+        keep (iterable): Note paths whose index rows stay as they are.
+    """
+    try:
+        changes = notedb.sync_notes(notes, keep)
+        if changes:
+            print_message(f"✔ Indexed {changes} notes", "success")
+    except SQLiteError as error:
+        print_message(f"⚠️ Could not update note index: {error}", "warning")
 
-        # Set config values as globals
-        for key, val in config.items():
-            globals()[key] = val
+
+def buildRynz(force=False, precompile=False, jobs=None, profile=False, top=10):
+    """
+    Builds the static site by converting Markdown notes into HTML pages,
+    using Jinja2 templates and configuration from config.yml.
+
+    Only notes whose content, or whose shared inputs (config, templates,
+    header and footer), changed since the last deploy are re-rendered.
+    Notes whose (mtime, size) did not change are not even read.
+    index.html and rss.xml are rebuilt only when the post list changed.
+
+    Unless atomic_deploy is false in the config, the site is built in a
+    staging directory and swapped into home_path once the build succeeds,
+    so a failed build leaves the previous output untouched.
+
+    Args:
+        force (bool): Ignore the build manifest and rebuild everything.
+        precompile (bool): Compile all project templates into the bytecode
+            cache before building.
+        jobs (int): Number of processes rendering notes, defaults to the
+            CPU count.
+        profile (bool): Time every build phase and every note, then print
+            the report and save it to profiler.PROFILE_FILE.
+        top (int): Number of slowest notes listed in the profile.
+
+    Returns:
+        dict: Build state used by apply_changes() for watch mode, or None
+        if the build failed.
+    """
+    start_time = time()
+    phases = {} if profile else None
+    note_timings = []
+    start = perf_counter()
+    total_notes = 0
+    unchanged_notes = 0
+    failed_notes = 0
+    skipped_notes = []
+    removed_notes = []
+    failed_paths = []
+    staging = None
+
+    if _output['verbosity'] >= NORMAL:
+        console.rule("[bold green]🔨 Starting Build Process")
+    open_log()
+
+    try:
+        # Load configuration
+        config_text = readmd('config.yml')
+        config = safe_load(config_text)
 
         # Ensure all required configuration keys are present
-        required_keys = [
-            'home_path', 'resource_path', 'content_path', 'note_template',
-            'home_template', 'feed_template', 'home_md', 'header_md',
-            'footer_md', 'title', 'url'
-        ]
-        for key in required_keys:
+        for key in REQUIRED_KEYS:
             if key not in config:
                 print_message(f"❌ Missing config key: {key}", "error")
                 return
+        try:
+            markdown_version(config)
+        except ValueError as e:
+            print_message(f"❌ {e}", "error")
+            return
 
-        # Reset output directory
-        if path.exists(home_path):
-            rmtree(home_path)
-        copytree(resource_path, home_path)
+        manifest = load_manifest()
+        old_notes = manifest.get('notes', {})
+        start = lap(phases, "config", start)
 
-        posts = []
+        # Build into a staging copy of the output, swapped in at the end
+        live_config = config
+        if config.get('atomic_deploy', True):
+            staging = stage_output(config['home_path'])
+            config = dict(config, home_path=staging)
+            start = lap(phases, "stage", start)
+        home_path = config['home_path']
 
-        # Process each note
-        for note_path in glob(path.join(content_path, "note", "*.md")):
-            try:
-                yaml_lines = []
-                frontmatter, markdown_content = '', ''
-
-                # Read frontmatter and body
-                with open(note_path, encoding='utf8', errors='ignore') as infile:
-                    for line in infile:
-                        if line.startswith('---'):
-                            for line in infile:
-                                if line.startswith('---'):
-                                    break
-                                yaml_lines.append(line)
-                            frontmatter = ''.join(yaml_lines)
-                            markdown_content = ''.join(infile)
-                            break
-
-                post_detail = safe_load(frontmatter)
-
-                if post_detail is not None:
-                    # Build the note page
-                    post_url = create_page(
-                        note_template, post_detail, markdown_content, note_path
-                    )
-
-                    # Add to posts list for homepage/rss
-                    post_entry = post_detail
-                    post_entry.update({'url': '/' + post_url})
-                    post_entry.update({'note': markdown(markdown_content)})
-                    posts.append(post_entry)
-
-                    total_notes += 1
-                    print_message(f"✔ Built: {post_url}", "success")
-                else:
+        # Sync static resources into the output, touching only changed files
+        asset_entries, placed, removed = sync_assets(config, manifest.get('assets', {}))
+        assets = asset_names(asset_entries)
+        if placed or removed:
+            print_message(f"✔ Synced assets: {placed} updated, {removed} removed", "success")
+        start = lap(phases, "assets", start)
+
+        site_hash = site_fingerprint(config, config_text, assets)
+        site_changed = force or manifest.get('site') != site_hash
+        new_manifest = {
+            'version': MANIFEST_VERSION, 'site': site_hash, 'index': '', 'notes': {},
+            'assets': asset_entries,
+        }
+
+        # Compile templates once for the whole build
+        env = make_environment(assets)
+        if precompile:
+            compiled = precompile_templates(env, config)
+            print_message(f"✔ Precompiled {compiled} templates", "success")
+        home_template = env.get_template(config['home_template'])
+        feed_template = env.get_template(config['feed_template'])
+        group_templates = load_group_templates(env, config)
+        fragments = load_fragments(config)
+        start = lap(phases, "templates", start)
+
+        notes = []
+        discovered = discover_notes(config)
+        note_paths = list(discovered)
+        unchanged = {}
+        if not site_changed:
+            for note_path, info in discovered.items():
+                result = unchanged_note(config, note_path, old_notes.get(note_path), info)
+                if result is not None:
+                    unchanged[note_path] = result
+        build_paths = [note_path for note_path in note_paths if note_path not in unchanged]
+        previous_hashes = [old_notes.get(note_path, {}).get('hash') for note_path in build_paths]
+        mtimes = [discovered[note_path].st_mtime for note_path in build_paths]
+        start = lap(phases, "discovery", start)
+
+        # Process each note, in parallel when the site is large enough
+        built = run_notes(
+            config, build_paths, previous_hashes, site_changed, jobs, profile, assets, mtimes
+        )
+        with note_progress() as progress:
+            task = progress.add_task("Building notes", total=len(note_paths))
+            for note_path in note_paths:
+                # Results stay in discovery order, like a full build
+                result = unchanged[note_path] if note_path in unchanged else next(built)
+                progress.advance(task)
+                if result['timings'] is not None:
+                    note_timings.append((note_path, result['timings']))
+                if result['status'] == 'failed':
+                    failed_notes += 1
+                    failed_paths.append(note_path)
+                    print_message(f"❌ Error in: {note_path}", "error", detail=result['error'])
+                    # Keep the stale entry so the note is retried next deploy
+                    if note_path in old_notes:
+                        new_manifest['notes'][note_path] = dict(old_notes[note_path], hash='')
+                    continue
+                if result['status'] == 'skipped':
                     # If no valid frontmatter found
                     skipped_notes.append(note_path)
-                    print_message(f"⚠️ Skipped: No frontmatter in {note_path}", "info")
-            except Exception:
-                failed_notes += 1
-                print_message(f"❌ Error in: {note_path}", "error")
-                console.print_exception()
+                    print_message(f"⚠️ Skipped: No frontmatter in {note_path}", "warning")
+                    continue
+
+                if result['status'] == 'unchanged':
+                    unchanged_notes += 1
+                else:
+                    print_message(f"✔ Built: {result['output']}", "success", VERBOSE)
+                new_manifest['notes'][note_path] = note_entry(result, discovered[note_path])
+
+                # Add to posts list for homepage/rss
+                notes.append(result)
+                total_notes += 1
+        start = lap(phases, "notes", start)
+
+        # Remove output of notes that no longer exist
+        for note_path, entry in old_notes.items():
+            if note_path in new_manifest['notes']:
+                continue
+            if entry.get('output'):
+                remove_output(home_path, entry['output'])
+            removed_notes.append(note_path)
+            print_message(f"🗑 Removed: {entry.get('output')}", "info", VERBOSE)
 
         # Sort posts by latest date
-        posts = sorted(posts, key=lambda post: post.get('date', ''), reverse=True)
+        notes = sort_notes(notes)
+        start = lap(phases, "cleanup", start)
+
+        # Build index.html and RSS feed only when the post list changed
+        home_content = readmd(config['home_md'])
+        index_hash = index_fingerprint(home_content, notes)
+        new_manifest['index'] = index_hash
+        index_outputs = [path.join(home_path, name) for name in ("index.html", "rss.xml")]
+        if (
+            site_changed
+            or manifest.get('index') != index_hash
+            or not all(path.exists(output) for output in index_outputs)
+        ):
+            write_index(config, fragments, home_template, feed_template, notes, home_content)
+            print_message("✔ Built: index.html, rss.xml", "success")
+        start = lap(phases, "index/feed", start)
+
+        # Tag and archive pages whose membership changed
+        groups = group_notes(config, notes)
+        new_manifest['groups'], written = write_groups(
+            config, fragments, group_templates, groups, manifest.get('groups', {}),
+            site_changed
+        )
+        if written:
+            print_message(f"✔ Built: {written} tag and archive pages", "success")
+        start = lap(phases, "tags/archive", start)
 
-        # Build index.html and RSS feed
-        create_page(home_template, None, readmd(home_md), "index.html")
-        create_page(feed_template, None, readmd(home_md), "rss.xml")
+        # Sitemap shards whose entries changed
+        if config.get('sitemap'):
+            new_manifest['sitemap'], written = write_sitemap(
+                config, notes, groups, manifest.get('sitemap', {}), force
+            )
+            if written:
+                print_message(f"✔ Built: {written} sitemap files", "success")
+            start = lap(phases, "sitemap", start)
+        else:
+            for filename in manifest.get('sitemap', {}):
+                remove_output(home_path, filename)
+
+        if config.get('precompress'):
+            compressed = precompress_output(home_path)
+            print_message(f"✔ Precompressed {compressed} files", "success")
+            start = lap(phases, "precompress", start)
+
+        if staging is not None:
+            swap_output(staging, live_config['home_path'])
+            staging = None
+            start = lap(phases, "swap", start)
+
+        save_manifest(new_manifest)
+        update_note_index(notes, failed_paths)
+        lap(phases, "manifest", start)
 
         # Build summary table
-        console.rule("[bold cyan]✅ Build Summary")
-        summary = Table(show_header=True, header_style="bold magenta")
-        summary.add_column("Metric")
-        summary.add_column("Count", justify="right")
-        summary.add_row("Notes Processed", str(total_notes))
-        summary.add_row("Skipped Notes", str(len(skipped_notes)))
-        summary.add_row("Failed Notes", str(failed_notes))
-        summary.add_row("Time Taken (s)", f"{(time() - start_time):.2f}")
-        console.print(summary)
+        if _output['verbosity'] >= NORMAL:
+            console.rule("[bold cyan]✅ Build Summary")
+            summary = Table(show_header=True, header_style="bold magenta")
+            summary.add_column("Metric")
+            summary.add_column("Count", justify="right")
+            summary.add_row("Notes Processed", str(total_notes))
+            summary.add_row("Unchanged Notes", str(unchanged_notes))
+            summary.add_row("Removed Notes", str(len(removed_notes)))
+            summary.add_row("Skipped Notes", str(len(skipped_notes)))
+            summary.add_row("Failed Notes", str(failed_notes))
+            summary.add_row("Time Taken (s)", f"{(time() - start_time):.2f}")
+            console.print(summary)
+
+        if profile:
+            report = profiler.build_report(phases, time() - start_time, note_timings, top)
+            profiler.print_report(report)
+            profiler.save_report(report)
+            print_message(f"✔ Profile saved to {profiler.PROFILE_FILE}", "success")
+
+        return {
+            'config': live_config,
+            'fragments': fragments,
+            'home_template': home_template,
+            'feed_template': feed_template,
+            'group_templates': group_templates,
+            'notes': {note['path']: note for note in notes},
+            'manifest': new_manifest,
+        }
 
     except Exception:
         console.print(Panel(
@@ -239,4 +2084,164 @@ def buildRynz():
             "[italic]Make sure you're inside a valid Rynz directory.[/italic]",
             title="❌ Build Failed"
         ))
-        console.print_exception()
\ No newline at end of file
+        console.print_exception()
+        if staging is not None and path.exists(staging):
+            rmtree(staging, ignore_errors=True)
+            print_message("⚠️ Previous output kept unchanged.", "warning")
+        return None
+
+    finally:
+        close_log()
+
+
+def watch_targets(config):
+    """
+    Lists what `rynz serve --watch` monitors for a site.
+
+    Args:
+        config (dict): Loaded site configuration.
+
+    Returns:
+        tuple: (directories watched recursively, individual files).
+    """
+    roots = [config['content_path'], config['resource_path']]
+    files = ['config.yml']
+    for key in ('note_template', 'home_template', 'feed_template', *GROUP_PAGES):
+        if not config.get(key):
+            continue
+        template_dir = path.dirname(config[key])
+        if template_dir in ('', '.'):
+            files.append(config[key])
+        else:
+            roots.append(template_dir)
+    return roots, files
+
+
+def apply_changes(state, changed, jobs=None):
+    """
+    Brings the output up to date after files changed in watch mode.
+
+    An edited note re-renders only that note plus index.html and rss.xml,
+    and a note folder that was deleted or moved away removes the notes it
+    held. Static resources are synced on their own unless a fingerprinted
+    name changed. Anything else (config, templates, header, footer) falls
+    back to an incremental buildRynz().
+
+    Args:
+        state (dict): Build state returned by buildRynz() or apply_changes().
+        changed (set): Normalised paths that changed.
+        jobs (int): Processes for a fallback full build.
+
+    Returns:
+        dict: Updated build state, or None if a fallback build failed.
+    """
+    if state is None:
+        return buildRynz(jobs=jobs)
+
+    config = state['config']
+    home_path = config['home_path']
+    resource_dir = path.normpath(config['resource_path'])
+    home_md = path.normpath(config['home_md'])
+    note_root = note_dir(config)
+
+    # The watcher reports a folder that went away, not each note in it
+    changed = set(changed)
+    for filepath in list(changed):
+        if (filepath == note_root or filepath.startswith(note_root + sep)) \
+                and not path.exists(filepath):
+            changed.update(
+                note_path for note_path in state['manifest']['notes']
+                if note_path.startswith(filepath + sep)
+            )
+
+    note_changes = sorted(filepath for filepath in changed if is_note(config, filepath))
+    resource_changes = sorted(
+        filepath for filepath in changed
+        if filepath.startswith(resource_dir + sep)
+    )
+    content_dir = path.normpath(config['content_path'])
+    # Editor swap and backup files inside content are not sources, and
+    # neither are excluded files in the note folder
+    ignored = {
+        filepath for filepath in changed
+        if filepath.startswith(content_dir + sep) and not filepath.endswith('.md')
+        or filepath.startswith(note_root + sep) and filepath not in note_changes
+    }
+    others = set(changed) - set(note_changes) - set(resource_changes) - ignored - {home_md}
+    if others:
+        return buildRynz(jobs=jobs)
+
+    start_time = time()
+    manifest = state['manifest']
+    assets = asset_names(manifest.get('assets', {}))
+    if resource_changes:
+        entries, placed, removed = sync_assets(config, manifest.get('assets', {}))
+        manifest['assets'] = entries
+        if asset_names(entries) != assets:
+            # Pages embed fingerprinted names through asset()
+            return buildRynz(jobs=jobs)
+        print_message(f"✔ Synced assets: {placed} updated, {removed} removed", "success")
+
+    if _worker.get('config') is not config:
+        init_worker(config, assets=assets)
+    for note_path in note_changes:
+        previous = manifest['notes'].get(note_path)
+        try:
+            info = stat(note_path)
+        except OSError:
+            info = None
+        if info is None or not path.isfile(note_path):
+            manifest['notes'].pop(note_path, None)
+            state['notes'].pop(note_path, None)
+            if previous and previous['output']:
+                remove_output(home_path, previous['output'])
+            print_message(f"🗑 Removed: {note_path}", "info")
+            continue
+
+        result = build_note(note_path, None, True)
+        if result['status'] == 'failed':
+            # Keep serving the last good page until the note is fixed
+            print_message(f"❌ Error in: {note_path}", "error", detail=result['error'])
+            if previous:
+                manifest['notes'][note_path] = dict(previous, hash='')
+        elif result['status'] == 'skipped':
+            manifest['notes'].pop(note_path, None)
+            state['notes'].pop(note_path, None)
+            if previous and previous['output']:
+                remove_output(home_path, previous['output'])
+            print_message(f"⚠️ Skipped: No frontmatter in {note_path}", "warning")
+        else:
+            manifest['notes'][note_path] = note_entry(result, info)
+            state['notes'][note_path] = result
+            print_message(f"✔ Built: {result['output']}", "success")
+
+    if note_changes or home_md in changed:
+        notes = sort_notes(state['notes'].values())
+        home_content = readmd(config['home_md'])
+        write_index(
+            config, state['fragments'], state['home_template'],
+            state['feed_template'], notes, home_content
+        )
+        manifest['index'] = index_fingerprint(home_content, notes)
+        print_message("✔ Built: index.html, rss.xml", "success")
+    if note_changes:
+        groups = group_notes(config, notes)
+        manifest['groups'], written = write_groups(
+            config, state['fragments'], state['group_templates'], groups,
+            manifest.get('groups', {})
+        )
+        if written:
+            print_message(f"✔ Built: {written} tag and archive pages", "success")
+        if config.get('sitemap'):
+            manifest['sitemap'], written = write_sitemap(
+                config, notes, groups, manifest.get('sitemap', {})
+            )
+            if written:
+                print_message(f"✔ Built: {written} sitemap files", "success")
+    if config.get('precompress'):
+        precompress_output(home_path)
+    save_manifest(manifest)
+    update_note_index(state['notes'].values())
+
+    print_message(f"⚡ Rebuilt in {(time() - start_time):.2f}s", "success")
+    return state
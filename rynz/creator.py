@@ -8,7 +8,7 @@
 #       ██║ ╚████║██║██║  ██║██║  ██║██║  ██║███████║
 #       ╚═╝  ╚═══╝╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
 #       DRAFTED BY [https://nih.ar] ON 18-04-2021.
-#       SOURCE [creator.py] LAST MODIFIED ON 29-04-2025.
+#       SOURCE [creator.py] LAST MODIFIED ON 18-10-2026.
 #
 
 from os import mkdir, path, makedirs
@@ -129,6 +129,19 @@ header_md: content/header.md
 footer_md: content/footer.md
 
 # Optional Configuration
+tag_template: template/list_template.html
+archive_template: template/list_template.html
+search_template: template/search_template.html
+sitemap: true
+# posts_per_page: 20
+# feed_limit: 20
+# feed_content: summary
+# asset_links: hardlink
+# fingerprint_assets: [css, js]
+# atomic_deploy: false
+# note_include: ["*.md"]
+# note_exclude: ["drafts/*"]
+# markdown_backend: markdown2
 site-title: {title}
 css: demo.css
 desc: Write anything that human and machine can understand.
@@ -173,7 +186,7 @@ home_template_content = """
 <meta name="viewport" content="width=device-width, initial-scale=1">
 <meta name="description" content=" {{ config.get('desc') }} ">
 <title>{{ config.get('site-title') }}</title>
-<link rel="stylesheet" href="{{ config.get('css') }}">
+<link rel="stylesheet" href="/{{ asset(config.get('css')) }}">
 <link rel="alternate" type="application/atom+xml" title="Recent blog posts" href="/rss.xml">
 </head>
 <body>
@@ -189,6 +202,7 @@ home_template_content = """
     <li>{{ post.date.strftime('%d %m %Y') }} ; <a href="{{ post.url }}">{{ post.title | lower }}</a></li>
   {% endif %}
 {% endfor %}
+{% if prevpage %} <a href="{{ prevpage }}"><< Newer Notes</a> {% endif %}
 {% if nextpage %} <a href="{{ nextpage }}">Older Notes >> </a> {% endif %}
 </ul>
 </section>
@@ -209,7 +223,7 @@ note_template_content = """
 <meta http-equiv="X-UA-Compatible" content="IE=edge">
 <meta name="viewport" content="width=device-width, initial-scale=1">
 <meta name="description" content=" {{ post_subtitle }} ">
-<link rel="stylesheet" href="{{ config.get('css') }}">
+<link rel="stylesheet" href="/{{ asset(config.get('css')) }}">
 <link rel="alternate" type="application/atom+xml" title="Recent blog posts" href="/rss.xml">
 </head>
 <body>
@@ -262,6 +276,88 @@ feed_template_content = """
 </rss>
 """
 
+# Template: Tag and Archive Listing
+list_template_content = """
+<!DOCTYPE html>
+<html lang="en-IN" data-theme="dark">
+<head>
+<meta charset="utf-8">
+<meta http-equiv="X-UA-Compatible" content="IE=edge">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<meta name="description" content=" {{ config.get('desc') }} ">
+<title>{{ post_title }} - {{ config.get('site-title') }}</title>
+<link rel="stylesheet" href="/{{ asset(config.get('css')) }}">
+<link rel="alternate" type="application/atom+xml" title="Recent blog posts" href="/rss.xml">
+</head>
+<body>
+<header>
+<h1><a href="/">{{ title | lower }}</a></h1>
+{{ header }}
+</header>
+<section>
+<h2>{{ post_title }}</h2>
+<ul>
+{% for post in posts %}
+    <li>{{ post.date.strftime('%d %m %Y') }} ; <a href="{{ post.url }}">{{ post.title | lower }}</a>
+    {% for tag in post.tags %} <a href="/tags/{{ tag | slug }}/">#{{ tag }}</a>{% endfor %}</li>
+{% endfor %}
+</ul>
+</section>
+<footer>
+{{ footer }}
+</footer>
+</body>
+</html>
+"""
+
+# Template: Search Results, rendered by `rynz serve` at /search?q=
+search_template_content = """
+<!DOCTYPE html>
+<html lang="en-IN" data-theme="dark">
+<head>
+<meta charset="utf-8">
+<meta http-equiv="X-UA-Compatible" content="IE=edge">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<meta name="robots" content="noindex">
+<title>{{ post_title }} - {{ config.get('site-title') }}</title>
+<link rel="stylesheet" href="/{{ asset(config.get('css')) }}">
+</head>
+<body>
+<header>
+<h1><a href="/">{{ title | lower }}</a></h1>
+{{ header }}
+</header>
+<section>
+<form action="/search" method="get">
+<input type="search" name="q" value="{{ query }}" placeholder="words or &quot;a phrase&quot;" autofocus>
+<button type="submit">Search</button>
+</form>
+{% if query %}
+<p>{{ total }} notes found.</p>
+{% endif %}
+<ul>
+{% for post in posts %}
+    <li>{{ post.date.strftime('%d %m %Y') }} ; <a href="{{ post.url }}">{{ post.title | lower }}</a>
+    <p>{{ post.snippet }}</p></li>
+{% endfor %}
+</ul>
+{% if prevpage %} <a href="{{ prevpage }}"><< Previous</a> {% endif %}
+{% if nextpage %} <a href="{{ nextpage }}">Next >> </a> {% endif %}
+</section>
+<footer>
+{{ footer }}
+</footer>
+</body>
+</html>
+"""
+
+# Stylesheet: static/demo.css
+demo_css_content = """
+body { max-width: 42rem; margin: 0 auto; padding: 1rem; font-family: sans-serif; line-height: 1.6; }
+a { color: inherit; }
+mark { padding: 0 .1em; }
+"""
+
 # Create content/header/footer/note   
 def createContent(rynzName):
     """
@@ -317,13 +413,12 @@ def createNote(noteName, rynzName=''):
     try:
         note_dir = path.join(rynzName, 'content', 'note')
 
-        # Ensure the directory exists
-        if not path.exists(note_dir):
-            makedirs(note_dir)
-
         if not noteName.lower().endswith('.md'):
             noteName += '.md'
 
+        # Ensure the directory exists, including subfolders in the name
+        makedirs(path.dirname(path.join(note_dir, noteName)), exist_ok=True)
+
         with open(path.join(note_dir, noteName), 'w') as f:
             conf_data = (
                 """---
@@ -377,6 +472,21 @@ Sample paragraph is written like this with lorem ipsum. Lorem ipsum dolor sit am
         )
 
 
+def createStatic(rynzName):
+    """
+    Creates the stylesheet named by `css` in the default config.
+
+    Args:
+        rynzName (str): The name of the project directory.
+    """
+    try:
+        with open(path.join(rynzName, 'static', 'demo.css'), 'w') as f:
+            f.write(demo_css_content)
+            print_message("demo.css created.", "success", timestamp=True)
+    except Exception as e:
+        print_message(f"❌ Error creating demo.css: {e}", "error", timestamp=True)
+
+
 def createRynz(rynzName):
     """
     Initializes a Rynz project with all necessary directories and files.
@@ -395,7 +505,10 @@ def createRynz(rynzName):
         createTemplate(rynzName, 'home_template.html', home_template_content)
         createTemplate(rynzName, 'note_template.html', note_template_content)
         createTemplate(rynzName, 'feed_template.xml', feed_template_content)
+        createTemplate(rynzName, 'list_template.html', list_template_content)
+        createTemplate(rynzName, 'search_template.html', search_template_content)
         createContent(rynzName)
+        createStatic(rynzName)
 
         print_message(
             f"Rynz project {rynzName} created successfully!", "success",
@@ -0,0 +1,185 @@
+#!/bin/python3
+
+#
+#       ███╗   ██╗██╗██╗  ██╗ █████╗ ██████╗ ███████╗
+#       ████╗  ██║██║██║  ██║██╔══██╗██╔══██╗██╔════╝
+#       ██╔██╗ ██║██║███████║███████║██████╔╝███████╗
+#       ██║╚██╗██║██║██╔══██║██╔══██║██╔══██╗╚════██║
+#       ██║ ╚████║██║██║  ██║██║  ██║██║  ██║███████║
+#       ╚═╝  ╚═══╝╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
+#       DRAFTED BY [https://nih.ar] ON 18-10-2026.
+#       SOURCE [frontmatter.py] LAST MODIFIED ON 18-10-2026.
+#
+
+"""
+Frontmatter extraction for rynz notes.
+
+A note is read with a single buffered read and its `---` fences are found
+with string search. The YAML block is parsed with libyaml's CSafeLoader
+when PyYAML was built with it. Flat `key: value` frontmatter can
+optionally skip YAML entirely. Anything the fast path does not fully
+understand falls back to YAML, so results are always identical.
+"""
+
+from datetime import date
+import re
+from yaml import load
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Flat frontmatter line: `key: value`
+FLAT_LINE = re.compile(r"([A-Za-z_][\w-]*):[ \t]+(\S.*?)[ \t]*$")
+# Plain scalars the fast path can resolve exactly like YAML does
+PLAIN_WORD = re.compile(r"[A-Za-z_][\w-]*")
+PLAIN_TEXT = re.compile(r"[A-Za-z][^:#\[\]{},'\"`|>&*!%@\t]*")
+INTEGER = re.compile(r"-?[1-9][0-9]*|0")
+ISO_DATE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+# Tabs and characters YAML rejects or reads as line breaks
+UNSAFE_CHARS = re.compile(
+    "[^\n\x20-\x7e\xa0-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]|[\u2028\u2029\ufeff]"
+)
+# Words PyYAML resolves to booleans or null (compared lower-cased)
+RESERVED = {"yes", "no", "true", "false", "on", "off", "null", "~"}
+
+
+def split_frontmatter(raw):
+    """
+    Splits a note into its YAML frontmatter and Markdown body.
+
+    The frontmatter starts after the first line beginning with `---` and
+    ends at the next such line. Without an opening fence both parts are
+    empty; without a closing fence the rest of the note is frontmatter.
+
+    Args:
+        raw (str): Full note content.
+
+    Returns:
+        tuple: (frontmatter, markdown_content) strings.
+    """
+    if raw.startswith('---'):
+        start = 0
+    else:
+        start = raw.find('\n---')
+        if start == -1:
+            return '', ''
+        start += 1
+
+    open_end = raw.find('\n', start)
+    if open_end == -1:
+        return '', ''
+
+    close = raw.find('\n---', open_end)
+    if close == -1:
+        return raw[open_end + 1:], ''
+    close_end = raw.find('\n', close + 1)
+    body = '' if close_end == -1 else raw[close_end + 1:]
+    return raw[open_end + 1:close + 1], body
+
+
+def parse_scalar(value):
+    """
+    Resolves a flat frontmatter value the way PyYAML would.
+
+    Args:
+        value (str): Stripped value text.
+
+    Returns:
+        tuple: (True, parsed value), or (False, None) if YAML is needed.
+    """
+    first = value[0]
+    if first == '"':
+        inner = value[1:-1]
+        if len(value) > 1 and value[-1] == '"' and '"' not in inner and '\\' not in inner:
+            return True, inner
+        return False, None
+    if first == "'":
+        inner = value[1:-1]
+        if len(value) > 1 and value[-1] == "'" and "'" not in inner:
+            return True, inner
+        return False, None
+    if first == '[':
+        if value[-1] != ']':
+            return False, None
+        # YAML strips spaces only, where str.strip() also drops e.g. \xa0
+        inner = value[1:-1].strip(" ")
+        if not inner:
+            return True, []
+        items = [item.strip(" ") for item in inner.split(',')]
+        if all(PLAIN_WORD.fullmatch(item) and item.lower() not in RESERVED for item in items):
+            return True, items
+        return False, None
+
+    match = ISO_DATE.fullmatch(value)
+    if match:
+        try:
+            return True, date(*(int(part) for part in match.groups()))
+        except ValueError:
+            return False, None
+    if INTEGER.fullmatch(value):
+        return True, int(value)
+    if PLAIN_TEXT.fullmatch(value) and value.lower() not in RESERVED:
+        return True, value
+    return False, None
+
+
+def parse_flat(frontmatter):
+    """
+    Parses frontmatter made only of `key: value` lines without YAML.
+
+    Args:
+        frontmatter (str): Frontmatter block.
+
+    Returns:
+        dict: Parsed frontmatter, or None if the block needs full YAML.
+    """
+    if UNSAFE_CHARS.search(frontmatter):
+        return None
+    result = {}
+    for line in frontmatter.split('\n'):
+        if not line.strip(" "):
+            continue
+        match = FLAT_LINE.fullmatch(line)
+        if match is None or match.group(1).lower() in RESERVED:
+            return None
+        ok, value = parse_scalar(match.group(2))
+        if not ok:
+            return None
+        result[match.group(1)] = value
+    return result or None
+
+
+def parse_frontmatter(frontmatter, fast=False):
+    """
+    Parses a frontmatter block.
+
+    Args:
+        frontmatter (str): Frontmatter block.
+        fast (bool): Try the flat `key: value` parser before YAML.
+
+    Returns:
+        Parsed frontmatter (normally a dict), or None when empty.
+    """
+    if fast:
+        parsed = parse_flat(frontmatter)
+        if parsed is not None:
+            return parsed
+    return load(frontmatter, Loader=SafeLoader)
+
+
+def meta_tags(meta):
+    """
+    Returns the tags of parsed frontmatter as a list of strings.
+
+    Args:
+        meta (dict): Parsed frontmatter.
+
+    Returns:
+        list: Tags, accepting a single tag or a list.
+    """
+    tags = meta.get('tags') or []
+    if not isinstance(tags, list):
+        tags = [tags]
+    return [str(tag) for tag in tags]
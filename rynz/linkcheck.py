@@ -0,0 +1,281 @@
+#!/bin/python3
+
+#
+#       ███╗   ██╗██╗██╗  ██╗ █████╗ ██████╗ ███████╗
+#       ████╗  ██║██║██║  ██║██╔══██╗██╔══██╗██╔════╝
+#       ██╔██╗ ██║██║███████║███████║██████╔╝███████╗
+#       ██║╚██╗██║██║██╔══██║██╔══██║██╔══██╗╚════██║
+#       ██║ ╚████║██║██║  ██║██║  ██║██║  ██║███████║
+#       ╚═╝  ╚═══╝╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
+#       DRAFTED BY [https://nih.ar] ON 18-10-2026.
+#       SOURCE [linkcheck.py] LAST MODIFIED ON 18-10-2026.
+#
+
+"""
+Internal link checker behind `rynz test --links`.
+
+Every file under home_path goes into a set of output names. The href and
+src targets of the generated HTML pages are resolved against it, the way
+`rynz serve` resolves a request, to find dangling links and pages no other
+page links to. The links of each page are kept in LINKS_FILE with the
+page's mtime and size, so a later check only parses the pages that changed.
+"""
+
+from os import path, makedirs, replace, scandir, cpu_count, getpid
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from json import dumps, load
+from html import unescape
+from posixpath import dirname, join, normpath
+from urllib.parse import unquote, urlsplit
+import re
+from .builder import CACHE_DIR, PARALLEL_MIN_NOTES, site_base
+
+# Links found in each page by the previous check
+LINKS_FILE = path.join(CACHE_DIR, "links.json")
+LINKS_VERSION = 1
+
+# Opening tags; escaped markup in code samples never matches
+TAG = re.compile(r"<[a-zA-Z][^>]*>")
+LINK_ATTRIBUTE = re.compile(
+    r"""\s(?:href|src)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""", re.IGNORECASE
+)
+SCHEME = re.compile(r"[a-zA-Z][a-zA-Z0-9+.-]*:")
+
+# Pages reached without a link
+ENTRY_PAGES = ("index.html", "404.html")
+
+
+def output_files(home_path):
+    """
+    Lists every file of the generated site.
+
+    Args:
+        home_path (str): Output directory.
+
+    Returns:
+        dict: Output name with "/" separators -> [mtime_ns, size].
+    """
+    files = {}
+    pending = [(home_path, "")]
+    while pending:
+        directory, prefix = pending.pop()
+        with scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    pending.append((entry.path, prefix + entry.name + "/"))
+                elif entry.is_file():
+                    info = entry.stat()
+                    files[prefix + entry.name] = [info.st_mtime_ns, info.st_size]
+    return files
+
+
+def resolve(page, href, base):
+    """
+    Turns a link into the output name it points at.
+
+    Args:
+        page (str): Output name of the linking page.
+        href (str): Link target as written in the page.
+        base (str): Absolute site URL; links below it are internal.
+
+    Returns:
+        str: Output name relative to home_path, before the `.html` and
+        `index.html` fallbacks of lookup(). None for links to other sites,
+        other schemes and fragments of the page itself.
+    """
+    if href == base or href.startswith(base + "/"):
+        href = href[len(base):] or "/"
+    elif href.startswith("//") or SCHEME.match(href):
+        return None
+    target = unquote(urlsplit(href).path)
+    if not target:
+        return None
+    if target.startswith("/"):
+        name = normpath(target.lstrip("/") or ".")
+    else:
+        name = normpath(join(dirname(page), target))
+    if name == ".":
+        return "index.html"
+    return f"{name}/index.html" if target.endswith("/") else name
+
+
+def lookup(name, files):
+    """
+    Finds the file a resolved link is served from, with the same `.html`
+    and `index.html` fallbacks as `rynz serve`.
+
+    Args:
+        name (str): Result of resolve().
+        files (dict): Result of output_files().
+
+    Returns:
+        str: Output name of the file, or None when the link is dangling.
+    """
+    for candidate in (name, name + ".html", name + "/index.html"):
+        if candidate in files:
+            return candidate
+    return None
+
+
+def scan_page(home_path, name, base):
+    """
+    Extracts the internal links of a page.
+
+    Args:
+        home_path (str): Output directory.
+        name (str): Output name of the page.
+        base (str): Absolute site URL.
+
+    Returns:
+        list: Distinct [href, resolved name] pairs, in order of appearance.
+    """
+    with open(path.join(home_path, name), encoding='utf8', errors='ignore') as page_file:
+        html = page_file.read()
+    links = {}
+    for tag in TAG.findall(html):
+        for quoted, single, bare in LINK_ATTRIBUTE.findall(tag):
+            href = (quoted or single or bare).strip()
+            if "&" in href:
+                href = unescape(href)
+            if href in links:
+                continue
+            target = resolve(name, href, base)
+            if target is not None:
+                links[href] = target
+    return [[href, target] for href, target in links.items()]
+
+
+def scan_pages(home_path, names, base, jobs=None):
+    """
+    Scans pages and yields their links in the order of names, in parallel
+    when there are enough of them.
+
+    Args:
+        home_path (str): Output directory.
+        names (list): Output names of the pages.
+        base (str): Absolute site URL.
+        jobs (int): Number of processes, defaults to the CPU count.
+
+    Yields:
+        list: Result of scan_page() for each page.
+    """
+    jobs = jobs or cpu_count() or 1
+    if jobs > 1 and len(names) >= PARALLEL_MIN_NOTES:
+        chunksize = max(1, len(names) // (jobs * 8))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            yield from pool.map(
+                scan_page, repeat(home_path), names, repeat(base), chunksize=chunksize
+            )
+    else:
+        yield from map(scan_page, repeat(home_path), names, repeat(base))
+
+
+def load_links(home_path, base):
+    """
+    Loads the links recorded by the previous check of the same output.
+
+    Args:
+        home_path (str): Output directory.
+        base (str): Absolute site URL.
+
+    Returns:
+        dict: Page name -> [mtime_ns, size, links], empty when missing,
+        unreadable or recorded for another output or site URL.
+    """
+    try:
+        with open(LINKS_FILE, encoding='utf8') as links_file:
+            cache = load(links_file)
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(cache, dict)
+        or cache.get('version') != LINKS_VERSION
+        or cache.get('home_path') != path.abspath(home_path)
+        or cache.get('base') != base
+    ):
+        return {}
+    return cache.get('pages', {})
+
+
+def save_links(home_path, base, pages):
+    """
+    Atomically records the links of every page for the next check.
+
+    Args:
+        home_path (str): Output directory.
+        base (str): Absolute site URL.
+        pages (dict): Page name -> [mtime_ns, size, links].
+    """
+    makedirs(CACHE_DIR, exist_ok=True)
+    tmp_file = f"{LINKS_FILE}.{getpid()}.tmp"
+    with open(tmp_file, 'w', encoding='utf8') as links_file:
+        # dumps() encodes in C, dump() in Python
+        links_file.write(dumps({
+            'version': LINKS_VERSION, 'home_path': path.abspath(home_path), 'base': base,
+            'pages': pages,
+        }, separators=(',', ':')))
+    replace(tmp_file, LINKS_FILE)
+
+
+def check_links(config, jobs=None, rescan=False):
+    """
+    Checks the internal links of the generated site.
+
+    Args:
+        config (dict): Loaded site configuration.
+        jobs (int): Number of processes parsing pages, defaults to the CPU
+            count.
+        rescan (bool): Parse every page, ignoring the links recorded by the
+            previous check.
+
+    Returns:
+        dict: 'files' and 'pages' in the output, pages 'scanned', internal
+        'links' checked, 'dangling' (sorted (page, href) pairs) and
+        'orphans' (sorted HTML pages no other page links to).
+    """
+    home_path = config['home_path']
+    base = site_base(config)
+    files = output_files(home_path)
+    previous = {} if rescan else load_links(home_path, base)
+
+    pages = {}
+    changed = []
+    for name, signature in files.items():
+        if not name.endswith(".html"):
+            continue
+        entry = previous.get(name)
+        if entry is not None and entry[:2] == signature:
+            pages[name] = entry
+        else:
+            changed.append(name)
+    for name, links in zip(changed, scan_pages(home_path, changed, base, jobs)):
+        pages[name] = files[name] + [links]
+    if changed or pages.keys() != previous.keys():
+        save_links(home_path, base, pages)
+
+    # Targets are looked up again on every check, as they may be gone
+    # without the linking page changing
+    dangling = []
+    linked = set()
+    total = 0
+    for name, (_mtime, _size, links) in pages.items():
+        total += len(links)
+        for href, target in links:
+            found = lookup(target, files)
+            if found is None:
+                dangling.append((name, href))
+            elif found != name:
+                linked.add(found)
+    orphans = [
+        name for name in pages
+        if name not in linked and name not in ENTRY_PAGES
+    ]
+    return {
+        'files': len(files),
+        'pages': len(pages),
+        'scanned': len(changed),
+        'links': total,
+        'dangling': sorted(dangling),
+        'orphans': sorted(orphans),
+    }
@@ -0,0 +1,484 @@
+#!/bin/python3
+
+#
+#       ███╗   ██╗██╗██╗  ██╗ █████╗ ██████╗ ███████╗
+#       ████╗  ██║██║██║  ██║██╔══██╗██╔══██╗██╔════╝
+#       ██╔██╗ ██║██║███████║███████║██████╔╝███████╗
+#       ██║╚██╗██║██║██╔══██║██╔══██║██╔══██╗╚════██║
+#       ██║ ╚████║██║██║  ██║██║  ██║██║  ██║███████║
+#       ╚═╝  ╚═══╝╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
+#       DRAFTED BY [https://nih.ar] ON 18-10-2026.
+#       SOURCE [live.py] LAST MODIFIED ON 18-10-2026.
+#
+
+"""
+Live site behind `rynz serve --memory` and the /search page of `rynz serve`.
+
+load_site() keeps the config, templates, fragments and the frontmatter of
+every note in memory. Pages are rendered on request with the same helpers
+as a deploy, and nothing is written to home_path.
+"""
+
+from os import path, sep, stat
+from threading import RLock
+from time import monotonic
+from urllib.parse import urlencode
+from markupsafe import escape
+from yaml import safe_load
+from .frontmatter import split_frontmatter, meta_tags
+from . import search
+from .builder import (
+    GROUP_PAGES, REQUIRED_KEYS, SEARCH_TEMPLATES, LazyPost, discover_notes, feed_posts,
+    group_notes, home_page_count, home_pages, is_note, listing_posts, load_fragments,
+    load_note, make_environment, markdown_version, note_dir, note_output, page_context,
+    print_message, readmd, render_markdown, render_page, sort_notes, template_files
+)
+
+# Results per search page
+SEARCH_RESULTS = 20
+
+# Seconds between rescans of the note folder and shared files of a live site
+RESCAN_INTERVAL = 1.0
+
+
+def site_signature(config):
+    """
+    Stats every file shared by all pages of a live site.
+
+    Args:
+        config (dict): Loaded site configuration.
+
+    Returns:
+        tuple: (path, mtime_ns, size) of config, every file of the template
+        folders and fragments.
+    """
+    signature = []
+    for filepath in (
+        'config.yml', *template_files(config), config['header_md'], config['footer_md'],
+        config['home_md']
+    ):
+        try:
+            info = stat(filepath)
+            signature.append((filepath, info.st_mtime_ns, info.st_size))
+        except OSError:
+            signature.append((filepath, 0, 0))
+    return tuple(signature)
+
+
+def load_site(searchable=True):
+    """
+    Loads config, templates, fragments and note metadata for on-demand
+    rendering by `rynz serve --memory` and for the /search page. Nothing is
+    written to home_path.
+
+    Args:
+        searchable (bool): Keep a full-text index of the notes for
+            site_search().
+
+    Returns:
+        dict: Live site used by site_lookup(), site_render() and
+        site_search().
+    """
+    config = safe_load(readmd('config.yml'))
+    missing = [key for key in REQUIRED_KEYS if key not in (config or {})]
+    if missing:
+        raise ValueError(f"Missing config keys: {', '.join(missing)}")
+    # Fails early when the Markdown backend is not installed
+    markdown_version(config)
+
+    env = make_environment()
+    site = {
+        'config': config,
+        'env': env,
+        'fragments': load_fragments(config),
+        'signature': site_signature(config),
+        'notes': {},
+        'version': 0,
+        'lock': RLock(),
+        'search': search.SearchIndex() if searchable else None,
+        'groups': None,
+        'checked': monotonic(),
+        'watched': False,
+    }
+    refresh_notes(site)
+    return site
+
+
+def reload_site(site):
+    """
+    Reloads a live site in place after its config, templates or fragments
+    changed, keeping its lock and watcher.
+
+    Args:
+        site (dict): Live site from load_site().
+    """
+    site.update(
+        load_site(site['search'] is not None), lock=site['lock'], watched=site['watched']
+    )
+
+
+def sync_site(site):
+    """
+    Re-checks the shared files of a live site, and rescans its note folder
+    when no watcher keeps the notes up to date. Runs at most once per
+    RESCAN_INTERVAL, so most requests cost no disk access.
+
+    Args:
+        site (dict): Live site from load_site(), with its lock held.
+    """
+    now = monotonic()
+    if now - site['checked'] < RESCAN_INTERVAL:
+        return
+    site['checked'] = now
+    if site_signature(site['config']) != site['signature']:
+        reload_site(site)
+    elif not site['watched']:
+        refresh_notes(site)
+
+
+def site_groups(site):
+    """
+    Returns the tag and archive pages of a live site, regrouping the notes
+    only after they changed.
+
+    Args:
+        site (dict): Live site from load_site(), with its lock held.
+
+    Returns:
+        dict: Result of group_notes().
+    """
+    cached = site['groups']
+    if cached is None or cached[0] != site['version']:
+        groups = group_notes(site['config'], sort_notes(site['notes'].values()))
+        site['groups'] = cached = (site['version'], groups)
+    return cached[1]
+
+
+def search_fields(meta, body):
+    """
+    Lists the texts of a note that search looks at.
+
+    Args:
+        meta (dict): Parsed frontmatter.
+        body (str): Markdown body.
+
+    Returns:
+        list: Title first, then subtitle, tags and body.
+    """
+    return [
+        str(meta.get('title') or ""), str(meta.get('subtitle') or ""),
+        " ".join(meta_tags(meta)), body
+    ]
+
+
+def refresh_notes(site):
+    """
+    Rescans the note folder of a live site, reloading and reindexing only
+    notes whose (mtime, size) changed. Note bodies are not kept in memory.
+
+    Args:
+        site (dict): Live site from load_site().
+
+    Returns:
+        bool: True if any note was added, changed or removed.
+    """
+    config = site['config']
+    known = site['notes']
+    notes = {}
+    changed = False
+    for note_path, info in discover_notes(config).items():
+        name = note_output(config, note_path)
+        note = known.get(name)
+        if note is None or note['signature'] != (info.st_mtime_ns, info.st_size):
+            changed = True
+            note = reload_note(site, note_path, name, info)
+            if note is None:
+                continue
+        notes[name] = note
+    if site['search'] is not None:
+        for name in known.keys() - notes.keys():
+            site['search'].remove(name)
+    if changed or notes.keys() != known.keys():
+        site['notes'] = notes
+        site['version'] += 1
+        return True
+    return False
+
+
+def reload_note(site, note_path, name, info):
+    """
+    Loads one note of a live site and reindexes it for search.
+
+    Args:
+        site (dict): Live site from load_site().
+        note_path (str): Source path.
+        name (str): Output name.
+        info (os.stat_result): Current stat of the source.
+
+    Returns:
+        dict: Note without its body, or None if it failed to load or has
+        no frontmatter.
+    """
+    config = site['config']
+    try:
+        note = load_note(note_path, config.get('fast_frontmatter'), mtime=info.st_mtime)
+    except Exception as e:
+        print_message(f"❌ Error in: {note_path}: {e}", "error")
+        return None
+    if note['meta'] is None:
+        return None
+    note['meta'].update({'url': '/' + name})
+    if site['search'] is not None:
+        site['search'].add(name, search_fields(note['meta'], note['body']))
+    note.update(signature=(info.st_mtime_ns, info.st_size), body=None, html=None)
+    return note
+
+
+def update_notes(site, changed):
+    """
+    Reloads the notes a watcher reported as changed, without rescanning the
+    whole note folder. A changed config reloads the site, and a changed
+    folder falls back to refresh_notes().
+
+    Args:
+        site (dict): Live site from load_site().
+        changed (set): Normalised paths that changed.
+
+    Returns:
+        bool: True if any note was added, changed or removed.
+    """
+    with site['lock']:
+        config = site['config']
+        if site_signature(config) != site['signature']:
+            reload_site(site)
+            return True
+
+        note_root = note_dir(config)
+        notes = dict(site['notes'])
+        updated = False
+        for filepath in sorted(changed):
+            if filepath != note_root and not filepath.startswith(note_root + sep):
+                continue
+            if not is_note(config, filepath):
+                if path.isdir(filepath) or not path.exists(filepath) and any(
+                    note['path'].startswith(filepath + sep) for note in notes.values()
+                ):
+                    return refresh_notes(site)
+                continue
+            name = note_output(config, filepath)
+            try:
+                info = stat(filepath)
+            except OSError:
+                info = None
+            previous = notes.get(name)
+            if previous is not None and info is not None \
+                    and previous['signature'] == (info.st_mtime_ns, info.st_size):
+                continue
+            note = None if info is None else reload_note(site, filepath, name, info)
+            if note is not None:
+                notes[name] = note
+            elif name in notes:
+                del notes[name]
+                if site['search'] is not None:
+                    site['search'].remove(name)
+            else:
+                continue
+            updated = True
+        if updated:
+            site['notes'] = notes
+            site['version'] += 1
+        return updated
+
+
+def is_home_page(name):
+    """
+    Checks whether an output name is a paginated home page.
+
+    Args:
+        name (str): Output name such as "page/2/index.html".
+
+    Returns:
+        bool: True for "page/<number>/index.html".
+    """
+    parts = name.split("/")
+    return len(parts) == 3 and parts[0] == "page" and parts[1].isdigit() \
+        and parts[2] == "index.html"
+
+
+def is_group_page(name):
+    """
+    Checks whether an output name is a tag or archive page.
+
+    Args:
+        name (str): Output name such as "tags/python/index.html".
+
+    Returns:
+        bool: True for pages under tags/ or archive/.
+    """
+    return name.endswith("/index.html") and name.split("/", 1)[0] in GROUP_PAGES.values()
+
+
+def site_lookup(site, name):
+    """
+    Resolves a request to a live page and returns the key its rendering is
+    valid for. The requested note is re-checked on disk, and the note folder
+    and shared files are re-checked by sync_site(), so edits are picked up
+    without a watcher.
+
+    Args:
+        site (dict): Live site from load_site().
+        name (str): Output name such as "index.html" or "note.html".
+
+    Returns:
+        tuple: Cache key that changes whenever the page must be re-rendered,
+        or None if no page by that name exists.
+    """
+    with site['lock']:
+        sync_site(site)
+        config = site['config']
+
+        if name in ("index.html", "rss.xml") or is_home_page(name):
+            # page/1/ is index.html, and pages past the last one do not exist
+            if is_home_page(name) and not (
+                1 < int(name.split("/")[1]) <= home_page_count(config, len(site['notes']))
+            ):
+                return None
+            return (site['signature'], site['version'])
+        if is_group_page(name):
+            if name not in site_groups(site):
+                return None
+            return (site['signature'], site['version'])
+
+        note = site['notes'].get(name)
+        if note is not None:
+            try:
+                info = stat(note['path'])
+                current = (info.st_mtime_ns, info.st_size)
+            except OSError:
+                current = None
+            if current == note['signature']:
+                return (site['signature'], note['signature'])
+            # Changed or removed since the last check: reload only this note
+            update_notes(site, {note['path']})
+            note = site['notes'].get(name)
+            if note is not None:
+                return (site['signature'], note['signature'])
+        return None
+
+
+def site_render(site, name):
+    """
+    Renders a live page through its Jinja2 template.
+
+    Args:
+        site (dict): Live site from load_site().
+        name (str): Output name resolved by site_lookup().
+
+    Returns:
+        str: Rendered page.
+    """
+    with site['lock']:
+        config = site['config']
+        env = site['env']
+        fragments = site['fragments']
+        notes = list(site['notes'].values())
+        note = site['notes'].get(name)
+        groups = site_groups(site) if is_group_page(name) else {}
+    extras = config.get('markdown_extras')
+    backend = config.get('markdown_backend')
+
+    if name in ("index.html", "rss.xml") or is_home_page(name):
+        posts = listing_posts(sort_notes(notes), extras, backend)
+        home_html = render_markdown(readmd(config['home_md']), extras, backend)
+        if name == "rss.xml":
+            return render_page(
+                config, fragments, env.get_template(config['feed_template']),
+                None, home_html, name, feed_posts(config, posts)
+            )[1]
+        for filename, page_posts, nextpage, prevpage in home_pages(config, posts):
+            if filename == name:
+                return render_page(
+                    config, fragments, env.get_template(config['home_template']),
+                    None, home_html, name, page_posts, nextpage, prevpage
+                )[1]
+        return ""
+
+    if is_group_page(name):
+        key, title, members = groups.get(name, (None, "", []))
+        if key is None:
+            return ""
+        return render_page(
+            config, fragments, env.get_template(config[key]), {'title': title}, "",
+            name, listing_posts(members, extras, backend)
+        )[1]
+
+    fresh = load_note(note['path'])
+    return render_page(
+        config, fragments, env.get_template(config['note_template']),
+        note['meta'], render_markdown(fresh['body'], extras, backend), note['path']
+    )[1]
+
+
+def search_url(query, number):
+    """
+    Returns the URL of a page of search results.
+
+    Args:
+        query (str): Search box input.
+        number (int): 1-based page number.
+
+    Returns:
+        str: "/search?q=..." with the page number after the first page.
+    """
+    params = {'q': query} if number == 1 else {'q': query, 'page': number}
+    return f"/search?{urlencode(params)}"
+
+
+def site_search(site, query, page=1):
+    """
+    Renders a page of search results through search_template, or the tag
+    or archive template when it is not set.
+
+    Args:
+        site (dict): Live site from load_site().
+        query (str): Search box input, words and "quoted phrases".
+        page (int): 1-based page of results.
+
+    Returns:
+        str: Rendered page, or None when the site has no search index or
+        no template to render it with.
+    """
+    with site['lock']:
+        sync_site(site)
+        config = site['config']
+        index = site['search']
+        key = next((key for key in SEARCH_TEMPLATES if config.get(key)), None)
+        if index is None or key is None:
+            return None
+        per_page = int(config.get('search_results') or SEARCH_RESULTS)
+        page = max(1, page)
+        total, names = index.search(query, page * per_page) if query else (0, [])
+        found = [site['notes'][name] for name in names[(page - 1) * per_page:]]
+        env = site['env']
+        fragments = site['fragments']
+    extras = config.get('markdown_extras')
+    backend = config.get('markdown_backend')
+
+    posts = []
+    for note in found:
+        try:
+            body = split_frontmatter(readmd(note['path']))[1]
+        except OSError:
+            body = ""
+        posts.append(LazyPost(
+            dict(note['meta'], snippet=search.snippet(body, query)), note['path'],
+            extras, backend
+        ))
+    title = escape(f"Search: {query}" if query else "Search")
+    _post_file, context = page_context(
+        config, fragments, {'title': title}, "", "search/index.html", posts,
+        search_url(query, page + 1) if page * per_page < total else "",
+        search_url(query, page - 1) if page > 1 else ""
+    )
+    context.update(query=escape(query), total=total, page=page)
+    return env.get_template(config[key]).render(**context)
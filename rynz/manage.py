@@ -8,19 +8,18 @@
 #       ██║ ╚████║██║██║  ██║██║  ██║██║  ██║███████║
 #       ╚═╝  ╚═══╝╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
 #       DRAFTED BY [https://nih.ar] ON 08-05-2021.
-#       SOURCE [manage.py] LAST MODIFIED ON 29-04-2025.
+#       SOURCE [manage.py] LAST MODIFIED ON 18-10-2026.
 #
 
-from os import path, chdir
-from http.server import SimpleHTTPRequestHandler
-from socketserver import TCPServer
+from os import path
+from threading import Thread
 import sys
-import yaml
 import argparse
-import subprocess
 from rich.console import Console
 from rich.prompt import Prompt
 from rich.table import Table
+from . import notedb
+from json import dumps
 
 # Initialize console for colorful output
 console = Console()
@@ -62,10 +61,12 @@ def run_tests():
     Exits:
         On validation failure.
     """
+    from yaml import YAMLError
+
     # Load and validate config.yml syntax
     try:
         config = load_config()
-    except yaml.YAMLError as e:
+    except YAMLError as e:
         print_message(f"❌ Error: YAML syntax issue in config.yml: {e}", "error", timestamp=True)
         sys.exit(1)
     except Exception as e:
@@ -118,8 +119,60 @@ def run_tests():
 
     print_message("✅ All tests passed successfully.", "success", timestamp=True)
 
+def check_links(jobs=None, rescan=False, limit=50):
+    """
+    Checks the internal links of the generated site and reports dangling
+    links and orphaned pages. Only pages changed since the last check are
+    parsed.
+
+    Args:
+        jobs (int): Number of processes parsing pages, defaults to the CPU
+            count.
+        rescan (bool): Parse every page again.
+        limit (int): Maximum number of dangling links and orphans listed.
+
+    Exits:
+        When a link is dangling.
+    """
+    from time import perf_counter
+    from . import linkcheck
+
+    config = load_config()
+    if not path.isdir(config.get("home_path", "public")):
+        print_message("❌ No generated site found. Run `rynz deploy` first.", "error")
+        sys.exit(1)
+
+    start = perf_counter()
+    report = linkcheck.check_links(config, jobs, rescan)
+    print_message(
+        f"🔗 Checked {report['links']} links in {report['pages']} pages "
+        f"({report['scanned']} parsed, {report['files']} files) "
+        f"in {perf_counter() - start:.2f}s.", "info", timestamp=True
+    )
+
+    if report['orphans']:
+        table = Table(title=f"Orphaned pages ({len(report['orphans'])})")
+        table.add_column("Page")
+        for name in report['orphans'][:limit]:
+            table.add_row(name)
+        console.print(table)
+    if report['dangling']:
+        table = Table(title=f"Dangling links ({len(report['dangling'])})")
+        table.add_column("Page")
+        table.add_column("Link")
+        for name, href in report['dangling'][:limit]:
+            table.add_row(name, href)
+        console.print(table)
+        print_message(
+            f"❌ Error: {len(report['dangling'])} dangling links.", "error", timestamp=True
+        )
+        sys.exit(1)
+    print_message("✅ No dangling links.", "success", timestamp=True)
+
 def load_config():
     """Load the configuration from config.yml."""
+    import yaml
+
     if not path.exists("config.yml"):
         print_message("❌ Error: config.yml not found.", "error", timestamp=True)
         sys.exit(1)
@@ -130,6 +183,8 @@ def load_config():
 
 def save_config(config):
     """Save the updated configuration to config.yml."""
+    import yaml
+
     with open("config.yml", "w", encoding="utf-8") as f:
         yaml.dump(config, f, default_flow_style=False, sort_keys=False)
     print_message("✅ Config saved successfully!", "success", timestamp=True)
@@ -217,23 +272,138 @@ def manage_config():
             break
 
 
-def server(port=5555):
-    """Start the local HTTP server."""
+def watch_site(state, jobs=None):
+    """
+    Rebuilds the site whenever content, templates, resources or config change.
+    Runs until the server stops.
+
+    Args:
+        state (dict): Build state returned by builder.buildRynz().
+        jobs (int): Processes used when a full rebuild is needed.
+    """
+    from . import builder, watcher
+
+    while True:
+        config = state['config'] if state else load_config()
+        roots, files = builder.watch_targets(config)
+        print_message("👀 Watching for changes...", "info", timestamp=True)
+        for changed in watcher.watch(roots, files):
+            print_message(
+                f"🔄 Changed: {', '.join(sorted(changed))}", "info", timestamp=True
+            )
+            try:
+                state = builder.apply_changes(state, changed, jobs)
+            except Exception as e:
+                print_message(f"❌ Rebuild failed: {e}", "error", timestamp=True)
+            # Watched paths may have moved with the new config
+            if "config.yml" in changed:
+                break
+
+
+def watch_notes(site):
+    """
+    Keeps the notes and search index of a live site in step with the note
+    folder, reindexing only the notes that change. Runs until the server
+    stops.
+
+    Args:
+        site (dict): Live site from live.load_site().
+    """
+    from . import builder, live, watcher
+
+    # Requests stop rescanning the note folder while the watcher runs
+    site['watched'] = True
+    try:
+        while True:
+            with site['lock']:
+                note_root = builder.note_dir(site['config'])
+            for changed in watcher.watch([note_root], ['config.yml']):
+                try:
+                    live.update_notes(site, changed)
+                except Exception as e:
+                    print_message(f"❌ Reindexing failed: {e}", "error", timestamp=True)
+                # The note folder may have moved with the new config
+                if "config.yml" in changed:
+                    break
+    finally:
+        site['watched'] = False
+
+
+def server(port=5555, bind="", workers=8, watch=False, jobs=None, memory=False,
+           cache_mb=64, search=True):
+    """
+    Start the local HTTP server.
+
+    Args:
+        port (int): Port to listen on.
+        bind (str): Address to bind, empty for all interfaces.
+        workers (int): Number of requests handled at once.
+        watch (bool): Rebuild the site automatically when sources change.
+        jobs (int): Processes used for full rebuilds in watch mode.
+        memory (bool): Render pages on demand in memory instead of serving
+            home_path. Edits are picked up on the next request.
+        cache_mb (int): Size of the in-memory page and file cache in MB.
+        search (bool): Index the notes in memory and answer /search?q=.
+    """
+    from .server import make_server
+
     try:
         config = load_config()
         home_path = config.get("home_path", "public")
 
+        if memory:
+            from . import live
+            site = live.load_site(search)
+            print_message(
+                f"✅ Loaded {len(site['notes'])} notes for on-demand rendering.",
+                "success", timestamp=True
+            )
+            httpd = make_server(
+                config.get("resource_path", "static"), bind=bind, port=port,
+                workers=workers, cache_size=cache_mb * 1024 * 1024, site=site,
+                search=site if search else None
+            )
+            Thread(target=watch_notes, args=(site,), daemon=True).start()
+            print_message(
+                f"✅ Server is live! at http://{bind or 'localhost'}:{port}", "success",
+                timestamp=True
+            )
+            httpd.serve_forever()
+            return
+
+        state = None
+        if watch:
+            from . import builder
+            state = builder.buildRynz(jobs=jobs)
+
         if not path.exists(home_path):
             print_message(
                 f"❌ Error: '{home_path}' does not exist.", "error", timestamp=True
             )
             sys.exit(1)
 
-        chdir(path.join(home_path))
-
-        httpd = TCPServer(("", port), SimpleHTTPRequestHandler)
+        search_site = None
+        if search:
+            from . import live
+            try:
+                search_site = live.load_site()
+                print_message(
+                    f"🔎 Indexed {len(search_site['notes'])} notes for /search.", "success",
+                    timestamp=True
+                )
+            except Exception as e:
+                print_message(f"⚠️ Search disabled: {e}", "info", timestamp=True)
+
+        httpd = make_server(
+            home_path, bind=bind, port=port, workers=workers,
+            cache_size=cache_mb * 1024 * 1024, search=search_site
+        )
+        if watch:
+            Thread(target=watch_site, args=(state, jobs), daemon=True).start()
+        if search_site is not None:
+            Thread(target=watch_notes, args=(search_site,), daemon=True).start()
         print_message(
-            f"✅ Server is live! at http://localhost:{port}", "success",
+            f"✅ Server is live! at http://{bind or 'localhost'}:{port}", "success",
             timestamp=True
         )
         httpd.serve_forever()
@@ -245,6 +415,61 @@ def server(port=5555):
         sys.exit(1)
 
 
+def show_notes(tag=None, since=None, until=None, title=None, limit=None, as_json=False):
+    """
+    Prints notes from the note index, newest first.
+
+    Args:
+        tag (str): Only notes carrying this tag.
+        since (str): Earliest date, inclusive (YYYY-MM-DD).
+        until (str): Latest date, inclusive (YYYY-MM-DD).
+        title (str): Case-insensitive substring of the title.
+        limit (int): Maximum number of notes.
+        as_json (bool): Print JSON instead of a table.
+    """
+    if not path.exists(notedb.DB_FILE):
+        print_message("❌ No note index found. Run `rynz deploy` first.", "error")
+        sys.exit(1)
+
+    notes = notedb.query_notes(tag, since, until, title, limit)
+    if as_json:
+        print(dumps(notes, indent=2))
+        return
+
+    table = Table(title=f"Notes ({len(notes)})")
+    table.add_column("Date")
+    table.add_column("Title")
+    table.add_column("Tags")
+    table.add_column("Output")
+    for note in notes:
+        table.add_row(note['date'], note['title'], ", ".join(note['tags']), note['output'])
+    console.print(table)
+
+
+def show_tags(as_json=False):
+    """
+    Prints every tag in the note index with its number of notes.
+
+    Args:
+        as_json (bool): Print JSON instead of a table.
+    """
+    if not path.exists(notedb.DB_FILE):
+        print_message("❌ No note index found. Run `rynz deploy` first.", "error")
+        sys.exit(1)
+
+    tags = notedb.tag_counts()
+    if as_json:
+        print(dumps(dict(tags), indent=2))
+        return
+
+    table = Table(title=f"Tags ({len(tags)})")
+    table.add_column("Tag")
+    table.add_column("Notes", justify="right")
+    for tag, count in tags:
+        table.add_row(tag, str(count))
+    console.print(table)
+
+
 def save_changes(commit_message="Changes saved via rynz save"):
     """
     Automates Git workflow: stage and commit changes.
@@ -255,6 +480,8 @@ def save_changes(commit_message="Changes saved via rynz save"):
     Returns:
         None
     """
+    import subprocess
+
     try:
         # Check if it's a valid Git repository
         if not path.exists(".git"):
@@ -0,0 +1,204 @@
+#!/bin/python3
+
+#
+#       ███╗   ██╗██╗██╗  ██╗ █████╗ ██████╗ ███████╗
+#       ████╗  ██║██║██║  ██║██╔══██╗██╔══██╗██╔════╝
+#       ██╔██╗ ██║██║███████║███████║██████╔╝███████╗
+#       ██║╚██╗██║██║██╔══██║██╔══██║██╔══██╗╚════██║
+#       ██║ ╚████║██║██║  ██║██║  ██║██║  ██║███████║
+#       ╚═╝  ╚═══╝╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
+#       DRAFTED BY [https://nih.ar] ON 18-10-2026.
+#       SOURCE [notedb.py] LAST MODIFIED ON 18-10-2026.
+#
+
+"""
+SQLite index of note metadata.
+
+Every deploy updates path, output, mtime, hash, title, date and tags of
+each note, touching only rows whose hash changed. `rynz list` and
+`rynz query` answer questions from it without opening any note.
+"""
+
+from os import path, makedirs
+from json import dumps, loads
+import sqlite3
+from .frontmatter import meta_tags
+
+# Index database, kept with the other build caches
+DB_FILE = path.join(".rynz-cache", "notes.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS notes (
+    path TEXT PRIMARY KEY,
+    output TEXT NOT NULL,
+    mtime REAL NOT NULL,
+    hash TEXT NOT NULL,
+    title TEXT NOT NULL,
+    date TEXT NOT NULL,
+    tags TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS note_tags (
+    path TEXT NOT NULL REFERENCES notes(path) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (tag, path)
+);
+CREATE INDEX IF NOT EXISTS notes_date ON notes(date);
+CREATE INDEX IF NOT EXISTS note_tags_path ON note_tags(path);
+"""
+
+
+def connect(db_file=DB_FILE):
+    """
+    Opens the note index, creating it if needed.
+
+    Args:
+        db_file (str): Database path.
+
+    Returns:
+        sqlite3.Connection: Open connection.
+    """
+    makedirs(path.dirname(db_file) or ".", exist_ok=True)
+    conn = sqlite3.connect(db_file)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def note_row(note):
+    """
+    Converts a built note into an index row.
+
+    Args:
+        note (dict): Note result from builder.build_note().
+
+    Returns:
+        tuple: (path, output, mtime, hash, title, date, tags JSON, tag list).
+    """
+    meta = note['meta']
+    tags = meta_tags(meta)
+    return (
+        note['path'], note['output'], note.get('mtime', 0.0), note['hash'],
+        str(meta.get('title', '')), str(meta.get('date', '')), dumps(tags), tags,
+    )
+
+
+def sync_notes(notes, keep=(), db_file=DB_FILE):
+    """
+    Brings the index in line with the notes of the site. Rows whose hash
+    and mtime are unchanged are left alone, and indexed notes that are no
+    longer part of the site are deleted.
+
+    Args:
+        notes (iterable): Every built note result of the site.
+        keep (iterable): Note paths to leave untouched, such as notes that
+            failed to build this time.
+        db_file (str): Database path.
+
+    Returns:
+        int: Number of rows inserted, updated or deleted.
+    """
+    conn = connect(db_file)
+    try:
+        with conn:
+            known = {
+                row[0]: (row[1], row[2])
+                for row in conn.execute("SELECT path, hash, mtime FROM notes")
+            }
+            changes = 0
+            seen = set(keep)
+            for note in notes:
+                seen.add(note['path'])
+                if known.get(note['path']) == (note['hash'], note.get('mtime', 0.0)):
+                    continue
+                row = note_row(note)
+                conn.execute(
+                    "INSERT OR REPLACE INTO notes VALUES (?, ?, ?, ?, ?, ?, ?)", row[:7]
+                )
+                conn.execute("DELETE FROM note_tags WHERE path = ?", (row[0],))
+                conn.executemany(
+                    "INSERT OR IGNORE INTO note_tags VALUES (?, ?)",
+                    [(row[0], tag) for tag in row[7]]
+                )
+                changes += 1
+
+            for note_path in known.keys() - seen:
+                conn.execute("DELETE FROM notes WHERE path = ?", (note_path,))
+                changes += 1
+        return changes
+    finally:
+        conn.close()
+
+
+def query_notes(tag=None, since=None, until=None, title=None, limit=None, db_file=DB_FILE):
+    """
+    Finds notes by tag, date range and title, newest first.
+
+    Args:
+        tag (str): Only notes carrying this tag.
+        since (str): Earliest date, inclusive (YYYY-MM-DD).
+        until (str): Latest date, inclusive (YYYY-MM-DD).
+        title (str): Case-insensitive substring of the title.
+        limit (int): Maximum number of rows.
+        db_file (str): Database path.
+
+    Returns:
+        list: Dicts with path, output, mtime, hash, title, date and tags.
+    """
+    if not path.exists(db_file):
+        return []
+    sql = "SELECT notes.* FROM notes"
+    where, params = [], []
+    if tag:
+        sql += " JOIN note_tags ON note_tags.path = notes.path"
+        where.append("note_tags.tag = ?")
+        params.append(tag)
+    if since:
+        where.append("notes.date >= ?")
+        params.append(since)
+    if until:
+        # Dates may carry a time part, so compare against the end of the day
+        where.append("notes.date <= ?")
+        params.append(until + "\uffff")
+    if title:
+        where.append("notes.title LIKE ? ESCAPE '\\'")
+        escaped = title.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        params.append(f"%{escaped}%")
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY notes.date DESC, notes.path"
+    if limit:
+        sql += " LIMIT ?"
+        params.append(int(limit))
+
+    conn = connect(db_file)
+    try:
+        return [
+            dict(row, tags=loads(row['tags'])) for row in conn.execute(sql, params)
+        ]
+    finally:
+        conn.close()
+
+
+def tag_counts(db_file=DB_FILE):
+    """
+    Counts notes per tag.
+
+    Args:
+        db_file (str): Database path.
+
+    Returns:
+        list: (tag, count) pairs, most used first.
+    """
+    if not path.exists(db_file):
+        return []
+    conn = connect(db_file)
+    try:
+        return [
+            (row[0], row[1]) for row in conn.execute(
+                "SELECT tag, COUNT(*) FROM note_tags GROUP BY tag ORDER BY 2 DESC, 1"
+            )
+        ]
+    finally:
+        conn.close()
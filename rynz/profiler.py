@@ -0,0 +1,173 @@
+#!/bin/python3
+
+#
+#       ███╗   ██╗██╗██╗  ██╗ █████╗ ██████╗ ███████╗
+#       ████╗  ██║██║██║  ██║██╔══██╗██╔══██╗██╔════╝
+#       ██╔██╗ ██║██║███████║███████║██████╔╝███████╗
+#       ██║╚██╗██║██║██╔══██║██╔══██║██╔══██╗╚════██║
+#       ██║ ╚████║██║██║  ██║██║  ██║██║  ██║███████║
+#       ╚═╝  ╚═══╝╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
+#       DRAFTED BY [https://nih.ar] ON 18-10-2026.
+#       SOURCE [profiler.py] LAST MODIFIED ON 18-10-2026.
+#
+
+"""
+Build profiling for `rynz deploy --profile`.
+
+The builder records wall time per build phase and, inside the note
+workers, the time each note spends reading, parsing frontmatter,
+converting Markdown, rendering and writing. This module turns those
+timings into a report, printed as rich tables and saved as JSON.
+"""
+
+from os import path, makedirs
+from time import perf_counter
+from json import dump
+from cProfile import Profile
+from rich.console import Console
+from rich.table import Table
+
+# Initialize console for colorful output
+console = Console()
+
+# Machine-readable report of the last profiled build
+PROFILE_FILE = path.join(".rynz-cache", "profile.json")
+
+# Phases timed for every note, in build order
+NOTE_PHASES = ("read", "frontmatter", "markdown", "render", "write")
+
+
+def lap(timings, phase, start):
+    """
+    Adds the time elapsed since start to a phase.
+
+    Args:
+        timings (dict): Phase timings to update, or None when not profiling.
+        phase (str): Phase name.
+        start (float): perf_counter() value the phase started at.
+
+    Returns:
+        float: Current perf_counter() value, the start of the next phase.
+    """
+    now = perf_counter()
+    if timings is not None:
+        timings[phase] = timings.get(phase, 0.0) + now - start
+    return now
+
+
+def build_report(phases, total, note_timings, top=10):
+    """
+    Summarizes the timings of one build.
+
+    Args:
+        phases (dict): Wall time of each build phase.
+        total (float): Wall time of the whole build.
+        note_timings (list): (note path, phase timings) for every note.
+        top (int): Number of slowest notes to rank.
+
+    Returns:
+        dict: Report with 'total', 'phases', 'note_phases' (summed over all
+        notes, so parallel builds may exceed the wall time), 'notes' and
+        'slowest'.
+    """
+    note_phases = {phase: 0.0 for phase in NOTE_PHASES}
+    ranked = []
+    for note_path, timings in note_timings:
+        for phase, seconds in timings.items():
+            note_phases[phase] = note_phases.get(phase, 0.0) + seconds
+        ranked.append((sum(timings.values()), note_path, timings))
+    ranked.sort(key=lambda item: item[0], reverse=True)
+
+    return {
+        'total': total,
+        'phases': dict(phases),
+        'note_phases': note_phases,
+        'notes': len(note_timings),
+        'slowest': [
+            dict({phase: timings.get(phase, 0.0) for phase in NOTE_PHASES},
+                 path=note_path, total=note_total)
+            for note_total, note_path, timings in ranked[:top]
+        ],
+    }
+
+
+def print_report(report):
+    """
+    Prints a build report as rich tables.
+
+    Args:
+        report (dict): Result of build_report().
+    """
+    total = report['total'] or 1e-9
+
+    console.rule("[bold cyan]⏱ Build Profile")
+    phases = Table(title="Build Phases (wall time)", header_style="bold magenta")
+    phases.add_column("Phase")
+    phases.add_column("Seconds", justify="right")
+    phases.add_column("Share", justify="right")
+    for phase, seconds in report['phases'].items():
+        phases.add_row(phase, f"{seconds:.4f}", f"{seconds / total:.1%}")
+    phases.add_row("total", f"{report['total']:.4f}", "100.0%", style="bold")
+    console.print(phases)
+
+    note_total = sum(report['note_phases'].values()) or 1e-9
+    note_phases = Table(
+        title=f"Note Phases (summed over {report['notes']} notes)",
+        header_style="bold magenta"
+    )
+    note_phases.add_column("Phase")
+    note_phases.add_column("Seconds", justify="right")
+    note_phases.add_column("Share", justify="right")
+    for phase, seconds in report['note_phases'].items():
+        note_phases.add_row(phase, f"{seconds:.4f}", f"{seconds / note_total:.1%}")
+    console.print(note_phases)
+
+    if report['slowest']:
+        slowest = Table(
+            title=f"Slowest {len(report['slowest'])} Notes (ms)",
+            header_style="bold magenta"
+        )
+        slowest.add_column("Note", overflow="fold")
+        slowest.add_column("Total", justify="right")
+        for phase in NOTE_PHASES:
+            slowest.add_column(phase.capitalize(), justify="right")
+        for note in report['slowest']:
+            slowest.add_row(
+                note['path'], f"{note['total'] * 1000:.2f}",
+                *(f"{note[phase] * 1000:.2f}" for phase in NOTE_PHASES)
+            )
+        console.print(slowest)
+
+
+def save_report(report, filepath=PROFILE_FILE):
+    """
+    Writes a build report as JSON.
+
+    Args:
+        report (dict): Result of build_report().
+        filepath (str): Destination file.
+    """
+    makedirs(path.dirname(filepath) or ".", exist_ok=True)
+    with open(filepath, 'w', encoding='utf-8') as report_file:
+        dump(report, report_file, indent=2)
+
+
+def profile_call(stats_file, func, *args, **kwargs):
+    """
+    Runs a function under cProfile and dumps the statistics for pstats or
+    viewers such as snakeviz. Only the calling process is profiled.
+
+    Args:
+        stats_file (str): Destination of the pstats dump.
+        func (callable): Function to run.
+        *args: Positional arguments for func.
+        **kwargs: Keyword arguments for func.
+
+    Returns:
+        The return value of func.
+    """
+    profiler = Profile()
+    try:
+        return profiler.runcall(func, *args, **kwargs)
+    finally:
+        profiler.dump_stats(stats_file)
@@ -0,0 +1,150 @@
+#!/bin/python3
+
+#
+#       ███╗   ██╗██╗██╗  ██╗ █████╗ ██████╗ ███████╗
+#       ████╗  ██║██║██║  ██║██╔══██╗██╔══██╗██╔════╝
+#       ██╔██╗ ██║██║███████║███████║██████╔╝███████╗
+#       ██║╚██╗██║██║██╔══██║██╔══██║██╔══██╗╚════██║
+#       ██║ ╚████║██║██║  ██║██║  ██║██║  ██║███████║
+#       ╚═╝  ╚═══╝╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
+#       DRAFTED BY [https://nih.ar] ON 18-10-2026.
+#       SOURCE [renderers.py] LAST MODIFIED ON 18-10-2026.
+#
+
+"""
+Markdown backends, selected with `markdown_backend` in config.yml.
+
+A backend turns a note's Markdown into HTML. markdown2 is the default and
+renders exactly as earlier releases. markdown-it-py and mistune are used
+when installed, and any importable function can be plugged in as
+"module:function"; it is called with the Markdown source and the list of
+configured extras. Built-in backends honour the markdown2 extras they
+have an equivalent for and ignore the others.
+"""
+
+from functools import lru_cache
+from importlib import import_module
+
+# Backend used when markdown_backend is not set
+DEFAULT_BACKEND = "markdown2"
+
+
+def markdown2_backend(extras):
+    """
+    Renders with markdown2, every extra supported.
+
+    Args:
+        extras (list): markdown2 extras to enable.
+
+    Returns:
+        tuple: (render function, version).
+    """
+    import markdown2
+
+    def render(text):
+        return markdown2.markdown(text, extras=extras)
+
+    # The bare version keeps render caches of earlier releases valid
+    return render, markdown2.__version__
+
+
+def markdown_it_backend(extras):
+    """
+    Renders CommonMark with markdown-it-py. Fenced code is always on; the
+    tables and strike extras map to its table and strikethrough rules.
+
+    Args:
+        extras (list): markdown2 extras to enable.
+
+    Returns:
+        tuple: (render function, version).
+    """
+    from markdown_it import MarkdownIt, __version__
+
+    rules = {'tables': "table", 'strike': "strikethrough"}
+    parser = MarkdownIt("commonmark")
+    parser.enable([rules[extra] for extra in extras if extra in rules])
+    return parser.render, f"markdown-it-py {__version__}"
+
+
+def mistune_backend(extras):
+    """
+    Renders with mistune. Raw HTML is passed through as markdown2 does, and
+    the tables, strike, footnotes and task_list extras map to its plugins.
+
+    Args:
+        extras (list): markdown2 extras to enable.
+
+    Returns:
+        tuple: (render function, version).
+    """
+    import mistune
+
+    plugins = {
+        'tables': "table", 'strike': "strikethrough", 'footnotes': "footnotes",
+        'task_list': "task_lists",
+    }
+    render = mistune.create_markdown(
+        escape=False, plugins=[plugins[extra] for extra in extras if extra in plugins]
+    )
+    return render, f"mistune {mistune.__version__}"
+
+
+# Built-in backends by their markdown_backend name
+BACKENDS = {
+    'markdown2': markdown2_backend,
+    'markdown-it': markdown_it_backend,
+    'mistune': mistune_backend,
+}
+
+
+def plugin_backend(name, extras):
+    """
+    Loads a "module:function" backend.
+
+    Args:
+        name (str): Import path of the function.
+        extras (list): Extras passed on every call.
+
+    Returns:
+        tuple: (render function, version).
+    """
+    module_name, _, function_name = name.partition(":")
+    module = import_module(module_name)
+    function = getattr(module, function_name)
+
+    def render(text):
+        return function(text, extras)
+
+    return render, f"{name} {getattr(module, '__version__', '')}"
+
+
+@lru_cache(maxsize=None)
+def get_renderer(backend=None, extras=()):
+    """
+    Returns the render function of a backend, created once per process.
+
+    Args:
+        backend (str): Built-in backend name or "module:function", None for
+            the default.
+        extras (tuple): Sorted markdown2 extras to enable.
+
+    Returns:
+        tuple: (function converting Markdown to HTML, version string that
+        changes whenever the output may change).
+
+    Raises:
+        ValueError: If the backend is unknown or its library is missing.
+    """
+    name = backend or DEFAULT_BACKEND
+    try:
+        if name in BACKENDS:
+            return BACKENDS[name](list(extras))
+        if ":" in name:
+            return plugin_backend(name, list(extras))
+    except (ImportError, AttributeError) as e:
+        raise ValueError(f"Markdown backend '{name}' is not available: {e}") from e
+    raise ValueError(
+        f"Unknown Markdown backend '{name}'. Use one of {', '.join(BACKENDS)} "
+        "or module:function."
+    )
@@ -8,7 +8,7 @@
 #       ██║ ╚████║██║██║  ██║██║  ██║██║  ██║███████║
 #       ╚═╝  ╚═══╝╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
 #       DRAFTED BY [https://nih.ar] ON 28-04-2025
-#       SOURCE [rynz.py] LAST MODIFIED ON 29-04-2025.
+#       SOURCE [rynz.py] LAST MODIFIED ON 18-10-2026.
 #
 
 """
@@ -19,20 +19,23 @@ This script handles the command-line interface (CLI) for the Rynz package, allow
 - Add new pages.
 - Deploy the site.
 - Serve the site locally.
+- List and query notes from the note index.
 - Edit configuration.
 - Run tests.
 - Save changes using Git.
+
+Command modules and their dependencies (Jinja2, markdown2, YAML, rich,
+the HTTP server) are imported only when a command needs them, so
+`rynz --version` and `rynz add` start quickly from scripts and editor hooks.
 """
 
 from argparse import ArgumentParser
-from . import __version__, creator, builder, manage
-from rich.console import Console
-from rich.prompt import Prompt
+from . import __version__
 from os import path
 import sys
 
-# Initialize the rich console for printing styled messages
-console = Console()
+# Rich console for styled messages, created on first use
+console = None
 
 def print_message(message, style="info"):
     """
@@ -42,6 +45,10 @@ def print_message(message, style="info"):
         message (str): The message to display.
         style (str): Message style ("success", "error", or "info").
     """
+    global console
+    if console is None:
+        from rich.console import Console
+        console = Console()
     styles = {
         "success": "bold green",
         "error": "bold red",
@@ -58,6 +65,8 @@ def main():
     - add: Add a new Markdown note or blog post.
     - deploy: Convert Markdown files to static HTML.
     - serve: Serve the site locally.
+    - list: List notes or tags from the note index.
+    - query: Find notes by tag, date or title.
     - config: View or edit the config.yml file.
     - test: Run tests on the project setup.
     - save: Save changes with Git.
@@ -71,6 +80,18 @@ def main():
         "-v", "--version", action="version", version=f"Rynz v{__version__}"
     )
 
+    # Output options of the commands that build the site
+    output_options = ArgumentParser(add_help=False)
+    output_level = output_options.add_mutually_exclusive_group()
+    output_level.add_argument(
+        "-q", "--quiet", action="store_true",
+        help="Only print warnings and errors"
+    )
+    output_level.add_argument(
+        "-v", "--verbose", action="store_true",
+        help="Print every built note instead of a progress bar"
+    )
+
     # Define subcommands
     subparsers = parser.add_subparsers(dest='type', help='Available commands')
     subparsers.required = True
@@ -88,13 +109,109 @@ def main():
     )
 
     # deploy -- Publishes the rynz project
-    subparsers.add_parser(
-        'deploy', help='Convert Markdown files into static HTML'
+    parser_deploy = subparsers.add_parser(
+        'deploy', help='Convert Markdown files into static HTML', parents=[output_options]
+    )
+    parser_deploy.add_argument(
+        "-f", "--force", action="store_true",
+        help="Ignore the build manifest and rebuild every page"
+    )
+    parser_deploy.add_argument(
+        "--precompile", action="store_true",
+        help="Compile all templates into the bytecode cache before building"
+    )
+    parser_deploy.add_argument(
+        "-j", "--jobs", type=int, default=None,
+        help="Number of parallel build processes (default: number of CPUs)"
+    )
+    parser_deploy.add_argument(
+        "--profile", action="store_true",
+        help="Report time spent per build phase and the slowest notes"
+    )
+    parser_deploy.add_argument(
+        "--top", type=int, default=10,
+        help="Number of slowest notes in the profile report (default: 10)"
+    )
+    parser_deploy.add_argument(
+        "--cprofile", metavar="FILE", default=None,
+        help="Dump cProfile statistics of the build to FILE (use with --jobs 1 "
+             "to include note rendering)"
     )
 
     # serve -- run the rynz project locally
-    subparsers.add_parser(
-        'serve', help='Serve your site locally at http://localhost:5555'
+    parser_serve = subparsers.add_parser(
+        'serve', help='Serve your site locally at http://localhost:5555',
+        parents=[output_options]
+    )
+    parser_serve.add_argument(
+        "-p", "--port", type=int, default=5555,
+        help="Port to serve on (default: 5555)"
+    )
+    parser_serve.add_argument(
+        "-b", "--bind", default="",
+        help="Address to bind (default: all interfaces)"
+    )
+    parser_serve.add_argument(
+        "--workers", type=int, default=8,
+        help="Number of requests handled at once (default: 8)"
+    )
+    parser_serve.add_argument(
+        "-m", "--memory", action="store_true",
+        help="Render pages on demand in memory instead of serving the built site"
+    )
+    parser_serve.add_argument(
+        "--cache-mb", type=int, default=64,
+        help="Size of the in-memory page cache in MB (default: 64)"
+    )
+    parser_serve.add_argument(
+        "--no-search", dest="search", action="store_false",
+        help="Do not index the notes for /search?q="
+    )
+    parser_serve.add_argument(
+        "-w", "--watch", action="store_true",
+        help="Rebuild changed pages automatically while serving"
+    )
+    parser_serve.add_argument(
+        "-j", "--jobs", type=int, default=None,
+        help="Number of parallel build processes for full rebuilds"
+    )
+
+    # list -- list notes from the note index
+    parser_list = subparsers.add_parser(
+        'list', help='List notes from the note index, newest first'
+    )
+    parser_list.add_argument(
+        "-t", "--tags", action="store_true",
+        help="List tags with their number of notes instead"
+    )
+    parser_list.add_argument(
+        "-n", "--limit", type=int, default=None,
+        help="Show at most this many notes"
+    )
+    parser_list.add_argument(
+        "--json", action="store_true", help="Print JSON instead of a table"
+    )
+
+    # query -- search the note index
+    parser_query = subparsers.add_parser(
+        'query', help='Find notes by tag, date or title in the note index'
+    )
+    parser_query.add_argument("--tag", help="Only notes with this tag")
+    parser_query.add_argument(
+        "--since", help="Only notes dated on or after this day (YYYY-MM-DD)"
+    )
+    parser_query.add_argument(
+        "--until", help="Only notes dated on or before this day (YYYY-MM-DD)"
+    )
+    parser_query.add_argument(
+        "--title", help="Only notes whose title contains this text"
+    )
+    parser_query.add_argument(
+        "-n", "--limit", type=int, default=None,
+        help="Show at most this many notes"
+    )
+    parser_query.add_argument(
+        "--json", action="store_true", help="Print JSON instead of a table"
     )
 
     # config -- edit the config yaml in rynz project
@@ -103,9 +220,21 @@ def main():
     )
 
     # test -- test the project locally
-    subparsers.add_parser(
+    parser_test = subparsers.add_parser(
         'test', help='Test your Rynz setup and structure'
     )
+    parser_test.add_argument(
+        "--links", action="store_true",
+        help="Also check the internal links of the generated site"
+    )
+    parser_test.add_argument(
+        "-j", "--jobs", type=int, default=None,
+        help="Processes parsing pages for --links (default: CPU count)"
+    )
+    parser_test.add_argument(
+        "--rescan", action="store_true",
+        help="Parse every page for --links, not only the changed ones"
+    )
 
     # save -- stage and commit changes
     parser_save = subparsers.add_parser(
@@ -123,6 +252,7 @@ def main():
     try:
         # Handle each command based on user input
         if args.type == "create" and args.name:
+            from . import creator
             print_message(
                 f"📁 Creating project: {args.name}", "info"
             )
@@ -149,7 +279,9 @@ def main():
             sys.exit(0)
 
         elif args.type == "add" and args.name:
+            from . import creator
             if path.exists(args.name):
+                from rich.prompt import Prompt
                 overwrite = Prompt.ask(
                     f"⚠️ The file '{args.name}' already exists. Overwrite?",
                     choices=["y", "n"], default="n"
@@ -174,14 +306,29 @@ def main():
             sys.exit(0)
 
         elif args.type == 'deploy':
-            print_message(
-                "🔧 Building your static site...", "info"
+            from . import builder, profiler
+            builder.set_verbosity(
+                builder.QUIET if args.quiet else
+                builder.VERBOSE if args.verbose else builder.NORMAL
             )
-            try:
-                builder.buildRynz()
+            if not args.quiet:
                 print_message(
-                    "✅ Site deployment completed!", "success"
+                    "🔧 Building your static site...", "info"
                 )
+            try:
+                build_args = {
+                    'force': args.force, 'precompile': args.precompile,
+                    'jobs': args.jobs, 'profile': args.profile, 'top': args.top,
+                }
+                if args.cprofile:
+                    profiler.profile_call(args.cprofile, builder.buildRynz, **build_args)
+                    print_message(f"✔ cProfile stats saved to {args.cprofile}", "success")
+                else:
+                    builder.buildRynz(**build_args)
+                if not args.quiet:
+                    print_message(
+                        "✅ Site deployment completed!", "success"
+                    )
             except Exception as e:
                 print_message(
                     f"🔥 An error occurred while deploying the site: {e}", "error"
@@ -189,18 +336,45 @@ def main():
             sys.exit(0)
 
         elif args.type == 'serve':
+            from . import builder, manage
+            builder.set_verbosity(
+                builder.QUIET if args.quiet else
+                builder.VERBOSE if args.verbose else builder.NORMAL
+            )
             print_message(
-                "🚀 Serving site locally at http://localhost:5555 ...", "info"
+                f"🚀 Serving site locally at http://{args.bind or 'localhost'}:{args.port} ...",
+                "info"
             )
             try:
-                manage.server()
+                manage.server(
+                    port=args.port, bind=args.bind, workers=args.workers,
+                    watch=args.watch, jobs=args.jobs, memory=args.memory,
+                    cache_mb=args.cache_mb, search=args.search
+                )
             except Exception as e:
                 print_message(
                     f"🔥 An error occurred while serving the site: {e}", "error"
                 )
             sys.exit(0)
 
+        elif args.type == 'list':
+            from . import manage
+            if args.tags:
+                manage.show_tags(as_json=args.json)
+            else:
+                manage.show_notes(limit=args.limit, as_json=args.json)
+            sys.exit(0)
+
+        elif args.type == 'query':
+            from . import manage
+            manage.show_notes(
+                tag=args.tag, since=args.since, until=args.until,
+                title=args.title, limit=args.limit, as_json=args.json
+            )
+            sys.exit(0)
+
         elif args.type == 'config':
+            from . import manage
             print_message(
                 "⚙️ Viewing or editing config.yml...", "info"
             )
@@ -213,11 +387,14 @@ def main():
             sys.exit(0)
 
         elif args.type == 'test':
+            from . import manage
             print_message(
                 "⚙️ Running tests...", "info"
             )
             try:
                 manage.run_tests()
+                if args.links:
+                    manage.check_links(args.jobs, args.rescan)
                 print_message(
                     "✅ All tests passed successfully.", "success"
                 )
@@ -228,6 +405,7 @@ def main():
             sys.exit(0)
 
         elif args.type == 'save':
+            from . import manage
             print_message(
                 "💾 Saving changes to Git repository...", "info"
             )
@@ -0,0 +1,344 @@
+#!/bin/python3
+
+#
+#       ███╗   ██╗██╗██╗  ██╗ █████╗ ██████╗ ███████╗
+#       ████╗  ██║██║██║  ██║██╔══██╗██╔══██╗██╔════╝
+#       ██╔██╗ ██║██║███████║███████║██████╔╝███████╗
+#       ██║╚██╗██║██║██╔══██║██╔══██║██╔══██╗╚════██║
+#       ██║ ╚████║██║██║  ██║██║  ██║██║  ██║███████║
+#       ╚═╝  ╚═══╝╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
+#       DRAFTED BY [https://nih.ar] ON 18-10-2026.
+#       SOURCE [search.py] LAST MODIFIED ON 18-10-2026.
+#
+
+"""
+In-memory full-text index behind the `/search` page of `rynz serve`.
+
+Every term maps to its postings: the ids of the notes containing it in
+increasing order, a weight per note (how often the term occurs, title
+occurrences counting TITLE_BOOST times) and the term's positions in each
+note, all held in flat integer arrays. Queries intersect the postings of
+their terms starting from the rarest one, and check phrase positions only
+for notes that contain every term. A changed note gets a new id; postings
+of removed ids are dropped in bulk once they outnumber the live notes.
+"""
+
+from array import array
+from bisect import bisect_left
+from heapq import nlargest
+from itertools import compress, repeat
+from math import log
+from operator import add, sub
+import re
+from markupsafe import Markup, escape
+
+# Words are runs of letters, digits and inner underscores, casefolded
+TOKEN = re.compile(r"\w+")
+# Link targets and HTML tags are not searchable text
+MARKUP = re.compile(r"\]\([^)]*\)|<[^>]*>")
+# Emphasis, heading and link markers left out of snippets
+FORMATTING = re.compile(r"!?\[|\]|[*`#>~|]+|(?<!\w)_+|_+(?!\w)")
+QUERY_PART = re.compile(r'"([^"]*)"?|(\S+)')
+
+# Title words take positions below BODY_START, the other fields follow
+BODY_START = 1 << 10
+# Times a match in the title counts
+TITLE_BOOST = 3
+# Characters of note text shown around the first match
+SNIPPET_WIDTH = 200
+# Removed notes kept in the postings before they are compacted
+COMPACT_MIN = 1024
+
+
+def tokenize(text):
+    """
+    Splits text into search terms.
+
+    Args:
+        text (str): Plain or Markdown text.
+
+    Returns:
+        list: Casefolded terms in order of appearance.
+    """
+    text = MARKUP.sub(" ", text).casefold()
+    terms = TOKEN.findall(text)
+    if "_" in text:
+        # _emphasis_ is the word itself, snake_case stays one word
+        terms = list(filter(None, map(str.strip, terms, repeat("_"))))
+    return terms
+
+
+def parse_query(query):
+    """
+    Splits a query into the parts every result must contain. A part is a
+    "quoted phrase" or a single word; words joined by punctuation, such as
+    `rynz.serve`, form a phrase too.
+
+    Args:
+        query (str): Search box input.
+
+    Returns:
+        list: Parts, each a list of consecutive terms.
+    """
+    parts = []
+    for phrase, word in QUERY_PART.findall(query):
+        terms = tokenize(phrase or word)
+        if terms and terms not in parts:
+            parts.append(terms)
+    return parts
+
+
+class SearchIndex:
+    """
+    Positional inverted index of notes, keyed by their output name.
+
+    Not thread-safe; callers hold the live site's lock.
+    """
+
+    def __init__(self):
+        # term -> (note ids, weights, end offsets into positions, positions)
+        self.terms = {}
+        # live note id -> key, and back
+        self.docs = {}
+        self.ids = {}
+        self.next_id = 0
+        self.removed = 0
+
+    def __len__(self):
+        return len(self.docs)
+
+    def add(self, key, fields):
+        """
+        Indexes a note, replacing any earlier version of it.
+
+        Args:
+            key (str): Note identifier, such as its output name.
+            fields (list): Texts to index; the first one is the title.
+                Phrases never span two fields.
+        """
+        self.remove(key)
+        doc = self.next_id
+        self.next_id += 1
+        found = {}
+        position = 0
+        for number, text in enumerate(fields):
+            terms = tokenize(text)
+            for term in terms[:BODY_START - 1] if number == 0 else terms:
+                found.setdefault(term, []).append(position)
+                position += 1
+            position = BODY_START if number == 0 else position + 1
+
+        for term, positions in found.items():
+            postings = self.terms.get(term)
+            if postings is None:
+                postings = self.terms[term] = (
+                    array('I'), array('I'), array('I'), array('I')
+                )
+            docs, weights, ends, offsets = postings
+            docs.append(doc)
+            titled = bisect_left(positions, BODY_START) if positions[0] < BODY_START else 0
+            weights.append(len(positions) + (TITLE_BOOST - 1) * titled)
+            offsets.extend(positions)
+            ends.append(len(offsets))
+        self.ids[key] = doc
+        self.docs[doc] = key
+
+    def remove(self, key):
+        """
+        Removes a note from the results. Its postings are dropped by the
+        next compaction.
+
+        Args:
+            key (str): Note identifier.
+        """
+        doc = self.ids.pop(key, None)
+        if doc is None:
+            return
+        del self.docs[doc]
+        self.removed += 1
+        if self.removed > max(COMPACT_MIN, len(self.docs)):
+            self.compact()
+
+    def compact(self):
+        """
+        Rewrites every posting list without the ids of removed notes.
+        """
+        live = self.docs
+        for term, (docs, weights, ends, offsets) in list(self.terms.items()):
+            keep = list(map(live.__contains__, docs))
+            if not any(keep):
+                del self.terms[term]
+                continue
+            if all(keep):
+                continue
+            kept = (array('I'), array('I', compress(weights, keep)), array('I'), array('I'))
+            start = 0
+            for doc, end, alive in zip(docs, ends, keep):
+                if alive:
+                    kept[0].append(doc)
+                    kept[3].extend(offsets[start:end])
+                    kept[2].append(len(kept[3]))
+                start = end
+            self.terms[term] = kept
+        self.removed = 0
+
+    def phrase_counts(self, part, candidates, places):
+        """
+        Counts a phrase in every candidate note.
+
+        Args:
+            part (list): Consecutive terms.
+            candidates (list): Note ids containing every term.
+            places (dict): Term -> note id -> position in its postings.
+
+        Returns:
+            list: Occurrences per candidate, title occurrences counting
+            TITLE_BOOST times.
+        """
+        first, *rest = [
+            (self.terms[term][2], self.terms[term][3], places[term]) for term in part
+        ]
+        counts = []
+        for doc in candidates:
+            ends, offsets, where = first
+            index = where[doc]
+            starts = set(offsets[ends[index - 1] if index else 0:ends[index]])
+            for shift, (ends, offsets, where) in enumerate(rest, 1):
+                index = where[doc]
+                starts.intersection_update(map(
+                    sub, offsets[ends[index - 1] if index else 0:ends[index]], repeat(shift)
+                ))
+                if not starts:
+                    break
+            if starts and min(starts) < BODY_START:
+                titled = sum(1 for start in starts if start < BODY_START)
+                counts.append(len(starts) + (TITLE_BOOST - 1) * titled)
+            else:
+                counts.append(len(starts))
+        return counts
+
+    def search(self, query, count=20):
+        """
+        Finds the notes matching every part of a query. Notes are ranked by
+        how often each part occurs, weighted by the rarity of its terms.
+
+        Args:
+            query (str): Words and "quoted phrases".
+            count (int): Number of best results to return.
+
+        Returns:
+            tuple: (number of matching notes, keys of the best `count`
+            notes, most relevant first).
+        """
+        parts = parse_query(query)
+        terms = {term for part in parts for term in part}
+        if not terms or not all(term in self.terms for term in terms):
+            return 0, []
+        if len(parts) == 1 and len(parts[0]) == 1:
+            # A single word is ranked straight from its weights
+            docs, weights = self.terms[parts[0][0]][:2]
+            # Newest first, so ties rarely displace the running best
+            ranked = zip(reversed(weights), reversed(docs))
+            total = len(docs)
+            if self.removed:
+                alive = list(map(self.docs.__contains__, reversed(docs)))
+                ranked = compress(ranked, alive)
+                total = sum(alive)
+            return total, [self.docs[doc] for _weight, doc in nlargest(count, ranked)]
+
+        order = sorted(terms, key=lambda term: len(self.terms[term][0]))
+        docs = self.terms[order[0]][0]
+        candidates = list(filter(self.docs.__contains__, docs)) if self.removed else docs
+
+        # Position of every candidate in each term's postings
+        places = {}
+        for term in order:
+            places[term] = locate(self.terms[term][0], candidates)
+            candidates = list(filter(places[term].__contains__, candidates))
+            if not candidates:
+                return 0, []
+
+        scores = None
+        for part in parts:
+            weight = sum(log(1 + len(self.docs) / len(self.terms[term][0])) for term in part)
+            if len(part) == 1:
+                counts = map(
+                    self.terms[part[0]][1].__getitem__,
+                    map(places[part[0]].__getitem__, candidates)
+                )
+            else:
+                counts = self.phrase_counts(part, candidates, places)
+                if not all(counts):
+                    keep = list(map(bool, counts))
+                    candidates = list(compress(candidates, keep))
+                    counts = list(compress(counts, keep))
+                    scores = None if scores is None else list(compress(scores, keep))
+            part_scores = map(weight.__mul__, counts)
+            scores = list(part_scores if scores is None else map(add, scores, part_scores))
+        best = nlargest(count, zip(reversed(scores), reversed(candidates)))
+        return len(candidates), [self.docs[doc] for _score, doc in best]
+
+
+def locate(docs, candidates):
+    """
+    Finds candidate notes in a posting list, by binary search when there
+    are few candidates and through a lookup table otherwise.
+
+    Args:
+        docs (array): Ascending note ids of one term.
+        candidates (list): Ascending note ids to look up.
+
+    Returns:
+        dict: Note id -> position in docs, for the candidates present
+        (possibly with other notes of docs as well).
+    """
+    if len(candidates) * 16 >= len(docs):
+        return dict(zip(docs, range(len(docs))))
+    found = {}
+    for doc in candidates:
+        index = bisect_left(docs, doc)
+        if index < len(docs) and docs[index] == doc:
+            found[doc] = index
+    return found
+
+
+def snippet(text, query, width=SNIPPET_WIDTH):
+    """
+    Cuts the text around the first match of a query and highlights the
+    matched words with <mark>.
+
+    Args:
+        text (str): Markdown source of a note.
+        query (str): Search box input.
+        width (int): Approximate snippet length in characters.
+
+    Returns:
+        Markup: Escaped snippet, safe to insert into a page.
+    """
+    plain = " ".join(FORMATTING.sub(" ", MARKUP.sub(" ", text)).split())
+    terms = {term for part in parse_query(query) for term in part}
+    if not terms:
+        return Markup("")
+    pattern = re.compile(
+        r"(?<!\w)(?:%s)(?!\w)" % "|".join(map(re.escape, sorted(terms, key=len, reverse=True))),
+        re.IGNORECASE
+    )
+    first = pattern.search(plain)
+    start = 0 if first is None else max(0, first.start() - width // 4)
+    if start:
+        start = plain.find(" ", start) + 1 or start
+    end = min(len(plain), start + width)
+    if end < len(plain) and plain.rfind(" ", start, end) > start:
+        end = plain.rfind(" ", start, end)
+    window = plain[start:end]
+
+    pieces = [Markup("… ") if start else Markup("")]
+    last = 0
+    for match in pattern.finditer(window):
+        pieces.append(escape(window[last:match.start()]))
+        pieces.append(Markup("<mark>%s</mark>") % match.group())
+        last = match.end()
+    pieces.append(escape(window[last:]))
+    if end < len(plain):
+        pieces.append(Markup(" …"))
+    return Markup("").join(pieces)
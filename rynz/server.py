@@ -0,0 +1,468 @@
+#!/bin/python3
+
+#
+#       ███╗   ██╗██╗██╗  ██╗ █████╗ ██████╗ ███████╗
+#       ████╗  ██║██║██║  ██║██╔══██╗██╔══██╗██╔════╝
+#       ██╔██╗ ██║██║███████║███████║██████╔╝███████╗
+#       ██║╚██╗██║██║██╔══██║██╔══██║██╔══██╗╚════██║
+#       ██║ ╚████║██║██║  ██║██║  ██║██║  ██║███████║
+#       ╚═╝  ╚═══╝╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
+#       DRAFTED BY [https://nih.ar] ON 18-10-2026.
+#       SOURCE [server.py] LAST MODIFIED ON 18-10-2026.
+#
+
+"""
+HTTP server behind `rynz serve`.
+
+Serves home_path with HTTP/1.1 keep-alive on a thread per connection, up
+to MAX_CONNECTIONS; at most `workers` requests are handled at once, and an
+idle keep-alive connection holds no worker. Responses carry strong ETags
+derived from file content, and conditional requests are answered with 304.
+Precompressed .gz siblings written at deploy time are served to clients
+accepting gzip. In memory mode pages are rendered on demand instead of
+read from home_path. Small, frequently requested files are kept in an
+in-memory LRU cache that is revalidated by stat on every request, so
+rebuilt pages are picked up immediately. `/search?q=` answers from an
+in-memory full-text index of the notes.
+"""
+
+from os import path, stat, fstat
+from io import BytesIO
+from hashlib import sha256
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from http import HTTPStatus
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from threading import BoundedSemaphore, Lock
+import re
+from urllib.parse import urlsplit, unquote, parse_qs
+from . import builder, live
+
+# Default in-memory cache limits
+CACHE_MAX_BYTES = 32 * 1024 * 1024
+CACHE_MAX_FILE = 1024 * 1024
+
+# Open connections beyond which new clients get a 503
+MAX_CONNECTIONS = 256
+
+# Request paths answered by the search index
+SEARCH_PATHS = ("/search", "/search/")
+
+# Fingerprinted asset names, e.g. css/site.0123456789.css, never change content
+FINGERPRINTED = re.compile(r"\.[0-9a-f]{%d}\.[^./]+$" % builder.FINGERPRINT_LENGTH)
+
+
+class FileCache:
+    """
+    Thread-safe LRU cache of file bodies and ETags, bounded by total size.
+
+    Entries are keyed by path and validated against (mtime_ns, size), so a
+    file rewritten by a deploy is re-read on its next request.
+    """
+
+    def __init__(self, max_bytes=CACHE_MAX_BYTES, max_file=CACHE_MAX_FILE):
+        self.max_bytes = max_bytes
+        self.max_file = max_file
+        self.size = 0
+        self.entries = OrderedDict()
+        self.etags = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, filepath, signature):
+        """
+        Returns the cached body for a file if it is still current.
+
+        Args:
+            filepath (str): Absolute file path.
+            signature (tuple): (mtime_ns, size) of the file on disk.
+
+        Returns:
+            tuple: (body, etag), or None on a miss.
+        """
+        with self.lock:
+            entry = self.entries.get(filepath)
+            if entry is None or entry[0] != signature:
+                return None
+            self.entries.move_to_end(filepath)
+            return entry[1], entry[2]
+
+    def put(self, filepath, signature, body, etag):
+        """
+        Stores a file body, evicting the least recently used entries.
+
+        Args:
+            filepath (str): Absolute file path.
+            signature (tuple): (mtime_ns, size) of the file on disk.
+            body (bytes): File content.
+            etag (str): Strong ETag of the content.
+        """
+        if len(body) > self.max_file:
+            return
+        with self.lock:
+            old = self.entries.pop(filepath, None)
+            if old is not None:
+                self.size -= len(old[1])
+            self.entries[filepath] = (signature, body, etag)
+            self.size += len(body)
+            while self.size > self.max_bytes and self.entries:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= len(evicted[1])
+
+    def etag(self, filepath, signature, fileobj):
+        """
+        Returns the ETag of a file too large to cache, hashing it only once
+        per version.
+
+        Args:
+            filepath (str): Absolute file path.
+            signature (tuple): (mtime_ns, size) of the file on disk.
+            fileobj (file): Open binary file, rewound after hashing.
+
+        Returns:
+            str: Strong ETag.
+        """
+        with self.lock:
+            known = self.etags.get(filepath)
+            if known is not None and known[0] == signature:
+                self.etags.move_to_end(filepath)
+                return known[1]
+        digest = sha256()
+        for chunk in iter(lambda: fileobj.read(65536), b""):
+            digest.update(chunk)
+        fileobj.seek(0)
+        etag = make_etag(digest)
+        with self.lock:
+            self.etags[filepath] = (signature, etag)
+            if len(self.etags) > 4096:
+                self.etags.popitem(last=False)
+        return etag
+
+
+def make_etag(digest):
+    """
+    Formats a strong ETag from a content digest.
+
+    Args:
+        digest: hashlib object holding the file content.
+
+    Returns:
+        str: Quoted ETag.
+    """
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+class RynzRequestHandler(SimpleHTTPRequestHandler):
+    """
+    Static file handler with keep-alive, ETags, 304 responses and caching.
+
+    `/page` is served from `/page.html` when no such file or directory exists.
+    `/search` renders results from the live site's search index, if any.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # Drop idle keep-alive connections so they do not hold a connection slot
+    timeout = 15
+    cache = None
+    search_site = None
+
+    def do_GET(self):
+        # Only requests being answered take a worker, idle connections wait
+        # for their next request without one
+        with self.server.workers:
+            super().do_GET()
+
+    def do_HEAD(self):
+        with self.server.workers:
+            super().do_HEAD()
+
+    def resolve(self):
+        """
+        Maps the request path to a file under the served directory.
+
+        Returns:
+            str: File path, a directory path needing a redirect, or None.
+        """
+        filepath = self.translate_path(self.path)
+        if path.isdir(filepath):
+            if not urlsplit(self.path).path.endswith('/'):
+                return filepath
+            filepath = path.join(filepath, "index.html")
+        elif not path.exists(filepath) and path.isfile(filepath + ".html"):
+            filepath += ".html"
+        return filepath if path.isfile(filepath) else None
+
+    def accepts_gzip(self):
+        """
+        Checks whether the client accepts gzip-encoded responses.
+
+        Returns:
+            bool: True unless gzip is absent or refused with q=0.
+        """
+        for coding in self.headers.get("Accept-Encoding", "").split(","):
+            name, _, params = coding.strip().partition(";")
+            if name.strip().lower() in ("gzip", "*"):
+                quality = params.strip().replace(" ", "")
+                return quality not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+        return False
+
+    def not_modified(self, etag, mtime):
+        """
+        Checks the request's validators against the current file.
+
+        Args:
+            etag (str): Current ETag.
+            mtime (float): Current modification time in seconds, or None.
+
+        Returns:
+            bool: True if the client's copy is still current.
+        """
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            tags = [tag.strip() for tag in if_none_match.split(",")]
+            return "*" in tags or etag in tags or f"W/{etag}" in tags
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since and mtime is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError, IndexError, OverflowError):
+                return False
+            return int(mtime) <= since
+        return False
+
+    def send_head(self):
+        """
+        Sends the response headers and returns the body to copy, if any.
+
+        Returns:
+            file: File-like body, or None when no body follows.
+        """
+        url = urlsplit(self.path)
+        if self.search_site is not None and url.path in SEARCH_PATHS:
+            return self.send_search(url.query)
+
+        filepath = self.resolve()
+        if filepath is None:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+        if path.isdir(filepath):
+            # Let the stock handler issue the trailing-slash redirect
+            return super().send_head()
+
+        # Prefer a precompressed sibling that is at least as new as the file;
+        # deploys drop the .gz of replaced resources, whose mtime may be older
+        content_type = self.guess_type(filepath)
+        variant, encoding = filepath, None
+        try:
+            has_gzip = stat(filepath + ".gz").st_mtime_ns >= stat(filepath).st_mtime_ns
+        except OSError:
+            has_gzip = False
+        if has_gzip and self.accepts_gzip():
+            variant, encoding = filepath + ".gz", "gzip"
+
+        try:
+            fileobj = open(variant, 'rb')
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+
+        try:
+            info = fstat(fileobj.fileno())
+            signature = (info.st_mtime_ns, info.st_size)
+            length = info.st_size
+            cached = self.cache.get(variant, signature)
+            if cached is not None:
+                fileobj.close()
+                body, etag = cached
+                fileobj, length = BytesIO(body), len(body)
+            elif info.st_size <= self.cache.max_file:
+                body = fileobj.read()
+                fileobj.close()
+                etag = make_etag(sha256(body))
+                self.cache.put(variant, signature, body, etag)
+                fileobj, length = BytesIO(body), len(body)
+            else:
+                etag = self.cache.etag(variant, signature, fileobj)
+
+            if not self.send_headers(
+                content_type, length, etag, info.st_mtime, encoding, has_gzip,
+                FINGERPRINTED.search(filepath) is not None
+            ):
+                fileobj.close()
+                return None
+            return fileobj
+        except Exception:
+            fileobj.close()
+            raise
+
+    def send_search(self, query_string):
+        """
+        Sends a page of search results, revalidated on every request since
+        the index follows note edits.
+
+        Args:
+            query_string (str): Query part of the URL, with `q` and `page`.
+
+        Returns:
+            file: File-like body, or None when no body follows.
+        """
+        params = parse_qs(query_string)
+        query = params.get('q', [""])[0].strip()
+        try:
+            page = int(params.get('page', ["1"])[0])
+        except ValueError:
+            page = 1
+        html = live.site_search(self.search_site, query, page)
+        if html is None:
+            self.send_error(HTTPStatus.NOT_FOUND, "Search is not configured")
+            return None
+        body = html.encode('utf8', errors='ignore')
+        if not self.send_headers("text/html", len(body), make_etag(sha256(body))):
+            return None
+        return BytesIO(body)
+
+    def send_headers(self, content_type, length, etag, mtime=None, encoding=None, vary=False,
+                     immutable=False):
+        """
+        Sends a 200 response's headers, or a bare 304 when the client's copy
+        is still current.
+
+        Args:
+            content_type (str): MIME type of the body.
+            length (int): Body length in bytes.
+            etag (str): Strong ETag of the body.
+            mtime (float): Modification time, or None if not file-backed.
+            encoding (str): Content-Encoding of the body, if any.
+            vary (bool): Whether the body depends on Accept-Encoding.
+            immutable (bool): Whether the file is a fingerprinted asset that
+                may be cached for good.
+
+        Returns:
+            bool: True if a body should follow.
+        """
+        fresh = self.not_modified(etag, mtime)
+        self.send_response(HTTPStatus.NOT_MODIFIED if fresh else HTTPStatus.OK)
+        self.send_header("ETag", etag)
+        if mtime is not None:
+            self.send_header("Last-Modified", formatdate(mtime, usegmt=True))
+        if vary:
+            self.send_header("Vary", "Accept-Encoding")
+        if not fresh:
+            self.send_header("Content-Type", content_type)
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            self.send_header("Content-Length", str(length))
+            if immutable:
+                self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+            else:
+                self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        return not fresh
+
+
+class LiveRequestHandler(RynzRequestHandler):
+    """
+    Handler for `rynz serve --memory`: notes, index.html and rss.xml are
+    rendered on first request and kept in the LRU cache until their sources
+    change. Everything else is served from resource_path.
+    """
+
+    site = None
+
+    def send_head(self):
+        """
+        Sends a rendered page, or falls back to static resources.
+
+        Returns:
+            file: File-like body, or None when no body follows.
+        """
+        url = urlsplit(self.path)
+        if self.search_site is not None and url.path in SEARCH_PATHS:
+            return self.send_search(url.query)
+        name = unquote(url.path).lstrip('/')
+        if name == "" or name.endswith('/'):
+            name += "index.html"
+        elif not name.endswith(('.html', '.xml')) and '.' not in path.basename(name):
+            name += ".html"
+        key = live.site_lookup(self.site, name)
+        if key is None:
+            return super().send_head()
+
+        cached = self.cache.get(name, key)
+        if cached is None:
+            body = live.site_render(self.site, name).encode('utf8', errors='ignore')
+            etag = make_etag(sha256(body))
+            self.cache.put(name, key, body, etag)
+        else:
+            body, etag = cached
+        if not self.send_headers(self.guess_type(name), len(body), etag):
+            return None
+        return BytesIO(body)
+
+
+class PooledHTTPServer(ThreadingHTTPServer):
+    """
+    HTTPServer that gives every connection a thread, handles at most
+    `workers` requests at a time and turns away connections beyond
+    `max_connections` with a 503.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, server_address, handler_class, workers=8,
+                 max_connections=MAX_CONNECTIONS):
+        super().__init__(server_address, handler_class)
+        self.workers = BoundedSemaphore(max(1, workers))
+        self.connections = BoundedSemaphore(max(1, max_connections))
+
+    def process_request(self, request, client_address):
+        if not self.connections.acquire(blocking=False):
+            try:
+                request.sendall(
+                    b"HTTP/1.1 503 Service Unavailable\r\n"
+                    b"Content-Length: 0\r\nConnection: close\r\n\r\n"
+                )
+            except OSError:
+                pass
+            self.shutdown_request(request)
+            return
+        super().process_request(request, client_address)
+
+    def process_request_thread(self, request, client_address):
+        try:
+            super().process_request_thread(request, client_address)
+        finally:
+            self.connections.release()
+
+
+def make_server(home_path, bind="", port=5555, workers=8, cache_size=CACHE_MAX_BYTES,
+                site=None, search=None):
+    """
+    Creates the HTTP server for a site's output directory.
+
+    Args:
+        home_path (str): Directory to serve.
+        bind (str): Address to bind, empty for all interfaces.
+        port (int): Port to listen on.
+        workers (int): Number of requests handled at once.
+        cache_size (int): In-memory cache budget in bytes.
+        site (dict): Live site from live.load_site() to render pages on
+            demand instead of serving built files.
+        search (dict): Live site whose search index answers /search, or
+            None to disable search.
+
+    Returns:
+        PooledHTTPServer: Server ready for serve_forever().
+    """
+    if site is None:
+        base, cache = RynzRequestHandler, FileCache(cache_size)
+    else:
+        # Rendered pages such as a large rss.xml must fit the cache whole
+        base, cache = LiveRequestHandler, FileCache(cache_size, max_file=cache_size)
+    handler = type(
+        "SiteRequestHandler", (base,), {'cache': cache, 'site': site, 'search_site': search}
+    )
+
+    def factory(*args, **kwargs):
+        return handler(*args, directory=home_path, **kwargs)
+
+    return PooledHTTPServer((bind, port), factory, workers=workers)
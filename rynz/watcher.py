@@ -0,0 +1,291 @@
+#!/bin/python3
+
+#
+#       ███╗   ██╗██╗██╗  ██╗ █████╗ ██████╗ ███████╗
+#       ████╗  ██║██║██║  ██║██╔══██╗██╔══██╗██╔════╝
+#       ██╔██╗ ██║██║███████║███████║██████╔╝███████╗
+#       ██║╚██╗██║██║██╔══██║██╔══██║██╔══██╗╚════██║
+#       ██║ ╚████║██║██║  ██║██║  ██║██║  ██║███████║
+#       ╚═╝  ╚═══╝╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
+#       DRAFTED BY [https://nih.ar] ON 18-10-2026.
+#       SOURCE [watcher.py] LAST MODIFIED ON 18-10-2026.
+#
+
+"""
+File watching for `rynz serve --watch`.
+
+Uses Linux inotify through ctypes when available and falls back to
+polling os.scandir() stat results elsewhere. Bursts of editor writes are
+debounced into a single set of changed paths.
+"""
+
+from os import path, scandir, stat, read, close, O_CLOEXEC, O_NONBLOCK
+from select import select
+from struct import calcsize, unpack_from
+from time import sleep
+import ctypes
+import ctypes.util
+import sys
+
+# inotify event masks (see inotify(7))
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_ISDIR = 0x40000000
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+)
+EVENT_HEADER = "iIII"
+EVENT_HEADER_SIZE = calcsize(EVENT_HEADER)
+
+
+def walk_dirs(root):
+    """
+    Yields root and every directory below it.
+
+    Args:
+        root (str): Directory to walk.
+
+    Yields:
+        str: Directory paths.
+    """
+    yield root
+    try:
+        entries = list(scandir(root))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from walk_dirs(entry.path)
+
+
+def snapshot(roots, files):
+    """
+    Collects (mtime, size) for every file below roots plus the given files.
+
+    Args:
+        roots (list): Directories to scan recursively.
+        files (list): Individual files to stat.
+
+    Returns:
+        dict: Mapping of path to (mtime_ns, size).
+    """
+    stats = {}
+    for root in roots:
+        for directory in walk_dirs(root):
+            try:
+                entries = list(scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    try:
+                        result = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    stats[entry.path] = (result.st_mtime_ns, result.st_size)
+    for filepath in files:
+        try:
+            result = stat(filepath)
+        except OSError:
+            continue
+        stats[filepath] = (result.st_mtime_ns, result.st_size)
+    return stats
+
+
+def stat_reader(roots, files):
+    """
+    Creates a change reader that compares stat snapshots.
+
+    Args:
+        roots (list): Directories to watch recursively.
+        files (list): Individual files to watch.
+
+    Returns:
+        tuple: (read, close) functions. read(timeout) waits timeout seconds
+        and returns the set of paths created, modified or deleted.
+    """
+    state = {'before': snapshot(roots, files)}
+
+    def read_changes(timeout):
+        sleep(timeout)
+        after = snapshot(roots, files)
+        before = state['before']
+        state['before'] = after
+        return {
+            filepath for filepath in before.keys() | after.keys()
+            if before.get(filepath) != after.get(filepath)
+        }
+
+    return read_changes, lambda: None
+
+
+def load_inotify():
+    """
+    Loads the inotify functions from libc.
+
+    Returns:
+        CDLL: libc handle, or None when inotify is unavailable.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+def inotify_reader(libc, roots, files):
+    """
+    Creates a change reader backed by inotify.
+
+    Args:
+        libc (CDLL): libc handle from load_inotify().
+        roots (list): Directories to watch recursively.
+        files (list): Individual files to watch.
+
+    Returns:
+        tuple: (read, close) functions. read(timeout) waits up to timeout
+        seconds for events and returns the set of paths they touched. A
+        folder that was deleted or moved away is reported as its own path,
+        and a queue overflow reports every root and file.
+    """
+    fd = libc.inotify_init1(O_NONBLOCK | O_CLOEXEC)
+    if fd < 0:
+        raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+    watches = {}
+    watched_files = {}
+    for filepath in files:
+        watched_files.setdefault(path.dirname(filepath) or ".", set()).add(filepath)
+    prefixes = tuple(root.rstrip(path.sep) + path.sep for root in roots)
+
+    def add_watch(directory):
+        wd = libc.inotify_add_watch(fd, directory.encode(), WATCH_MASK)
+        if wd >= 0:
+            watches[wd] = directory
+
+    def drop_watches(folder):
+        prefix = folder + path.sep
+        for wd, directory in list(watches.items()):
+            if directory == folder or directory.startswith(prefix):
+                # Moved folders keep their watch unless it is removed
+                libc.inotify_rm_watch(fd, wd)
+                del watches[wd]
+
+    def add_watches():
+        for root in roots:
+            for directory in walk_dirs(root):
+                add_watch(directory)
+        for directory in watched_files:
+            if directory not in watches.values():
+                add_watch(directory)
+
+    add_watches()
+
+    def read_changes(timeout):
+        ready, _, _ = select([fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            buffer = read(fd, 65536)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        offset = 0
+        while offset + EVENT_HEADER_SIZE <= len(buffer):
+            wd, mask, _cookie, length = unpack_from(EVENT_HEADER, buffer, offset)
+            offset += EVENT_HEADER_SIZE
+            name = buffer[offset:offset + length].split(b"\0", 1)[0].decode()
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                # Events were lost: have everything rescanned
+                add_watches()
+                changed.update(roots, files)
+                continue
+            directory = watches.get(wd)
+            if directory is None:
+                continue
+            if mask & IN_IGNORED:
+                watches.pop(wd, None)
+                continue
+            if not name:
+                if mask & IN_DELETE_SELF and (
+                    directory in roots or directory.startswith(prefixes)
+                ):
+                    drop_watches(directory)
+                    changed.add(directory)
+                continue
+            filepath = path.normpath(path.join(directory, name))
+
+            # Directories watched only for single files report nothing else
+            in_root = filepath in roots or filepath.startswith(prefixes)
+            if not in_root and filepath not in watched_files.get(directory, ()):
+                continue
+
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    for subdir in walk_dirs(filepath):
+                        add_watch(subdir)
+                    changed.update(snapshot([filepath], []))
+                elif mask & (IN_MOVED_FROM | IN_DELETE):
+                    drop_watches(filepath)
+                    changed.add(filepath)
+                continue
+            changed.add(filepath)
+        return changed
+
+    return read_changes, lambda: close(fd)
+
+
+def watch(roots, files, debounce=0.1, interval=0.5):
+    """
+    Watches directories and files, yielding debounced batches of changes.
+
+    Args:
+        roots (list): Directories to watch recursively.
+        files (list): Individual files to watch.
+        debounce (float): Quiet period that ends a burst of writes.
+        interval (float): Polling interval when inotify is unavailable.
+
+    Yields:
+        set: Normalised paths changed during one burst.
+    """
+    roots = [path.normpath(root) for root in roots if path.isdir(root)]
+    files = [path.normpath(filepath) for filepath in files]
+    libc = load_inotify()
+    try:
+        if libc is None:
+            raise OSError("inotify is not available")
+        read_changes, close_reader = inotify_reader(libc, roots, files)
+    except OSError:
+        read_changes, close_reader = stat_reader(roots, files)
+
+    try:
+        while True:
+            pending = read_changes(interval)
+            if not pending:
+                continue
+            # Keep absorbing events until the burst goes quiet
+            while True:
+                more = read_changes(debounce)
+                if not more:
+                    break
+                pending |= more
+            yield {path.normpath(filepath) for filepath in pending}
+    finally:
+        close_reader()
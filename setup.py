@@ -29,6 +29,10 @@ setup(
     install_requires=[
         'markdown2', 'Jinja2', 'pyyaml', 'rich',
     ],
+    extras_require={
+        'markdown-it': ['markdown-it-py'],
+        'mistune': ['mistune>=3'],
+    },
     keywords=['python', 'static site generator', 'markdown', 'Jinja2', 'pyyaml'],
     classifiers=[
         "Development Status :: 5 - Production/Stable", 
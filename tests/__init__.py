@@ -0,0 +1,3 @@
+"""
+Tests for rynz. Run from the repository root with `python -m unittest discover`.
+"""
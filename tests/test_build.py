@@ -0,0 +1,264 @@
+#!/bin/python3
+
+#
+#       ███╗   ██╗██╗██╗  ██╗ █████╗ ██████╗ ███████╗
+#       ████╗  ██║██║██║  ██║██╔══██╗██╔══██╗██╔════╝
+#       ██╔██╗ ██║██║███████║███████║██████╔╝███████╗
+#       ██║╚██╗██║██║██╔══██║██╔══██║██╔══██╗╚════██║
+#       ██║ ╚████║██║██║  ██║██║  ██║██║  ██║███████║
+#       ╚═╝  ╚═══╝╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
+#       DRAFTED BY [https://nih.ar] ON 18-10-2026.
+#       SOURCE [test_build.py] LAST MODIFIED ON 18-10-2026.
+#
+
+"""
+Tests for deploys of projects set up by `rynz create`.
+"""
+
+from contextlib import redirect_stdout
+from gzip import decompress
+from io import StringIO
+from os import chdir, getcwd, listdir, makedirs, path, rename, utime
+from tempfile import TemporaryDirectory
+import unittest
+from unittest import mock
+from yaml import safe_load
+from rynz import builder, creator, linkcheck
+
+
+class SiteTestCase(unittest.TestCase):
+    """
+    Runs each test inside a fresh `rynz create` project.
+    """
+
+    def setUp(self):
+        self.workdir = TemporaryDirectory()
+        self.addCleanup(self.workdir.cleanup)
+        cwd = getcwd()
+        self.addCleanup(chdir, cwd)
+        chdir(self.workdir.name)
+        builder.set_verbosity(builder.QUIET)
+        self.addCleanup(builder.set_verbosity, builder.NORMAL)
+        with redirect_stdout(StringIO()):
+            creator.createRynz("site")
+            chdir("site")
+            creator.createNote("guides/setup")
+
+    def configure(self, settings):
+        """
+        Appends settings to config.yml.
+
+        Args:
+            settings (str): YAML lines.
+        """
+        with open('config.yml', 'a', encoding='utf8') as config_file:
+            config_file.write(settings)
+
+    def deploy(self, **kwargs):
+        """
+        Builds the site and returns its configuration.
+
+        Returns:
+            dict: Loaded config.yml.
+        """
+        self.assertIsNotNone(builder.buildRynz(**kwargs))
+        with open('config.yml', encoding='utf8') as config_file:
+            return safe_load(config_file)
+
+
+class FingerprintTest(SiteTestCase):
+    """
+    Generated templates must link the published names of fingerprinted assets.
+    """
+
+    def test_created_site_has_no_dangling_asset_links(self):
+        self.configure("fingerprint_assets: [css, js]\n")
+        config = self.deploy()
+
+        self.assertFalse(path.exists(path.join("public", "demo.css")))
+        report = linkcheck.check_links(config, jobs=1)
+        self.assertGreater(report['links'], 0)
+        self.assertEqual(report['dangling'], [])
+
+    def test_created_site_builds_without_css(self):
+        with open('config.yml', encoding='utf8') as config_file:
+            lines = config_file.readlines()
+        with open('config.yml', 'w', encoding='utf8') as config_file:
+            config_file.writelines(line for line in lines if not line.startswith("css:"))
+        self.configure("fingerprint_assets: [css, js]\n")
+        self.deploy()
+
+        with open(path.join("public", "guides", "setup.html"), encoding='utf8') as page:
+            self.assertNotIn("None", page.read())
+
+
+class PrecompressTest(SiteTestCase):
+    """
+    Precompressed siblings must follow the content of their file.
+    """
+
+    def test_resource_replaced_with_older_mtime_is_recompressed(self):
+        self.configure("precompress: true\n")
+        self.deploy()
+        with open(path.join("public", "demo.css.gz"), 'rb') as gz_file:
+            self.assertIn(b"max-width", decompress(gz_file.read()))
+
+        # New content carrying an mtime older than the existing .gz
+        with open(path.join("static", "demo.css"), 'w', encoding='utf8') as css_file:
+            css_file.write("body { color: #123456; }\n")
+        utime(path.join("static", "demo.css"), (1_000_000_000, 1_000_000_000))
+        self.deploy()
+
+        with open(path.join("public", "demo.css"), 'rb') as css_file:
+            plain = css_file.read()
+        with open(path.join("public", "demo.css.gz"), 'rb') as gz_file:
+            self.assertEqual(decompress(gz_file.read()), plain)
+        self.assertIn(b"#123456", plain)
+
+
+class UnchangedNoteTest(SiteTestCase):
+    """
+    Redeploys must not read notes whose (mtime, size) did not change.
+    """
+
+    def test_only_changed_notes_are_read(self):
+        self.deploy()
+        with open(path.join("public", "index.html"), encoding='utf8') as index_file:
+            index = index_file.read()
+
+        with mock.patch.object(builder, "load_note", wraps=builder.load_note) as load:
+            self.deploy()
+            load.assert_not_called()
+        with open(path.join("public", "index.html"), encoding='utf8') as index_file:
+            self.assertEqual(index_file.read(), index)
+
+        note_path = path.join("content", "note", "guides", "setup.md")
+        with open(note_path, 'a', encoding='utf8') as note_file:
+            note_file.write("\nEdited.\n")
+        with mock.patch.object(builder, "load_note", wraps=builder.load_note) as load:
+            self.deploy()
+            self.assertEqual([call.args[0] for call in load.call_args_list], [note_path])
+        with open(path.join("public", "guides", "setup.html"), encoding='utf8') as page:
+            self.assertIn("Edited.", page.read())
+
+
+class TemplateChangeTest(SiteTestCase):
+    """
+    Templates pulled in by the configured ones must invalidate every page.
+    """
+
+    def test_changed_include_rebuilds_notes(self):
+        note_template = path.join("template", "note_template.html")
+        with open(note_template, encoding='utf8') as template_file:
+            html = template_file.read()
+        with open(note_template, 'w', encoding='utf8') as template_file:
+            template_file.write(html.replace(
+                "</body>", '{% include "template/partials/credit.html" %}</body>'
+            ))
+        makedirs(path.join("template", "partials"))
+        credit = path.join("template", "partials", "credit.html")
+        with open(credit, 'w', encoding='utf8') as credit_file:
+            credit_file.write("<p>First credit</p>")
+        self.deploy()
+
+        with open(credit, 'w', encoding='utf8') as credit_file:
+            credit_file.write("<p>Second credit</p>")
+        self.deploy()
+        with open(path.join("public", "guides", "setup.html"), encoding='utf8') as page:
+            self.assertIn("Second credit", page.read())
+
+
+class SitemapTest(SiteTestCase):
+    """
+    Large sitemaps are split into shards listed by a sitemap index, and only
+    changed shards are rewritten.
+    """
+
+    def read(self, filename):
+        with open(path.join("public", filename), encoding='utf8') as sitemap_file:
+            return sitemap_file.read()
+
+    def shards(self):
+        return sorted(name for name in listdir("public") if name.startswith("sitemap-"))
+
+    def written(self):
+        """
+        Deploys and returns the sitemap files written.
+        """
+        with mock.patch.object(builder, "write_xml", wraps=builder.write_xml) as write:
+            self.deploy()
+        return sorted(call.args[1] for call in write.call_args_list)
+
+    def test_shards_follow_the_limit(self):
+        self.configure("sitemap: true\n")
+        self.deploy()
+        urls = self.read("sitemap.xml").count("<loc>")
+        self.assertIn("<urlset", self.read("sitemap.xml"))
+        self.assertEqual(self.shards(), [])
+
+        with mock.patch.object(builder, "SITEMAP_LIMIT", 2):
+            self.deploy()
+            shards = self.shards()
+            self.assertEqual(len(shards), (urls + 1) // 2)
+            index = self.read("sitemap.xml")
+            self.assertIn("<sitemapindex", index)
+            for filename in shards:
+                self.assertIn(f"/{filename}</loc>", index)
+            self.assertEqual(sum(self.read(name).count("<loc>") for name in shards), urls)
+
+            # Nothing changed, nothing is written
+            self.assertEqual(self.written(), [])
+
+            # An older `updated` date only moves the shard holding the note
+            note_path = path.join("content", "note", "guides", "setup.md")
+            with open(note_path, encoding='utf8') as note_file:
+                note = note_file.read()
+            with open(note_path, 'w', encoding='utf8') as note_file:
+                note_file.write(note.replace("---\n", "---\nupdated: 2020-01-02\n", 1))
+            self.assertEqual(self.written(), ["sitemap-1.xml"])
+            self.assertIn("<lastmod>2020-01-02</lastmod>", self.read("sitemap-1.xml"))
+
+        # Back under the limit, the shards go
+        self.deploy()
+        self.assertEqual(self.shards(), [])
+        self.assertIn("<urlset", self.read("sitemap.xml"))
+        self.assertEqual(self.read("sitemap.xml").count("<loc>"), urls)
+
+
+class WatchTest(SiteTestCase):
+    """
+    Watch mode rebuilds must leave no page behind for notes that left the
+    site.
+    """
+
+    def test_note_without_frontmatter_loses_its_page(self):
+        state = builder.buildRynz()
+        page = path.join("public", "guides", "setup.html")
+        self.assertTrue(path.exists(page))
+
+        note_path = path.join("content", "note", "guides", "setup.md")
+        with open(note_path, 'w', encoding='utf8') as note_file:
+            note_file.write("No frontmatter any more.\n")
+        with redirect_stdout(StringIO()):
+            state = builder.apply_changes(state, {note_path})
+        self.assertFalse(path.exists(page))
+        self.assertNotIn(note_path, state['manifest']['notes'])
+
+        with redirect_stdout(StringIO()):
+            self.deploy()
+        self.assertFalse(path.exists(page))
+
+    def test_moved_away_folder_removes_its_notes(self):
+        state = builder.buildRynz()
+        page = path.join("public", "guides", "setup.html")
+        folder = path.join("content", "note", "guides")
+        rename(folder, "guides")
+        state = builder.apply_changes(state, {folder})
+
+        self.assertFalse(path.exists(page))
+        self.assertNotIn(path.join(folder, "setup.md"), state['manifest']['notes'])
+        self.assertTrue(path.exists(path.join("public", "notepage1.html")))
+
+
+if __name__ == "__main__":
+    unittest.main()
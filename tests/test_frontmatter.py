@@ -0,0 +1,101 @@
+#!/bin/python3
+
+#
+#       ███╗   ██╗██╗██╗  ██╗ █████╗ ██████╗ ███████╗
+#       ████╗  ██║██║██║  ██║██╔══██╗██╔══██╗██╔════╝
+#       ██╔██╗ ██║██║███████║███████║██████╔╝███████╗
+#       ██║╚██╗██║██║██╔══██║██╔══██║██╔══██╗╚════██║
+#       ██║ ╚████║██║██║  ██║██║  ██║██║  ██║███████║
+#       ╚═╝  ╚═══╝╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
+#       DRAFTED BY [https://nih.ar] ON 18-10-2026.
+#       SOURCE [test_frontmatter.py] LAST MODIFIED ON 18-10-2026.
+#
+
+"""
+Tests for the fast frontmatter path behind `fast_frontmatter`.
+"""
+
+from datetime import date
+from random import Random
+import unittest
+from yaml import YAMLError, safe_load
+from rynz.frontmatter import parse_flat
+
+# Pieces of randomised values, biased towards what trips YAML up
+PIECES = [
+    "a", "b", "Z", "_", "-", "1", "0", " ", "\t", ":", "#", "'", '"', "[", "]", ",",
+    "{", "}", "é", "\\", "\x85", "\u2028", "\x07", "\r", "\xa0", "\ufeff", "y", "e",
+    "s", "n", "o", "~", ".", " - ", "2026-10-18", "null", "Yes", "%", "@", "!", "&",
+    "*", "|", ">", "`", "?", "=",
+]
+KEYS = ["title", "tags", "date", "x", "key-1", "on", "Null"]
+
+
+def typed(value):
+    """
+    Pairs every scalar with its type, so True and 1 compare unequal.
+    """
+    if isinstance(value, dict):
+        return {key: typed(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [typed(item) for item in value]
+    return (type(value).__name__, value)
+
+
+def random_block(rng):
+    """
+    Builds a frontmatter block of one to three `key: value` lines.
+    """
+    lines = []
+    for _ in range(rng.randint(1, 3)):
+        value = "".join(rng.choice(PIECES) for _ in range(rng.randint(1, 6)))
+        if rng.random() < 0.3:
+            value = "[" + ", ".join(
+                "".join(rng.choice(PIECES) for _ in range(rng.randint(1, 4)))
+                for _ in range(rng.randint(0, 3))
+            ) + "]"
+        if rng.random() < 0.2:
+            quote = rng.choice("'\"")
+            value = quote + value + quote
+        lines.append(f"{rng.choice(KEYS)}: {value}")
+    return "\n".join(lines) + "\n"
+
+
+class FlatFrontmatterTest(unittest.TestCase):
+    """
+    Whatever the fast path parses must be exactly what YAML parses.
+    """
+
+    def assertSameAsYaml(self, block):
+        fast = parse_flat(block)
+        if fast is None:
+            return False
+        try:
+            slow = safe_load(block)
+        except YAMLError as error:
+            self.fail(f"{block!r} parsed as {fast!r}, YAML raises {error}")
+        self.assertEqual(typed(fast), typed(slow), repr(block))
+        return True
+
+    def test_common_frontmatter(self):
+        block = 'title: "Sample Note"\ndate: 2026-10-18\ntags: [note, generic]\ncount: 3\n'
+        self.assertTrue(self.assertSameAsYaml(block))
+        self.assertEqual(parse_flat(block)['date'], date(2026, 10, 18))
+
+    def test_values_yaml_rejects_or_reads_differently(self):
+        for block in (
+            "title: a\tb\n", "title: a\t\n", "title:\ta\n", "tags: [\ta]\n",
+            "tags: [\xa0a]\n", "title: a\x07\n", "title: 'a\rb'\n", 'title: "a\x85b"\n',
+            "title: Yes \n",
+        ):
+            self.assertIsNone(parse_flat(block), repr(block))
+
+    def test_randomised_values_match_yaml(self):
+        rng = Random(20261018)
+        parsed = sum(self.assertSameAsYaml(random_block(rng)) for _ in range(20000))
+        # The comparison means nothing unless the fast path takes many blocks
+        self.assertGreater(parsed, 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
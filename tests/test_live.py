@@ -0,0 +1,170 @@
+#!/bin/python3
+
+#
+#       ███╗   ██╗██╗██╗  ██╗ █████╗ ██████╗ ███████╗
+#       ████╗  ██║██║██║  ██║██╔══██╗██╔══██╗██╔════╝
+#       ██╔██╗ ██║██║███████║███████║██████╔╝███████╗
+#       ██║╚██╗██║██║██╔══██║██╔══██║██╔══██╗╚════██║
+#       ██║ ╚████║██║██║  ██║██║  ██║██║  ██║███████║
+#       ╚═╝  ╚═══╝╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
+#       DRAFTED BY [https://nih.ar] ON 18-10-2026.
+#       SOURCE [test_live.py] LAST MODIFIED ON 18-10-2026.
+#
+
+"""
+Tests for the live site rendered by `rynz serve --memory`.
+"""
+
+from http.client import HTTPConnection
+from os import path, rename
+from threading import Thread
+import unittest
+from unittest import mock
+from rynz import live, server
+from .test_build import SiteTestCase
+
+
+class LiveSiteTestCase(SiteTestCase):
+    """
+    Serves the test project from memory on a free port.
+    """
+
+    def serve(self):
+        """
+        Starts `rynz serve --memory` for the project.
+
+        Returns:
+            dict: The live site.
+        """
+        quiet = mock.patch.object(server.RynzRequestHandler, "log_message")
+        quiet.start()
+        self.addCleanup(quiet.stop)
+        site = live.load_site(searchable=False)
+        httpd = server.make_server("static", "127.0.0.1", 0, site=site)
+        Thread(target=httpd.serve_forever, daemon=True).start()
+        self.addCleanup(httpd.server_close)
+        self.addCleanup(httpd.shutdown)
+        self.port = httpd.server_address[1]
+        return site
+
+    def get(self, url):
+        """
+        Requests a page from the live server.
+
+        Returns:
+            tuple: (status, body).
+        """
+        connection = HTTPConnection("127.0.0.1", self.port, timeout=5)
+        try:
+            connection.request("GET", url)
+            response = connection.getresponse()
+            return response.status, response.read()
+        finally:
+            connection.close()
+
+
+class HomePageTest(LiveSiteTestCase):
+    """
+    Paginated home pages exist only up to the last page.
+    """
+
+    def test_home_pages_in_and_out_of_range(self):
+        self.configure("posts_per_page: 1\n")
+        self.serve()
+
+        status, body = self.get("/page/2/")
+        self.assertEqual(status, 200)
+        self.assertIn(b"<!DOCTYPE html>", body)
+        self.assertEqual(self.get("/page/3/")[0], 404)
+        self.assertEqual(self.get("/page/99/")[0], 404)
+        self.assertEqual(self.get("/page/1/")[0], 404)
+
+
+class RescanTest(LiveSiteTestCase):
+    """
+    Requests must not rescan the note folder on every lookup.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.site = live.load_site(searchable=False)
+        self.pages = ["index.html", "rss.xml", "missing.html", "tags/note/index.html"]
+
+    def lookups(self):
+        """
+        Looks up the listing pages and an unknown page, counting rescans.
+
+        Returns:
+            int: Calls to discover_notes().
+        """
+        with mock.patch.object(live, "discover_notes", wraps=live.discover_notes) as scan:
+            for _ in range(5):
+                for name in self.pages:
+                    live.site_lookup(self.site, name)
+        return scan.call_count
+
+    def test_lookups_within_the_interval_do_not_rescan(self):
+        self.assertEqual(self.lookups(), 0)
+
+    def test_lookups_rescan_once_per_interval_without_a_watcher(self):
+        self.site['checked'] -= live.RESCAN_INTERVAL
+        self.assertEqual(self.lookups(), 1)
+
+    def test_lookups_never_rescan_with_a_watcher(self):
+        self.site['watched'] = True
+        self.site['checked'] -= live.RESCAN_INTERVAL
+        self.assertEqual(self.lookups(), 0)
+
+    def test_edited_note_is_reloaded_without_a_rescan(self):
+        name = next(iter(self.site['notes']))
+        before = live.site_lookup(self.site, name)
+        note_path = self.site['notes'][name]['path']
+        with open(note_path, 'a', encoding='utf8') as note_file:
+            note_file.write("\nEdited.\n")
+
+        with mock.patch.object(live, "discover_notes") as scan:
+            after = live.site_lookup(self.site, name)
+            scan.assert_not_called()
+        self.assertIsNotNone(after)
+        self.assertNotEqual(after, before)
+        self.assertIn("Edited.", live.site_render(self.site, name))
+
+
+class FolderRemovalTest(LiveSiteTestCase):
+    """
+    A note folder reported as gone must take its notes with it.
+    """
+
+    def test_moved_away_folder_drops_its_notes(self):
+        site = live.load_site()
+        self.assertIn("guides/setup.html", site['notes'])
+        folder = path.join("content", "note", "guides")
+        rename(folder, "guides")
+
+        self.assertTrue(live.update_notes(site, {folder}))
+        self.assertNotIn("guides/setup.html", site['notes'])
+        self.assertIsNone(live.site_lookup(site, "guides/setup.html"))
+
+
+class SearchReloadTest(LiveSiteTestCase):
+    """
+    Searches must reload a changed site in place.
+    """
+
+    def test_changed_config_is_used_by_the_same_search(self):
+        site = live.load_site()
+        site['watched'] = True
+        lock = site['lock']
+        self.assertNotIn("page=2", live.site_search(site, "note"))
+
+        self.configure("search_results: 1\n")
+        site['checked'] -= live.RESCAN_INTERVAL
+        html = live.site_search(site, "note")
+        self.assertIs(site['lock'], lock)
+        self.assertTrue(site['watched'])
+        self.assertEqual(site['config']['search_results'], 1)
+        self.assertIn("page=2", html)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,255 @@
+#!/bin/python3
+
+#
+#       ███╗   ██╗██╗██╗  ██╗ █████╗ ██████╗ ███████╗
+#       ████╗  ██║██║██║  ██║██╔══██╗██╔══██╗██╔════╝
+#       ██╔██╗ ██║██║███████║███████║██████╔╝███████╗
+#       ██║╚██╗██║██║██╔══██║██╔══██║██╔══██╗╚════██║
+#       ██║ ╚████║██║██║  ██║██║  ██║██║  ██║███████║
+#       ╚═╝  ╚═══╝╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
+#       DRAFTED BY [https://nih.ar] ON 18-10-2026.
+#       SOURCE [test_server.py] LAST MODIFIED ON 18-10-2026.
+#
+
+"""
+Tests for the HTTP server behind `rynz serve`.
+"""
+
+from email.utils import formatdate
+from gzip import compress, decompress
+from hashlib import sha256
+from http.client import HTTPConnection
+from os import path, utime
+from tempfile import TemporaryDirectory
+from threading import Thread
+from time import perf_counter
+import unittest
+from unittest import mock
+from rynz import server
+
+
+class ServerTestCase(unittest.TestCase):
+    """
+    Serves a temporary directory holding an index.html on a free port.
+    """
+
+    WORKERS = 2
+
+    def setUp(self):
+        quiet = mock.patch.object(server.RynzRequestHandler, "log_message")
+        quiet.start()
+        self.addCleanup(quiet.stop)
+        self.home = TemporaryDirectory()
+        self.write("index.html", b"<!DOCTYPE html><title>home</title>")
+        self.httpd = server.make_server(self.home.name, "127.0.0.1", 0, workers=self.WORKERS)
+        self.port = self.httpd.server_address[1]
+        self.thread = Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        self.connections = []
+
+    def tearDown(self):
+        for connection in self.connections:
+            connection.close()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.home.cleanup()
+
+    def write(self, name, content, mtime=None):
+        """
+        Writes a file into the served directory.
+
+        Args:
+            name (str): File name.
+            content (bytes): File content.
+            mtime (int): Modification time in seconds, if not now.
+        """
+        filepath = path.join(self.home.name, name)
+        with open(filepath, 'wb') as served_file:
+            served_file.write(content)
+        if mtime is not None:
+            utime(filepath, (mtime, mtime))
+
+    def request(self, url="/", headers=None):
+        """
+        Sends one GET request on a new connection.
+
+        Returns:
+            tuple: (response, body).
+        """
+        connection = HTTPConnection("127.0.0.1", self.port, timeout=5)
+        self.connections.append(connection)
+        connection.request("GET", url, headers=headers or {})
+        response = connection.getresponse()
+        return response, response.read()
+
+    def fetch(self, connection):
+        connection.request("GET", "/")
+        response = connection.getresponse()
+        body = response.read()
+        self.assertEqual(response.status, 200)
+        return body
+
+
+class KeepAliveTest(ServerTestCase):
+    """
+    Idle keep-alive connections must not hold up other clients.
+    """
+
+    def test_idle_connections_do_not_block_new_requests(self):
+        # More idle keep-alive connections than workers, each after a request
+        for _ in range(self.WORKERS * 4):
+            connection = HTTPConnection("127.0.0.1", self.port, timeout=5)
+            self.fetch(connection)
+            self.connections.append(connection)
+
+        start = perf_counter()
+        connection = HTTPConnection("127.0.0.1", self.port, timeout=5)
+        self.connections.append(connection)
+        self.assertIn(b"<title>home</title>", self.fetch(connection))
+        self.assertLess(perf_counter() - start, 1)
+
+        # The idle connections are still usable
+        self.assertIn(b"<title>home</title>", self.fetch(self.connections[0]))
+
+    def test_connections_over_the_cap_get_503(self):
+        self.httpd.connections = server.BoundedSemaphore(1)
+        first = HTTPConnection("127.0.0.1", self.port, timeout=5)
+        self.connections.append(first)
+        self.fetch(first)
+
+        second = HTTPConnection("127.0.0.1", self.port, timeout=5)
+        self.connections.append(second)
+        second.request("GET", "/")
+        self.assertEqual(second.getresponse().status, 503)
+
+
+class ConditionalTest(ServerTestCase):
+    """
+    Responses carry strong, content-based ETags and answer conditional
+    requests with 304.
+    """
+
+    def test_etag_is_strong_and_follows_content(self):
+        response, body = self.request()
+        etag = response.getheader("ETag")
+        self.assertEqual(etag, f'"{sha256(body).hexdigest()[:32]}"')
+        self.assertEqual(self.request()[0].getheader("ETag"), etag)
+
+        self.write("index.html", b"<!DOCTYPE html><title>changed</title>")
+        self.assertNotEqual(self.request()[0].getheader("ETag"), etag)
+
+    def test_if_none_match(self):
+        etag = self.request()[0].getheader("ETag")
+        response, body = self.request(headers={"If-None-Match": etag})
+        self.assertEqual(response.status, 304)
+        self.assertEqual(body, b"")
+        self.assertEqual(response.getheader("ETag"), etag)
+        self.assertEqual(self.request(headers={"If-None-Match": f'"other", {etag}'})[0].status, 304)
+        self.assertEqual(self.request(headers={"If-None-Match": '"other"'})[0].status, 200)
+
+    def test_if_modified_since(self):
+        self.write("index.html", b"<!DOCTYPE html><title>home</title>", mtime=1_700_000_000)
+        last_modified = self.request()[0].getheader("Last-Modified")
+        self.assertEqual(last_modified, formatdate(1_700_000_000, usegmt=True))
+        self.assertEqual(self.request(headers={"If-Modified-Since": last_modified})[0].status, 304)
+        older = formatdate(1_600_000_000, usegmt=True)
+        self.assertEqual(self.request(headers={"If-Modified-Since": older})[0].status, 200)
+
+    def test_if_none_match_takes_precedence(self):
+        last_modified = self.request()[0].getheader("Last-Modified")
+        response, _body = self.request(headers={
+            "If-None-Match": '"other"', "If-Modified-Since": last_modified
+        })
+        self.assertEqual(response.status, 200)
+
+
+    def test_served_files_are_cached_and_revalidated(self):
+        hits = []
+        lookup = server.FileCache.get
+
+        def spy(cache, filepath, signature):
+            entry = lookup(cache, filepath, signature)
+            hits.append(entry is not None)
+            return entry
+
+        with mock.patch.object(server.FileCache, "get", spy):
+            self.request()
+            self.request()
+            self.write("index.html", b"<!DOCTYPE html><title>rebuilt</title>")
+            self.assertIn(b"rebuilt", self.request()[1])
+        self.assertEqual(hits, [False, True, False])
+
+class FileCacheTest(unittest.TestCase):
+    """
+    The file cache stays within its byte budget and drops stale entries.
+    """
+
+    def test_entries_follow_the_file_signature(self):
+        cache = server.FileCache(max_bytes=100, max_file=50)
+        cache.put("/a", (1, 3), b"abc", '"a"')
+        self.assertEqual(cache.get("/a", (1, 3)), (b"abc", '"a"'))
+        self.assertIsNone(cache.get("/a", (2, 3)))
+        self.assertIsNone(cache.get("/b", (1, 3)))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = server.FileCache(max_bytes=100, max_file=50)
+        for name in ("/a", "/b", "/c"):
+            cache.put(name, (1, 40), b"x" * 40, '"x"')
+        self.assertIsNone(cache.get("/a", (1, 40)))
+        self.assertIsNotNone(cache.get("/b", (1, 40)))
+        self.assertLessEqual(cache.size, 100)
+
+        # /b was used last, so /c goes first
+        cache.put("/d", (1, 40), b"x" * 40, '"x"')
+        self.assertIsNotNone(cache.get("/b", (1, 40)))
+        self.assertIsNone(cache.get("/c", (1, 40)))
+
+    def test_files_over_the_limit_are_not_cached(self):
+        cache = server.FileCache(max_bytes=100, max_file=50)
+        cache.put("/big", (1, 60), b"x" * 60, '"x"')
+        self.assertIsNone(cache.get("/big", (1, 60)))
+        self.assertEqual(cache.size, 0)
+
+class GzipTest(ServerTestCase):
+    """
+    Precompressed siblings are served to clients accepting gzip.
+    """
+
+    CSS = b"body { color: #123456; }\n" * 20
+
+    def setUp(self):
+        super().setUp()
+        self.write("site.css", self.CSS, mtime=1_700_000_000)
+        self.write("site.css.gz", compress(self.CSS), mtime=1_700_000_000)
+
+    def test_gzip_is_served_when_accepted(self):
+        response, body = self.request("/site.css", {"Accept-Encoding": "br, gzip"})
+        self.assertEqual(response.getheader("Content-Encoding"), "gzip")
+        self.assertEqual(response.getheader("Vary"), "Accept-Encoding")
+        self.assertEqual(decompress(body), self.CSS)
+
+    def test_plain_file_is_served_otherwise(self):
+        for headers in ({}, {"Accept-Encoding": "gzip;q=0"}, {"Accept-Encoding": "br"}):
+            response, body = self.request("/site.css", headers)
+            self.assertIsNone(response.getheader("Content-Encoding"), headers)
+            self.assertEqual(response.getheader("Vary"), "Accept-Encoding")
+            self.assertEqual(body, self.CSS)
+
+    def test_variants_have_their_own_etags(self):
+        plain = self.request("/site.css")[0].getheader("ETag")
+        gzipped = self.request("/site.css", {"Accept-Encoding": "gzip"})[0].getheader("ETag")
+        self.assertNotEqual(plain, gzipped)
+        response, _body = self.request(
+            "/site.css", {"Accept-Encoding": "gzip", "If-None-Match": gzipped}
+        )
+        self.assertEqual(response.status, 304)
+
+    def test_older_gzip_is_ignored(self):
+        self.write("site.css", b"body { color: #654321; }\n", mtime=1_800_000_000)
+        response, body = self.request("/site.css", {"Accept-Encoding": "gzip"})
+        self.assertIsNone(response.getheader("Content-Encoding"))
+        self.assertEqual(body, b"body { color: #654321; }\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
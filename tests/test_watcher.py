@@ -0,0 +1,73 @@
+#!/bin/python3
+
+#
+#       ███╗   ██╗██╗██╗  ██╗ █████╗ ██████╗ ███████╗
+#       ████╗  ██║██║██║  ██║██╔══██╗██╔══██╗██╔════╝
+#       ██╔██╗ ██║██║███████║███████║██████╔╝███████╗
+#       ██║╚██╗██║██║██╔══██║██╔══██║██╔══██╗╚════██║
+#       ██║ ╚████║██║██║  ██║██║  ██║██║  ██║███████║
+#       ╚═╝  ╚═══╝╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
+#       DRAFTED BY [https://nih.ar] ON 18-10-2026.
+#       SOURCE [test_watcher.py] LAST MODIFIED ON 18-10-2026.
+#
+
+"""
+Tests for the file watcher behind `rynz serve --watch`.
+"""
+
+from os import makedirs, path, rename
+from tempfile import TemporaryDirectory
+import unittest
+from rynz import watcher
+
+
+class InotifyTest(unittest.TestCase):
+    """
+    Folders leaving the watched tree must be reported.
+    """
+
+    def setUp(self):
+        libc = watcher.load_inotify()
+        if libc is None:
+            self.skipTest("inotify is not available")
+        self.workdir = TemporaryDirectory()
+        self.addCleanup(self.workdir.cleanup)
+        self.root = path.join(self.workdir.name, "note")
+        self.folder = path.join(self.root, "sub")
+        makedirs(self.folder)
+        with open(path.join(self.folder, "page.md"), 'w', encoding='utf8') as note_file:
+            note_file.write("---\ntitle: page\n---\n")
+        self.read_changes, close_reader = watcher.inotify_reader(libc, [self.root], [])
+        self.addCleanup(close_reader)
+
+    def collect(self):
+        """
+        Returns every change reported until the events stop.
+        """
+        changed = set()
+        while True:
+            more = self.read_changes(0.2)
+            if not more:
+                return changed
+            changed |= more
+
+    def test_folder_moved_out_is_reported(self):
+        rename(self.folder, path.join(self.workdir.name, "elsewhere"))
+        self.assertEqual(self.collect(), {self.folder})
+
+        # Its old watch is gone, so edits outside the tree stay quiet
+        moved = path.join(self.workdir.name, "elsewhere", "page.md")
+        with open(moved, 'a', encoding='utf8') as note_file:
+            note_file.write("Edited.\n")
+        self.assertEqual(self.collect(), set())
+
+    def test_folder_moved_back_reports_its_files(self):
+        elsewhere = path.join(self.workdir.name, "elsewhere")
+        rename(self.folder, elsewhere)
+        self.collect()
+        rename(elsewhere, self.folder)
+        self.assertEqual(self.collect(), {path.join(self.folder, "page.md")})
+
+
+if __name__ == "__main__":
+    unittest.main()